@@ -2,7 +2,7 @@
 """
 extract_k_systems.py
 
-Search for files related to "K Systems" work and package them into a timestamped tar.gz archive,
+Search for files related to "K Systems" work and package them into a timestamped tar archive (tar.gz by default),
 with a manifest and SHA-256 checksum.
 
 Usage:
@@ -10,7 +10,8 @@ Usage:
 
 Notes:
  - By default searches common user folders and skips OS/system directories.
- - The script is non-destructive: it only reads and copies files to a staging directory.
+ - The script is non-destructive: it only reads files and streams them into the archive
+   (or copies them to a staging directory first with --staging).
  - Review EXCLUDE_DIRS and KEYWORDS below before running.
 """
 
@@ -24,6 +25,17 @@ import time
 import stat
 from pathlib import Path
 import json
+from collections import deque
+import queue
+import threading
+import io
+import mmap
+import sqlite3
+import zlib
+import lzma
+import bz2
+import codecs
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 # -----------------------
 # CONFIGURE THESE
@@ -58,6 +70,47 @@ EXCLUDE_DIRS = {
 # Maximum file size to copy (bytes) - set to None for unlimited (careful).
 MAX_FILE_SIZE = 5 * 1024 * 1024 * 1024  # 5 GiB default cap per file
 
+# Copy pipeline: copier threads and the number of matched files that may wait for them
+COPY_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+QUEUE_DEPTH = 256
+COPY_BUFFER = 1024 * 1024
+# Index of archived files (path, size, mtime, hash) kept in the output folder for incremental runs
+INDEX_NAME = "EXTRACTION_INDEX.sqlite"
+# Journal of a staging run in the output folder, removed when the run completes (see --resume)
+JOURNAL_NAME = "EXTRACTION_JOURNAL.jsonl"
+
+# Files at least this large are hashed and content-searched through mmap instead of buffered reads
+# (kept well below CONTENT_MAX_SIZE so the content search uses it)
+MMAP_THRESHOLD = 8 * 1024 * 1024
+
+# Archive compression: codec -> (archive suffix, default level, level used for already-compressed files)
+COMPRESSION = {
+    "none": (".tar", None, None),
+    "gzip": (".tar.gz", 9, 0),
+    "xz": (".tar.xz", 6, 0),
+    "bz2": (".tar.bz2", 9, 1),
+}
+# Valid --compress-level range per codec
+COMPRESS_LEVELS = {"gzip": (0, 9), "xz": (0, 9), "bz2": (1, 9)}
+# Content search (--content-search): text-like extensions scanned for keywords, size cap, read size
+CONTENT_EXTS = [
+    ".txt", ".md", ".rst", ".tex", ".py", ".ipynb", ".json", ".yml", ".yaml", ".toml", ".cfg", ".ini",
+    ".csv", ".tsv", ".log", ".xml", ".html", ".htm", ".js", ".ts", ".c", ".h", ".cpp", ".hpp",
+    ".java", ".go", ".rs", ".sh", ".sql"
+]
+CONTENT_MAX_SIZE = 64 * 1024 * 1024
+CONTENT_CHUNK = 4 * 1024 * 1024
+# Files per task sent to a content-search process
+CONTENT_BATCH = 32
+
+# Input bytes per independently compressed member with --compress-threads > 1
+COMPRESS_BLOCK = 4 * 1024 * 1024
+# Extensions whose content is already compressed (see --no-recompress)
+COMPRESSED_EXTS = {
+    ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".rar", ".zst", ".pdf", ".docx", ".xlsx", ".pptx",
+    ".jpg", ".jpeg", ".png", ".gif", ".mp3", ".mp4", ".mkv", ".mov", ".webm", ".whl", ".jar",
+}
+
 # -----------------------
 # Helper functions
 # -----------------------
@@ -69,143 +122,1166 @@ def user_confirm(prompt: str) -> bool:
         print("\nAborted by user.")
         sys.exit(1)
 
-def compute_sha256(path: Path) -> str:
+def compute_sha256(path: Path, size=None) -> str:
     h = hashlib.sha256()
     with path.open("rb") as f:
+        if size is None:
+            size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            # hash straight from the page cache, in slices so the GIL is released per slice
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                view = memoryview(m)
+                try:
+                    for pos in range(0, len(m), COPY_BUFFER * 8):
+                        h.update(view[pos:pos + COPY_BUFFER * 8])
+                finally:
+                    view.release()
+            return h.hexdigest()
+        buf = bytearray(COPY_BUFFER)
+        view = memoryview(buf)
         while True:
-            chunk = f.read(8192)
-            if not chunk:
+            n = f.readinto(buf)
+            if not n:
                 break
-            h.update(chunk)
+            h.update(view[:n])
     return h.hexdigest()
 
-def should_exclude_path(path: Path, exclude_dirs):
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over the lowercased keywords.
+
+    Built once per run; a scan visits each character of the text once,
+    whatever the number of keywords, and reports every keyword that occurs
+    (including overlapping ones such as "k-sys" inside "k-sys-gums").
+    """
+
+    def __init__(self, keywords):
+        # keep the first spelling of each case-insensitive keyword
+        self.keywords = []
+        seen = set()
+        for kw in keywords:
+            key = kw.lower()
+            if key and key not in seen:
+                seen.add(key)
+                self.keywords.append(kw)
+
+        goto = [{}]
+        out = [set()]
+        for i, kw in enumerate(self.keywords):
+            state = 0
+            for ch in kw.lower():
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append(set())
+                state = nxt
+            out[state].add(i)
+
+        # breadth-first: failure links, then complete transitions (missing entries mean state 0)
+        fail = [0] * len(goto)
+        delta = [dict(goto[0])] + [None] * (len(goto) - 1)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            out[state] |= out[fail[state]]
+            delta[state] = dict(delta[fail[state]])
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(ch, 0) if state else 0
+                delta[state][ch] = nxt
+                queue.append(nxt)
+        self._delta = delta
+        self._out = [frozenset(o) for o in out]
+
+    def scan(self, text: str, state: int = 0):
+        """Feed lowercased `text` from `state`; return (end state, set of keyword indices)."""
+        delta = self._delta
+        out = self._out
+        found = set()
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            if out[state]:
+                found |= out[state]
+        return state, found
+
+    def names(self, indices):
+        return [self.keywords[i] for i in sorted(indices)]
+
+def exclude_prefixes(exclude_dirs):
+    # normalized once per run; a directory is excluded if it or one of its ancestors is listed
+    return {os.path.normcase(os.path.normpath(str(ex))) for ex in exclude_dirs}
+
+def is_excluded(path: str, prefixes) -> bool:
+    path = os.path.normcase(path)
+    while True:
+        if path in prefixes:
+            return True
+        parent = os.path.dirname(path)
+        if parent == path:
+            return False
+        path = parent
+
+def iter_files(target_dir: Path, exclude_dirs, follow_symlinks=False, skip_files_in=()):
+    """
+    Yield (directory path, DirEntry, stat result) for every regular file below target_dir.
+
+    Uses os.scandir so file type checks come from the directory listing and each
+    file is stat'ed once. Excluded directories are pruned before they are opened.
+    Symlinks: links to files are reported with the stat of their target; links to
+    directories are only descended into with follow_symlinks (each directory is
+    visited once, so link cycles terminate); broken links and special files are skipped.
+    Directories in skip_files_in are still descended into, but their files are not reported.
+    """
+    prefixes = exclude_prefixes(exclude_dirs)
+    top = os.path.normpath(str(target_dir))
+    # matches the old string-prefix check: below an excluded dir only top-level files are taken
+    descend = not is_excluded(top, prefixes)
+    visited = set()
+    if follow_symlinks:
+        st = os.stat(top)
+        visited.add((st.st_dev, st.st_ino))
+    stack = [top]
+    while stack:
+        dirpath = stack.pop()
+        try:
+            it = os.scandir(dirpath)
+        except OSError as e:
+            print(f"[!] Cannot list {dirpath}: {e}")
+            continue
+        subdirs = []
+        want_files = dirpath not in skip_files_in
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if descend and os.path.normcase(entry.path) not in prefixes:
+                            if follow_symlinks:
+                                # may already have been reached through a link listed earlier
+                                st = entry.stat(follow_symlinks=False)
+                                key = (st.st_dev, st.st_ino)
+                                if key in visited:
+                                    continue
+                                visited.add(key)
+                            subdirs.append(entry.path)
+                        continue
+                    if entry.is_symlink() and entry.is_dir():
+                        if follow_symlinks and descend and os.path.normcase(entry.path) not in prefixes:
+                            st = entry.stat()
+                            key = (st.st_dev, st.st_ino)
+                            if key not in visited:
+                                visited.add(key)
+                                subdirs.append(entry.path)
+                        continue
+                    if not want_files or not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+                yield dirpath, entry, st
+        # depth-first, in listing order
+        stack.extend(reversed(subdirs))
+
+_content_matcher = None
+
+def _init_content_search(keywords):
+    global _content_matcher
+    _content_matcher = KeywordMatcher(keywords)
+
+def _chunks(f, size):
+    # mmap big files; read smaller ones
+    if size >= MMAP_THRESHOLD:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            for pos in range(0, len(m), CONTENT_CHUNK):
+                yield m[pos:pos + CONTENT_CHUNK]
+        return
+    while True:
+        chunk = f.read(CONTENT_CHUNK)
+        if not chunk:
+            return
+        yield chunk
+
+def search_content(path, size):
+    """Indices of the keywords (set by _init_content_search) occurring in a file, case-insensitively."""
+    matcher = _content_matcher
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    state = 0
+    found = set()
+    with open(path, "rb") as f:
+        for chunk in _chunks(f, size):
+            # the automaton state and the decoder carry partial keywords and split characters across chunks
+            state, hits = matcher.scan(decoder.decode(chunk).lower(), state)
+            found |= hits
+            if len(found) == len(matcher.keywords):
+                break
+    return sorted(found)
+
+def search_content_batch(batch):
+    results = []
+    for path, size in batch:
+        try:
+            results.append(search_content(path, size))
+        except (OSError, ValueError):
+            results.append([])
+    return results
+
+def _clear_staged(dst: Path):
+    # a leftover copy may be a hard link shared with another staged file: unlink, never overwrite
     try:
-        # Normalize, compare top-level
-        for ex in exclude_dirs:
-            if str(path).startswith(str(ex)):
-                return True
-    except Exception:
+        dst.unlink()
+    except FileNotFoundError:
         pass
-    return False
 
-def copy_with_metadata(src: Path, dst: Path):
+def copy_with_metadata(src: Path, dst: Path, st=None) -> str:
+    """Copy src to dst, hashing the bytes as they are copied; return their SHA-256."""
     dst.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src, dst)  # copies metadata (mtime, atime, mode bits)
-    try:
+    if st is None:
         st = src.stat()
-        # preserve executable bit if set
-        if st.st_mode & stat.S_IXUSR:
-            dst.chmod(dst.stat().st_mode | stat.S_IXUSR)
-    except Exception:
+    _clear_staged(dst)
+    h = hashlib.sha256()
+    buf = bytearray(COPY_BUFFER)
+    view = memoryview(buf)
+    with src.open("rb") as fin, dst.open("wb") as fout:
+        while True:
+            n = fin.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
+            fout.write(view[:n])
+    # mode bits (incl. executable) and timestamps from the stat taken during the scan
+    try:
+        os.chmod(dst, stat.S_IMODE(st.st_mode))
+        os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    except OSError:
         pass
+    return h.hexdigest()
+
+def link_staged(original: Path, dst: Path, st=None):
+    # hard link to the first staged copy; tar.add then stores it as a link member
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    _clear_staged(dst)
+    try:
+        os.link(original, dst)
+    except OSError:
+        shutil.copy2(original, dst)
+
+class ContentStore:
+    """
+    Content-addressed front end for the copy pipeline.
+
+    The first file of each size is stored straight away with
+    store(src, dst, st), which hashes the bytes as it writes them and returns
+    the digest, so a file with a unique size is read once. A file whose size
+    has been seen before is hashed up front on the calling worker thread (in
+    parallel); the first file with each digest is stored, later ones are
+    linked with link(first_dst, dst, st). Files wait for the first file of
+    their size, and duplicates for the first copy of their content, to be
+    written before they are compared.
+    """
+
+    def __init__(self, store, link):
+        self.store = store
+        self.link = link
+        self.duplicates = 0
+        self.duplicate_bytes = 0
+        self._first = {}
+        self._pending = {}
+        self._sizes = {}
+        self._lock = threading.Lock()
+
+    def seed(self, digest, dst, size):
+        """Register a copy stored by an earlier (resumed) run."""
+        with self._lock:
+            if size not in self._sizes:
+                self._sizes[size] = threading.Event()
+                self._sizes[size].set()
+            if digest not in self._first:
+                done = self._pending[digest] = threading.Event()
+                done.set()
+                self._first[digest] = dst
+
+    def put(self, src: Path, dst, st):
+        """Store or link src at dst; return the manifest fields for it."""
+        with self._lock:
+            sized = self._sizes.get(st.st_size)
+            if sized is None:
+                sized = self._sizes[st.st_size] = threading.Event()
+                first_of_size = True
+            else:
+                first_of_size = False
+        if first_of_size:
+            try:
+                digest = self.store(src, dst, st)
+                with self._lock:
+                    if digest not in self._pending:
+                        self._pending[digest] = sized
+                        self._first[digest] = dst
+            finally:
+                sized.set()
+            return {"sha256": digest}
+
+        digest = compute_sha256(src, st.st_size)
+        sized.wait()
+        with self._lock:
+            done = self._pending.get(digest)
+            owner = done is None
+            if owner:
+                done = self._pending[digest] = threading.Event()
+        if owner:
+            try:
+                digest = self.store(src, dst, st)
+                self._first[digest] = dst
+            finally:
+                done.set()
+            return {"sha256": digest}
+        done.wait()
+        original = self._first.get(digest)
+        if original is None:
+            # the first copy failed; store this one on its own
+            return {"sha256": self.store(src, dst, st)}
+        self.link(original, dst, st)
+        with self._lock:
+            self.duplicates += 1
+            self.duplicate_bytes += st.st_size
+        return {"sha256": digest, "duplicate_of": str(original)}
+
+class Progress:
+    """Thread-safe counters for completed copies, printed as files/s and MB/s."""
+
+    def __init__(self, interval=2.0):
+        self.interval = interval
+        self.files = 0
+        self.bytes = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self._last = self._start
+
+    def add(self, nbytes, error=False):
+        with self._lock:
+            self.files += 1
+            self.bytes += nbytes
+            self.errors += error
+            now = time.perf_counter()
+            if now - self._last >= self.interval:
+                self._last = now
+                print("[+] " + self._line(now))
+
+    def _line(self, now):
+        elapsed = max(now - self._start, 1e-9)
+        return (f"Processed {self.files} files, {self.bytes / 1e6:.1f} MB "
+                f"({self.files / elapsed:.1f} files/s, {self.bytes / 1e6 / elapsed:.1f} MB/s, "
+                f"{self.errors} errors)")
+
+    def summary(self):
+        with self._lock:
+            return self._line(time.perf_counter())
+
+class CopyPipeline:
+    """
+    Copier threads fed through a bounded queue.
+
+    The directory walk stays on the calling thread and blocks in submit() when
+    `queue_depth` files are waiting, so memory stays bounded however fast the
+    walk is. Each worker runs handler(src, dst, st), which copies or archives a
+    file and returns manifest fields for it (or raises, recorded as "error"),
+    then passes the completed entry to on_done.
+    """
+
+    def __init__(self, handler, workers=COPY_WORKERS, queue_depth=QUEUE_DEPTH, on_done=None):
+        self.handler = handler
+        self.on_done = on_done
+        self.workers = max(1, workers)
+        self.progress = Progress()
+        self._queue = queue.Queue(maxsize=max(1, queue_depth))
+        self._threads = [threading.Thread(target=self._run, daemon=True) for _ in range(self.workers)]
+        for t in self._threads:
+            t.start()
+
+    def submit(self, src: Path, dst: Path, st, manifest_entry):
+        self._queue.put((src, dst, st, manifest_entry))
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            src, dst, st, manifest_entry = job
+            try:
+                manifest_entry.update(self.handler(src, dst, st))
+                self.progress.add(st.st_size)
+            except Exception as e:
+                manifest_entry["error"] = str(e)
+                print(f"[!] Failed copying {src}: {e}")
+                self.progress.add(0, error=True)
+            if self.on_done is not None:
+                self.on_done(manifest_entry)
+
+    def close(self):
+        """Wait for queued copies to finish and stop the workers."""
+        for _ in self._threads:
+            self._queue.put(None)
+        for t in self._threads:
+            t.join()
+        print("[+] " + self.progress.summary())
+
+class HashingWriter:
+    """Write-only file wrapper that hashes everything written through it."""
+
+    def __init__(self, f):
+        self._f = f
+        self._h = hashlib.sha256()
+
+    def write(self, data):
+        self._h.update(data)
+        return self._f.write(data)
+
+    def flush(self):
+        self._f.flush()
+
+    def hexdigest(self):
+        return self._h.hexdigest()
+
+def _compressor(codec, level):
+    if codec == "gzip":
+        return zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits 31: gzip header and trailer
+    if codec == "xz":
+        return lzma.LZMACompressor(preset=level)
+    return bz2.BZ2Compressor(level)
+
+def _compress_member(codec, level, data):
+    c = _compressor(codec, level)
+    return c.compress(data) + c.flush()
+
+class CompressedWriter:
+    """
+    Compress a byte stream into `out` as a sequence of independent members.
+
+    Concatenated gzip members, xz streams and bz2 streams each decompress as
+    one stream (gzip -d, xz -d, bunzip2 and tarfile all accept them), which allows:
+      - switching level mid-archive (set_stored), by ending the current member;
+      - threads > 1: input is cut into COMPRESS_BLOCK blocks compressed as separate
+        members on a thread pool (zlib, lzma and bz2 release the GIL) and
+        written in order, at a small cost in ratio.
+    """
+
+    def __init__(self, out, codec, level, threads=1):
+        self._out = out
+        self._codec = codec
+        self._level = self._default = level
+        self._stored = COMPRESSION[codec][2]
+        self._threads = threads
+        if threads > 1:
+            self._pool = ThreadPoolExecutor(max_workers=threads)
+            self._pending = deque()
+            self._buf = bytearray()
+        else:
+            self._comp = _compressor(codec, level)
+
+    def set_stored(self, stored: bool):
+        """Use the codec's cheapest level (stored blocks for gzip) for the following data."""
+        level = self._stored if stored else self._default
+        if level == self._level:
+            return
+        if self._threads > 1:
+            self._submit()
+        else:
+            self._out.write(self._comp.flush())
+            self._comp = _compressor(self._codec, level)
+        self._level = level
+
+    def _submit(self):
+        if self._buf:
+            self._pending.append(self._pool.submit(_compress_member, self._codec, self._level, bytes(self._buf)))
+            self._buf.clear()
+        # bounded look-ahead: keep at most 2 blocks per thread in flight
+        while len(self._pending) > 2 * self._threads:
+            self._out.write(self._pending.popleft().result())
+
+    def write(self, data):
+        if self._threads > 1:
+            self._buf += data
+            if len(self._buf) >= COMPRESS_BLOCK:
+                self._submit()
+        else:
+            self._out.write(self._comp.compress(data))
+        return len(data)
+
+    def close(self):
+        if self._threads > 1:
+            self._submit()
+            while self._pending:
+                self._out.write(self._pending.popleft().result())
+            self._pool.shutdown()
+        else:
+            self._out.write(self._comp.flush())
+
+class _MemberReader:
+    """Reader returning exactly `size` bytes of f, hashed as they are read: zero padding past an early end of file."""
+
+    def __init__(self, f, size):
+        self._f = f
+        self._left = size
+        self._h = hashlib.sha256()
+        self.missing = 0
+
+    def read(self, n=-1):
+        if n < 0 or n > self._left:
+            n = self._left
+        data = self._f.read(n) if not self.missing else b""
+        if len(data) < n:
+            # the file shrank since its stat: everything still owed is padding
+            self.missing += n - len(data)
+            data += bytes(n - len(data))
+        self._left -= n
+        self._h.update(data)
+        return data
+
+    def hexdigest(self):
+        return self._h.hexdigest()
+
+class ArchiveWriter:
+    """
+    Tar archive written as a stream, with its SHA-256 computed while writing.
+
+    Members are appended with add_file (metadata from a stat of the open file),
+    add_link (hard link to an earlier member), add_bytes or add_path; appends
+    from several threads are serialized. With a codec other than "none" the
+    tar stream goes through a CompressedWriter; members whose extension is in
+    `stored_exts` are written at the codec's cheapest level.
+    """
+
+    def __init__(self, path: Path, compression="gzip", level=None, threads=1, stored_exts=()):
+        self.path = path
+        self._f = path.open("wb")
+        self._out = HashingWriter(self._f)
+        self._codec = None
+        if compression != "none":
+            if level is None:
+                level = COMPRESSION[compression][1]
+            self._codec = CompressedWriter(self._out, compression, level, max(1, threads))
+        self._stored_exts = set(stored_exts) if self._codec is not None else set()
+        self._tar = tarfile.open(fileobj=self._codec or self._out, mode="w|", format=tarfile.PAX_FORMAT)
+        self._lock = threading.Lock()
+
+    def _select_level(self, name):
+        if self._stored_exts:
+            self._codec.set_stored(os.path.splitext(name)[1].lower() in self._stored_exts)
+
+    @staticmethod
+    def _info(arcname, st):
+        info = tarfile.TarInfo(arcname)
+        info.mtime = st.st_mtime
+        info.mode = stat.S_IMODE(st.st_mode)
+        info.uid, info.gid = st.st_uid, st.st_gid
+        return info
+
+    def add_file(self, src: Path, arcname: str, st=None) -> str:
+        """
+        Append src as a regular file; return the SHA-256 of the member's content.
+
+        The member size comes from a stat of the open file taken just before it
+        is written (the scan's stat may be stale), and exactly that many bytes
+        are copied. A file that grows is cut at that size; a file that shrinks
+        is zero-padded so the stream stays valid, and OSError is raised after
+        the member is written.
+        """
+        with src.open("rb") as f, self._lock:
+            st = os.fstat(f.fileno())
+            info = self._info(arcname, st)
+            info.size = st.st_size
+            reader = _MemberReader(f, st.st_size)
+            self._select_level(arcname)
+            self._tar.addfile(info, reader)
+        if reader.missing:
+            raise OSError(f"{src} shrank by {reader.missing} bytes while being archived; member zero-padded")
+        return reader.hexdigest()
+
+    def add_link(self, target: str, arcname: str, st):
+        """Append arcname as a hard link to the earlier member `target`."""
+        info = self._info(arcname, st)
+        info.type = tarfile.LNKTYPE
+        info.linkname = target
+        with self._lock:
+            self._tar.addfile(info)
+
+    def add_bytes(self, arcname: str, data: bytes):
+        info = tarfile.TarInfo(arcname)
+        info.size = len(data)
+        info.mtime = time.time()
+        info.mode = 0o644
+        with self._lock:
+            self._select_level(arcname)
+            self._tar.addfile(info, io.BytesIO(data))
+
+    def add_path(self, path: Path, arcname: str):
+        """Append a file or directory tree (in sorted order, like tarfile.add)."""
+        with self._lock:
+            self._add_tree(path, arcname)
+
+    def _add_tree(self, path: Path, arcname: str):
+        self._select_level(arcname)
+        self._tar.add(path, arcname=arcname, recursive=False)
+        if path.is_dir() and not path.is_symlink():
+            for child in sorted(path.iterdir()):
+                self._add_tree(child, f"{arcname}/{child.name}")
+
+    def close(self) -> str:
+        """Finish the archive; return its SHA-256."""
+        self._tar.close()
+        if self._codec is not None:
+            self._codec.close()
+        self._f.close()
+        return self._out.hexdigest()
+
+class ManifestWriter:
+    """
+    Append-only JSON Lines manifest: one "header" record, then "file" and
+    "deleted" records as they are produced, then one "summary" record.
+
+    Each record is flushed as it is written, so an interrupted or crashed run
+    leaves every completed entry on disk; memory use does not grow with the
+    number of files. Safe to call from several threads.
+    """
+
+    def __init__(self, path: Path, header):
+        self.path = path
+        self._f = path.open("w", encoding="utf-8")
+        self._lock = threading.Lock()
+        self.write("header", header)
+
+    def write(self, kind, record):
+        line = json.dumps({"type": kind, **record}, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._f.write(line)
+            self._f.flush()
+
+    def close(self, summary):
+        self.write("summary", summary)
+        self._f.close()
+
+def read_manifest(path: Path):
+    """Yield manifest records one at a time; a truncated last line (crashed run) is skipped."""
+    with Path(path).open("r", encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                break
+            yield json.loads(line)
+
+def summarize_manifest(path: Path):
+    """
+    Aggregate a manifest in one streaming pass.
+
+    A run is complete only if its summary record is present and not marked
+    interrupted; a manifest without a summary (crashed run) counts as interrupted.
+    """
+    totals = {
+        "files": 0, "bytes": 0, "errors": 0, "duplicates": 0, "duplicate_bytes": 0,
+        "matched_by_content": 0, "deleted": 0, "complete": False, "interrupted": True, "header": None,
+    }
+    for record in read_manifest(path):
+        kind = record.get("type")
+        if kind == "file":
+            totals["files"] += 1
+            totals["bytes"] += record.get("size_bytes", 0)
+            totals["errors"] += "error" in record
+            if "duplicate_of" in record:
+                totals["duplicates"] += 1
+                totals["duplicate_bytes"] += record.get("size_bytes", 0)
+            totals["matched_by_content"] += record.get("matched_by") == "content"
+        elif kind == "deleted":
+            totals["deleted"] += 1
+        elif kind == "header":
+            totals["header"] = record
+        elif kind == "summary":
+            totals["interrupted"] = bool(record.get("interrupted"))
+            totals["complete"] = not totals["interrupted"]
+    return totals
+
+class RunJournal:
+    """
+    Journal of a staging run, so an interrupted run can be resumed.
+
+    JSON Lines, flushed per record: "start" (target, keywords and the settings
+    that decide which files are stored, all of which a resume must repeat), "file"
+    (manifest entry of a staged file, written once its copy is complete),
+    "unchanged" (a file skipped by an incremental run) and "dir" (every matched
+    file directly in this directory is accounted for: the walk position).
+    A directory is recorded once the walk has left it and none of its files
+    is still being searched or copied.
+    """
+
+    def __init__(self, path: Path, start, resume=False):
+        self.path = path
+        self.files = []
+        self.unchanged = []
+        self.dirs = set()
+        if resume:
+            for record in read_manifest(path):
+                kind = record["type"]
+                if kind == "start":
+                    differing = [k for k in start if record.get(k) != start[k]]
+                    if differing:
+                        raise ValueError(f"journal was written with a different {', '.join(differing)}")
+                if kind == "file":
+                    self.files.append(record)
+                elif kind == "unchanged":
+                    self.unchanged.append(record["source_path"])
+                elif kind == "dir":
+                    self.dirs.add(record["path"])
+        self._f = path.open("a" if resume else "w", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._left = set()
+        if not resume:
+            self._write("start", start)
+
+    def _write(self, kind, record):
+        self._f.write(json.dumps({"type": kind, **record}, ensure_ascii=False) + "\n")
+        self._f.flush()
+
+    def write(self, kind, record):
+        with self._lock:
+            self._write(kind, record)
+
+    def hold(self, dirpath):
+        """A file of dirpath is being searched or copied."""
+        with self._lock:
+            self._pending[dirpath] = self._pending.get(dirpath, 0) + 1
+
+    def release(self, dirpath):
+        with self._lock:
+            self._pending[dirpath] -= 1
+            self._settle(dirpath)
+
+    def leave(self, dirpath):
+        """The walk has reported every file of dirpath."""
+        with self._lock:
+            self._left.add(dirpath)
+            self._settle(dirpath)
+
+    def _settle(self, dirpath):
+        if dirpath in self._left and not self._pending.get(dirpath):
+            self._left.discard(dirpath)
+            self._pending.pop(dirpath, None)
+            self._write("dir", {"path": dirpath})
+
+    def close(self, finished):
+        """Close; a finished run's journal is removed."""
+        self._f.close()
+        if finished:
+            self.path.unlink()
+
+def verify_staged(record) -> bool:
+    """Whether a journaled copy is complete (size and hash) and its source unchanged."""
+    try:
+        st = os.stat(record["source_path"])
+        if st.st_size != record["size_bytes"] or st.st_mtime_ns != record["mtime_ns"]:
+            return False
+        dest = Path(record["copied_to"])
+        if dest.stat().st_size != record["size_bytes"]:
+            return False
+        return compute_sha256(dest, record["size_bytes"]) == record["sha256"]
+    except (OSError, KeyError):
+        return False
+
+class ExtractionIndex:
+    """
+    SQLite table of the files archived so far: (path, size, mtime_ns, sha256),
+    plus the keyword set they were matched with.
+
+    An incremental run skips files whose size and mtime match their row; after
+    the run, rows are upserted for newly archived files and removed for files
+    that no longer exist. Files that still exist but were not matched this time
+    (e.g. after a size limit change) keep their row.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._db = sqlite3.connect(str(path))
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, sha256 TEXT NOT NULL)"
+            )
+            self._db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+    @staticmethod
+    def keyword_set(keywords):
+        """Keywords as compared by the matcher: case-insensitive, order and duplicates ignored."""
+        return sorted({kw.lower() for kw in keywords if kw})
+
+    def keywords(self):
+        """Keyword set recorded by the last run, or None for a new index."""
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'keywords'").fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def unchanged(self, path: str, st) -> bool:
+        row = self._db.execute("SELECT size, mtime_ns FROM files WHERE path = ?", (path,)).fetchone()
+        return row is not None and row[0] == st.st_size and row[1] == st.st_mtime_ns
+
+    def missing(self, seen):
+        """Indexed paths not in `seen` that no longer exist."""
+        return [path for (path,) in self._db.execute("SELECT path FROM files")
+                if path not in seen and not os.path.lexists(path)]
+
+    def update(self, rows, removed=(), keywords=None):
+        with self._db:
+            if keywords is not None:
+                self._db.execute("INSERT OR REPLACE INTO meta VALUES ('keywords', ?)",
+                                 (json.dumps(self.keyword_set(keywords), ensure_ascii=False),))
+            self._db.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", rows)
+            self._db.executemany("DELETE FROM files WHERE path = ?", ((p,) for p in removed))
+
+    def close(self):
+        self._db.close()
 
 # -----------------------
 # Main extraction logic
 # -----------------------
-def extract(target_dir: Path, out_dir: Path, keywords, priority_exts, exclude_dirs, max_file_size, dry_run=False):
+def extract(target_dir: Path, out_dir: Path, keywords, priority_exts, exclude_dirs, max_file_size, dry_run=False,
+            follow_symlinks=False, workers=COPY_WORKERS, queue_depth=QUEUE_DEPTH, use_staging=False,
+            incremental=False, compression="gzip", compress_level=None, compress_threads=1,
+            recompress=True, content_search=False, content_exts=CONTENT_EXTS, content_max_size=CONTENT_MAX_SIZE,
+            content_processes=None, resume=False, use_index=False):
     target_dir = target_dir.resolve()
     out_dir = out_dir.resolve()
     staging = out_dir / "staging"
+    # the run's own output (archive, manifest, staging, earlier exports) must never be archived
+    if out_dir == target_dir:
+        print(f"[!] Output folder {out_dir} is the target folder; choose an output folder outside it or below it.")
+        sys.exit(1)
+    if out_dir not in target_dir.parents:
+        exclude_dirs = list(exclude_dirs) + [str(out_dir), str(staging)]
     manifest = {
         "timestamp_utc": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         "source": str(target_dir),
-        "files_copied": [],
-        "total_bytes": 0,
-        "total_files": 0,
         "excluded_dirs": list(exclude_dirs),
+        "follow_symlinks": follow_symlinks,
+        "incremental": incremental,
+        "content_search": content_search,
         "keywords": keywords,
         "crown_seal": None
     }
+    totals = {"total_files": 0, "total_bytes": 0}
+
+    matcher = KeywordMatcher(keywords)
+    priority_exts = set(priority_exts)
+    journal_path = out_dir / JOURNAL_NAME
+    if resume:
+        if dry_run or not journal_path.exists():
+            print(f"[!] Nothing to resume: no journal at {journal_path} (only --staging runs are journaled).")
+            sys.exit(1)
+        # only staged copies survive an interrupted run
+        use_staging = True
+    ts = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+    archive_kind = "delta" if incremental else "export"
+    archive_name = out_dir / f"k-systems-{archive_kind}-{ts}{COMPRESSION[compression][0]}"
+    archive_options = {
+        "compression": compression,
+        "level": compress_level,
+        "threads": compress_threads,
+        "stored_exts": () if recompress else COMPRESSED_EXTS,
+    }
+    index_path = out_dir / INDEX_NAME
+    # the index is only kept when asked for: incremental runs read it, --index maintains it
+    use_index = use_index or incremental
+    if incremental and not index_path.exists():
+        print(f"[!] No index at {index_path}; this delta will contain every matched file.")
 
     print(f"[+] Starting scan of {target_dir}")
-    print(f"[+] Staging directory: {staging}")
+    if use_staging:
+        print(f"[+] Staging directory: {staging}")
+    else:
+        print(f"[+] Streaming into archive: {archive_name}")
     if dry_run:
         print("[!] DRY RUN mode - no files will be copied.")
-    if staging.exists() and any(staging.iterdir()):
-        if not user_confirm(f"Staging dir {staging} already exists and is not empty. Remove contents?"):
-            print("Aborting.")
+    if use_staging and not resume:
+        if staging.exists() and any(staging.iterdir()):
+            if not user_confirm(f"Staging dir {staging} already exists and is not empty. Remove contents?"):
+                print("Aborting.")
+                sys.exit(1)
+            shutil.rmtree(staging)
+        staging.mkdir(parents=True, exist_ok=True)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    index = ExtractionIndex(index_path) if use_index else None
+    if incremental:
+        indexed_keywords = index.keywords()
+        if indexed_keywords is not None and indexed_keywords != ExtractionIndex.keyword_set(keywords):
+            index.close()
+            print(f"[!] Index at {index_path} was built with a different keyword list; an incremental run would "
+                  "miss files that only the new keywords match. Run once with --index instead of --incremental.")
             sys.exit(1)
-        shutil.rmtree(staging)
-    staging.mkdir(parents=True, exist_ok=True)
-
-    # Walk the filesystem
-    for root, dirs, files in os.walk(target_dir, topdown=True):
-        root_path = Path(root)
-        # prune excluded dirs
-        dirs[:] = [d for d in dirs if not should_exclude_path(root_path / d, exclude_dirs)]
-        # Also skip hidden system directories if desired (optional)
+    # the manifest sits next to the archive, or in staging so it is archived with the files
+    manifest_path = (staging if use_staging else out_dir) / "EXTRACTION_MANIFEST.jsonl"
+    manifest_writer = ManifestWriter(manifest_path, manifest)
+
+    def write_file_record(entry):
+        manifest_writer.write("file", entry)
+
+    # every matched path (to detect deletions)
+    seen = set()
+    unchanged = 0
+    interrupted = False
+
+    journal = None
+    if use_staging and not dry_run:
         try:
-            for fname in files:
-                fpath = root_path / fname
-                # skip special files
-                if not fpath.is_file():
-                    continue
-                # skip very large files
-                try:
-                    fsize = fpath.stat().st_size
-                except Exception:
-                    fsize = 0
-                if max_file_size and fsize > max_file_size:
-                    continue
-                # heuristic match: keywords in filename or in parent folder name or extension match
-                searchable = (fname + " " + root_path.name).lower()
-                matched = False
-                for kw in keywords:
-                    if kw.lower() in searchable:
-                        matched = True
-                        break
-                # if not matched, also check extension priority
-                ext = fpath.suffix.lower()
-                if (not matched) and (ext in priority_exts):
-                    matched = True
-                if not matched:
-                    continue
+            journal = RunJournal(journal_path, {
+                "source": str(target_dir),
+                "keywords": keywords,
+                "incremental": incremental,
+                "index": use_index,
+                "max_file_size": max_file_size,
+                "follow_symlinks": follow_symlinks,
+                "content_search": content_search,
+                "content_max_size": content_max_size if content_search else None,
+                "compression": compression,
+                "compress_level": compress_level,
+            }, resume)
+        except ValueError as e:
+            print(f"[!] Cannot resume: {e}")
+            sys.exit(1)
 
-                # ready to copy
-                rel_path = fpath.relative_to(target_dir)
-                dest = staging / rel_path
-                manifest_entry = {
-                    "source_path": str(fpath),
-                    "relative_path": str(rel_path),
-                    "size_bytes": fsize,
-                    "copied_to": str(dest),
-                }
-                manifest["files_copied"].append(manifest_entry)
-                manifest["total_bytes"] += fsize
-                manifest["total_files"] += 1
-
-                if not dry_run:
-                    try:
-                        copy_with_metadata(fpath, dest)
-                    except Exception as e:
-                        manifest_entry["error"] = str(e)
-                        print(f"[!] Failed copying {fpath}: {e}")
-        except KeyboardInterrupt:
-            print("\n[!] Interrupted by user. Exiting loop.")
-            break
+    # a journaled file holds its directory open until it is stored or rejected
+    def hold(path):
+        if journal is not None:
+            journal.hold(os.path.dirname(path))
 
-    # After copy, produce archive
-    manifest_path = staging / "EXTRACTION_MANIFEST.json"
-    with manifest_path.open("w", encoding="utf-8") as mf:
-        mf.write(json.dumps(manifest, indent=2))
-    print(f"[+] Manifest written: {manifest_path}")
+    def release(path):
+        if journal is not None:
+            journal.release(os.path.dirname(path))
 
-    # Create crown seal placeholder
-    crown_placeholder = staging / "CROWN_SEAL_PLACEHOLDER.txt"
-    crown_placeholder.write_text("CROWN_SEAL: not provided\nAdd your crown seal file (image or signed token) to this folder.\n", encoding="utf-8")
+    def on_stored(entry):
+        write_file_record(entry)
+        if journal is not None:
+            if "sha256" in entry:
+                journal.write("file", entry)
+            release(entry["source_path"])
 
-    # Create tar.gz
-    ts = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
-    archive_name = out_dir / f"k-systems-export-{ts}.tar.gz"
-    print(f"[+] Creating archive: {archive_name}")
-    with tarfile.open(archive_name, "w:gz") as tar:
+    # Walk the filesystem on this thread; workers behind a bounded queue hash each
+    # file and store it once per distinct content (later copies become hard links)
+    archive = None
+    store = None
+    pipeline = None
+    if not use_staging:
+        archive = ArchiveWriter(archive_name, **archive_options)
+        store = ContentStore(archive.add_file, archive.add_link)
+    else:
+        store = ContentStore(copy_with_metadata, link_staged)
+    if not dry_run:
+        pipeline = CopyPipeline(store.put, workers, queue_depth, on_done=on_stored)
+
+    # Resume: keep journaled copies that verify (size and hash, source unchanged),
+    # and skip the files of directories the journal records as complete
+    replayed = set()
+    skip_files_in = ()
+    if resume:
+        with ThreadPoolExecutor(max(1, workers)) as pool:
+            verified = list(pool.map(verify_staged, journal.files))
+        stale_dirs = set()
+        for record, ok in zip(journal.files, verified):
+            record.pop("type", None)
+            if not ok:
+                _clear_staged(Path(record["copied_to"]))
+                stale_dirs.add(os.path.dirname(record["source_path"]))
+                continue
+            replayed.add(record["source_path"])
+            if "duplicate_of" in record:
+                store.duplicates += 1
+                store.duplicate_bytes += record["size_bytes"]
+            else:
+                store.seed(record["sha256"], Path(record["copied_to"]), record["size_bytes"])
+            totals["total_bytes"] += record["size_bytes"]
+            totals["total_files"] += 1
+            write_file_record(record)
+        replayed.update(journal.unchanged)
+        unchanged += len(journal.unchanged)
+        seen.update(replayed)
+        skip_files_in = journal.dirs - stale_dirs
+        print(f"[+] Resuming: {len(replayed)} files already handled, {len(skip_files_in)} directories complete, "
+              f"{verified.count(False)} journaled copies invalid")
+
+    def accept(path, st, hits, symlink, by_content=False):
+        nonlocal unchanged
+        seen.add(path)
+        if incremental and index.unchanged(path, st):
+            unchanged += 1
+            if journal is not None:
+                journal.write("unchanged", {"source_path": path})
+            release(path)
+            return
+
+        # ready to copy
+        fpath = Path(path)
+        rel_path = fpath.relative_to(target_dir)
+        dest = staging / rel_path if use_staging else rel_path.as_posix()
+        manifest_entry = {
+            "source_path": str(fpath),
+            "relative_path": str(rel_path),
+            "size_bytes": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "copied_to": str(dest) if use_staging else f"{archive_name.name}:{dest}",
+            "matched_keywords": matcher.names(hits),
+        }
+        if by_content:
+            manifest_entry["matched_by"] = "content"
+        if symlink:
+            manifest_entry["symlink_target"] = os.readlink(path)
+        totals["total_bytes"] += st.st_size
+        totals["total_files"] += 1
+
+        # the record is written once the file is stored (with its hash), or now in a dry run
+        if pipeline is not None:
+            pipeline.submit(fpath, dest, st, manifest_entry)
+        else:
+            write_file_record(manifest_entry)
+            release(path)
+
+    # Content search: batches of candidates go to a process pool; results are
+    # consumed in submission order, with a bounded number of batches in flight
+    searcher = None
+    if content_search:
+        content_exts = {e.lower() for e in content_exts}
+        content_processes = content_processes or os.cpu_count() or 1
+        searcher = ProcessPoolExecutor(content_processes, initializer=_init_content_search,
+                                       initargs=(matcher.keywords,))
+        in_flight = deque()
+        batch = []
+
+    def collect(limit):
+        while len(in_flight) > limit:
+            future, files = in_flight.popleft()
+            for (path, st, symlink), found in zip(files, future.result()):
+                if found:
+                    accept(path, st, set(found), symlink, by_content=True)
+                else:
+                    release(path)
+
+    def flush_batch():
+        if batch:
+            in_flight.append((searcher.submit(search_content_batch, [(p, st.st_size) for p, st, _ in batch]),
+                              list(batch)))
+            batch.clear()
+            collect(4 * content_processes)
+
+    dir_path = None
+    try:
+        for dirpath, entry, st in iter_files(target_dir, exclude_dirs, follow_symlinks, skip_files_in):
+            if dirpath != dir_path:
+                # files of a directory are reported together: the previous one is done
+                if journal is not None and dir_path is not None:
+                    journal.leave(dir_path)
+                dir_path = dirpath
+                dir_name = os.path.basename(dirpath).lower()
+                # keyword hits in the folder name, keyed by the automaton state after "<file name> "
+                dir_hits = {}
+            if entry.path in replayed:
+                continue
+            fname = entry.name
+            fsize = st.st_size
+            # skip very large files
+            if max_file_size and fsize > max_file_size:
+                continue
+            # heuristic match: keywords in "<filename> <parent folder name>" or extension match
+            state, hits = matcher.scan(fname.lower() + " ")
+            if state not in dir_hits:
+                dir_hits[state] = matcher.scan(dir_name, state)[1]
+            hits = hits | dir_hits[state]
+            if hits:
+                hold(entry.path)
+                accept(entry.path, st, hits, entry.is_symlink())
+                continue
+            ext = os.path.splitext(fname)[1].lower()
+            if searcher is None:
+                # if not matched, also check extension priority
+                if ext in priority_exts:
+                    hold(entry.path)
+                    accept(entry.path, st, hits, entry.is_symlink())
+                continue
+            # with content search, searchable extensions only select files to scan;
+            # priority extensions that cannot be searched (.pdf, .docx, ...) still match by extension
+            if ext not in content_exts:
+                if ext in priority_exts:
+                    hold(entry.path)
+                    accept(entry.path, st, hits, entry.is_symlink())
+                continue
+            if fsize > content_max_size or fsize == 0:
+                continue
+            if incremental and index.unchanged(entry.path, st):
+                # matched (by content) last time and not modified since
+                seen.add(entry.path)
+                unchanged += 1
+                if journal is not None:
+                    journal.write("unchanged", {"source_path": entry.path})
+                continue
+            hold(entry.path)
+            batch.append((entry.path, st, entry.is_symlink()))
+            if len(batch) >= CONTENT_BATCH:
+                flush_batch()
+        if searcher is not None:
+            flush_batch()
+            collect(0)
+        if journal is not None and dir_path is not None:
+            journal.leave(dir_path)
+    except KeyboardInterrupt:
+        print("\n[!] Interrupted by user. Exiting loop.")
+        if journal is None and not dry_run:
+            print("[!] Streamed runs cannot be resumed: the archive will hold only the files stored so far. "
+                  "Run again with --staging to be able to continue an interrupted run with --resume.")
+        interrupted = True
+    finally:
+        if searcher is not None:
+            searcher.shutdown(cancel_futures=True)
+        if pipeline is not None:
+            pipeline.close()
+    totals["duplicate_files"] = store.duplicates
+    totals["duplicate_bytes"] = store.duplicate_bytes
+    if store.duplicates:
+        print(f"[+] Stored {store.duplicates} duplicate files as links ({store.duplicate_bytes / 1e6:.1f} MB saved)")
+
+    # Deleted files are only known after a complete walk
+    removed = [] if interrupted or index is None else index.missing(seen)
+    for path in removed:
+        manifest_writer.write("deleted", {"source_path": path})
+    if incremental:
+        totals["unchanged_files"] = unchanged
+        totals["deleted_files"] = len(removed)
+        print(f"[+] Incremental: {totals['total_files']} new or changed, {unchanged} unchanged, {len(removed)} deleted")
+    totals["interrupted"] = interrupted
+    manifest_writer.close(totals)
+    print(f"[+] Manifest written: {manifest_path}")
+    if index is not None:
+        if not dry_run:
+            index.update(
+                ((r["source_path"], r["size_bytes"], r["mtime_ns"], r["sha256"])
+                 for r in read_manifest(manifest_path) if r["type"] == "file" and "sha256" in r),
+                removed,
+                keywords,
+            )
+            print(f"[+] Index updated: {index_path}")
+        index.close()
+
+    # After copy, produce archive
+    crown_text = "CROWN_SEAL: not provided\nAdd your crown seal file (image or signed token) to this folder.\n"
+    if use_staging:
+        # Create crown seal placeholder
+        (staging / "CROWN_SEAL_PLACEHOLDER.txt").write_text(crown_text, encoding="utf-8")
+        print(f"[+] Creating archive: {archive_name}")
+        archive = ArchiveWriter(archive_name, **archive_options)
         # add staging folder contents only, not the staging folder itself
         for item in staging.iterdir():
-            tar.add(item, arcname=item.name)
+            archive.add_path(item, item.name)
+    else:
+        archive.add_path(manifest_path, manifest_path.name)
+        archive.add_bytes("CROWN_SEAL_PLACEHOLDER.txt", crown_text.encode("utf-8"))
 
-    # compute checksum
-    checksum = compute_sha256(archive_name)
+    # checksum computed while the archive was written
+    checksum = archive.close()
+    if journal is not None:
+        journal.close(finished=not interrupted)
+        if interrupted:
+            print(f"[!] Run interrupted; continue it with --resume (journal: {journal_path})")
     checksum_path = out_dir / f"{archive_name.name}.sha256"
     checksum_path.write_text(checksum + "  " + archive_name.name + "\n", encoding="utf-8")
 
@@ -215,8 +1291,9 @@ def extract(target_dir: Path, out_dir: Path, keywords, priority_exts, exclude_di
         "sha256": checksum,
         "manifest": str(manifest_path),
         "timestamp_utc": manifest["timestamp_utc"],
-        "total_files": manifest["total_files"],
-        "total_bytes": manifest["total_bytes"]
+        "total_files": totals["total_files"],
+        "total_bytes": totals["total_bytes"],
+        "interrupted": interrupted
     }
     summary_path = out_dir / "EXTRACTION_SUMMARY.json"
     summary_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
@@ -237,8 +1314,33 @@ def main():
     parser.add_argument("--keywords-file", "-k", default=None, help="Optional file with one keyword per line")
     parser.add_argument("--max-file-size", type=int, default=MAX_FILE_SIZE, help="Maximum file size in bytes to include (default 5GB)")
     parser.add_argument("--dry-run", action="store_true", help="Scan and report only; do not copy files")
+    parser.add_argument("--follow-symlinks", action="store_true", help="Descend into symlinked directories (links to files are always followed)")
+    parser.add_argument("--incremental", action="store_true", help=f"Archive only files that are new or changed since the last run (tracked in <out>/{INDEX_NAME})")
+    parser.add_argument("--index", action="store_true", help=f"Record archived files in <out>/{INDEX_NAME} so a later --incremental run can use them (implied by --incremental)")
+    parser.add_argument("--compression", choices=sorted(COMPRESSION), default="gzip", help="Archive compression (default gzip)")
+    parser.add_argument("--compress-level", type=int, default=None, help="Compression level (default: 9 for gzip/bz2, 6 for xz)")
+    parser.add_argument("--compress-threads", type=int, default=1, help="Compress independent blocks on this many threads (default 1: single stream)")
+    parser.add_argument("--no-recompress", action="store_true", help="Store already-compressed files (.zip, .tgz, .pdf, ...) at the cheapest level")
+    parser.add_argument("--content-search", action="store_true", help="Also include files whose content mentions a keyword; text-like extensions then only select which files are scanned (other priority extensions such as .pdf still match by extension)")
+    parser.add_argument("--content-max-size", type=int, default=CONTENT_MAX_SIZE, help=f"Largest file scanned for keywords in bytes (default {CONTENT_MAX_SIZE})")
+    parser.add_argument("--content-processes", type=int, default=None, help="Processes scanning file contents (default: number of CPUs)")
+    parser.add_argument("--resume", action="store_true", help="Continue an interrupted --staging run from its journal, keeping verified copies")
+    parser.add_argument("--staging", action="store_true", help="Copy files into <out>/staging before archiving instead of streaming them into the archive")
+    parser.add_argument("--workers", type=int, default=COPY_WORKERS, help=f"Number of worker threads hashing and copying files (default {COPY_WORKERS})")
+    parser.add_argument("--queue-depth", type=int, default=QUEUE_DEPTH, help=f"Matched files that may wait for a copier (default {QUEUE_DEPTH})")
+    parser.add_argument("--summarize", metavar="MANIFEST", default=None, help="Print totals of an existing EXTRACTION_MANIFEST.jsonl and exit")
     parser.add_argument("--no-confirm", action="store_true", help="Do not prompt for confirmations (be careful)")
     args = parser.parse_args()
+    if args.compress_level is not None:
+        if args.compression not in COMPRESS_LEVELS:
+            parser.error(f"--compress-level does not apply to --compression {args.compression}")
+        low, high = COMPRESS_LEVELS[args.compression]
+        if not low <= args.compress_level <= high:
+            parser.error(f"--compress-level for {args.compression} must be between {low} and {high}")
+
+    if args.summarize:
+        print(json.dumps(summarize_manifest(Path(args.summarize)), indent=2))
+        return
 
     try:
         if os.geteuid() == 0:
@@ -285,7 +1387,21 @@ def main():
         priority_exts=[e.lower() for e in PRIORITY_EXTS],
         exclude_dirs=EXCLUDE_DIRS,
         max_file_size=args.max_file_size,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        follow_symlinks=args.follow_symlinks,
+        workers=args.workers,
+        queue_depth=args.queue_depth,
+        use_staging=args.staging,
+        incremental=args.incremental,
+        compression=args.compression,
+        compress_level=args.compress_level,
+        compress_threads=args.compress_threads,
+        recompress=not args.no_recompress,
+        content_search=args.content_search,
+        content_max_size=args.content_max_size,
+        content_processes=args.content_processes,
+        resume=args.resume,
+        use_index=args.index
     )
     print("[+] Done. Review the summary and manifest in the output folder.")
     print(json.dumps(summary, indent=2))
@@ -4,9 +4,14 @@ K-Math: Recursive Mathematics Framework
 A framework for modeling complex systems as iterated operator dynamics over structured state spaces.
 """
 
-from kmath.core.state import KState
+from kmath.core.state import KState, KDelta
+from kmath.core.labels import KLabelSet, KNodeLabels
+from kmath.core.precision import KPrecision
+from kmath.core.topology import KTopology
 from kmath.core.operators import (
     KOperator,
+    KComposedOperator,
+    KSumOperator,
     KStructuralOperator,
     KNumericalOperator,
     KContextOperator,
@@ -14,15 +19,42 @@ from kmath.core.operators import (
     KNodeUpdateOperator,
     KEdgeUpdateOperator,
     KLabelOperator,
+    KTopologyChange,
+    KTopologyUpdateOperator,
     KContextUpdateOperator,
 )
+from kmath.core.linear import KLinearOperator
+from kmath.core.monitors import (
+    KMonitor,
+    ResidualNorm,
+    RelativeChange,
+    Predicate,
+    WallTime,
+    KRunResult,
+)
 from kmath.core.program import KProgram
-from kmath.core.recurrence import KRecurrence
+from kmath.core.recurrence import KRecurrence, KScheduledRecurrence
+from kmath.core.stochastic import (
+    KStochasticOperator,
+    KNoiseOperator,
+    KEnsembleResult,
+    rng_stream,
+    current_rng,
+    run_ensemble,
+)
+from kmath.core.continuous import KStateLayout, KVectorField, KODEResult, integrate
 
 __version__ = "0.1.0"
 __all__ = [
     "KState",
+    "KDelta",
+    "KLabelSet",
+    "KNodeLabels",
+    "KPrecision",
+    "KTopology",
     "KOperator",
+    "KComposedOperator",
+    "KSumOperator",
     "KStructuralOperator",
     "KNumericalOperator",
     "KContextOperator",
@@ -30,7 +62,27 @@ __all__ = [
     "KNodeUpdateOperator",
     "KEdgeUpdateOperator",
     "KLabelOperator",
+    "KTopologyChange",
+    "KTopologyUpdateOperator",
     "KContextUpdateOperator",
+    "KLinearOperator",
+    "KMonitor",
+    "ResidualNorm",
+    "RelativeChange",
+    "Predicate",
+    "WallTime",
+    "KRunResult",
     "KProgram",
     "KRecurrence",
+    "KScheduledRecurrence",
+    "KStochasticOperator",
+    "KNoiseOperator",
+    "KEnsembleResult",
+    "rng_stream",
+    "current_rng",
+    "run_ensemble",
+    "KStateLayout",
+    "KVectorField",
+    "KODEResult",
+    "integrate",
 ]
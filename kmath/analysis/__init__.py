@@ -3,10 +3,11 @@ Analysis utilities for K-Math framework.
 """
 
 from kmath.analysis.fixed_points import find_fixed_point, find_cycle
-from kmath.analysis.stability import check_lyapunov_stability
+from kmath.analysis.stability import check_lyapunov_stability, solve_discrete_lyapunov
 
 __all__ = [
     "find_fixed_point",
     "find_cycle",
     "check_lyapunov_stability",
+    "solve_discrete_lyapunov",
 ]
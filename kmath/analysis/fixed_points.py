@@ -12,7 +12,7 @@ def find_fixed_point(
     operator: KOperator,
     initial_state: KState,
     max_iterations: int = 1000,
-    tolerance: float = 1e-6
+    tolerance: Optional[float] = None
 ) -> Optional[KState]:
     """
     Find a fixed point of an operator: O(s*) = s*.
@@ -21,7 +21,7 @@ def find_fixed_point(
         operator: K-operator to find fixed point for
         initial_state: Starting point for iteration
         max_iterations: Maximum number of iterations
-        tolerance: Convergence tolerance
+        tolerance: Convergence tolerance (default: from the state's precision)
         
     Returns:
         Fixed point if found, None otherwise
@@ -34,7 +34,7 @@ def find_cycle(
     operator: KOperator,
     initial_state: KState,
     max_iterations: int = 1000,
-    tolerance: float = 1e-6
+    tolerance: Optional[float] = None
 ) -> Optional[List[KState]]:
     """
     Detect cycles in operator iteration using Floyd's algorithm.
@@ -43,7 +43,7 @@ def find_cycle(
         operator: K-operator to detect cycles for
         initial_state: Starting point
         max_iterations: Maximum iterations
-        tolerance: Tolerance for state comparison
+        tolerance: Tolerance for state comparison (default: from the state's precision)
         
     Returns:
         Cycle as list of states if found, None otherwise
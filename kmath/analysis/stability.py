@@ -2,10 +2,13 @@
 Stability analysis utilities for K-Math framework.
 """
 
-from typing import Optional
+from typing import Optional, Union
 import numpy as np
 from kmath.core.state import KState
 from kmath.core.operators import KOperator
+from kmath.core.linear import KLinearOperator
+from kmath.core.stochastic import current_rng
+from kmath.core.precision import default_jacobian_step
 
 
 def check_lyapunov_stability(
@@ -13,7 +16,8 @@ def check_lyapunov_stability(
     fixed_point: KState,
     lyapunov_func: Optional[callable] = None,
     epsilon: float = 1e-3,
-    num_samples: int = 10
+    num_samples: int = 10,
+    rng: Union[np.random.Generator, int, None] = None
 ) -> bool:
     """
     Basic Lyapunov stability check for a fixed point.
@@ -26,6 +30,8 @@ def check_lyapunov_stability(
         lyapunov_func: Optional Lyapunov function V(s). If None, uses L2 norm.
         epsilon: Perturbation size
         num_samples: Number of random perturbations to test
+        rng: Generator or seed for the perturbations (default: the stream bound
+            with `rng_stream`, else a fresh unseeded generator)
         
     Returns:
         True if stable (all perturbations remain bounded), False otherwise
@@ -38,6 +44,10 @@ def check_lyapunov_stability(
                 total += np.sum(node_state ** 2)
             return np.sqrt(total)
     
+    if rng is None:
+        rng = current_rng()
+    rng = np.random.default_rng(rng)
+    
     # Compute Lyapunov value at fixed point
     v_fixed = lyapunov_func(fixed_point)
     
@@ -46,7 +56,7 @@ def check_lyapunov_stability(
         # Create perturbed state
         perturbed = fixed_point.copy()
         for node_id in perturbed.nodes:
-            perturbation = epsilon * np.random.randn(*perturbed.nodes[node_id].shape)
+            perturbation = epsilon * rng.standard_normal(np.shape(perturbed.nodes[node_id]))
             perturbed.nodes[node_id] = perturbed.nodes[node_id] + perturbation
         
         # Apply operator
@@ -66,7 +76,7 @@ def check_lyapunov_stability(
 def compute_jacobian_eigenvalues(
     operator: KOperator,
     fixed_point: KState,
-    epsilon: float = 1e-6
+    epsilon: Optional[float] = None
 ) -> np.ndarray:
     """
     Compute eigenvalues of the Jacobian at a fixed point (numerical approximation).
@@ -74,11 +84,23 @@ def compute_jacobian_eigenvalues(
     Args:
         operator: K-operator
         fixed_point: Fixed point to linearize around
-        epsilon: Step size for finite differences
+        epsilon: Step size for finite differences (default: from the state's
+            precision, 1e-6 for float64)
         
     Returns:
         Array of eigenvalues
+        
+    Note: For a KLinearOperator whose layout covers every node the
+    eigenvalues of its matrix are returned directly.
     """
+    if isinstance(operator, KLinearOperator) and operator.passthrough == 1:
+        covered = operator.node_ids is None or set(operator.node_ids) == set(fixed_point.nodes)
+        if covered:
+            return operator.eigenvalues()
+    
+    if epsilon is None:
+        epsilon = default_jacobian_step(fixed_point)
+    
     # Flatten all node states into a single vector
     node_ids = sorted(fixed_point.nodes.keys())
     n = sum(fixed_point.nodes[nid].size for nid in node_ids)
@@ -114,7 +136,7 @@ def compute_jacobian_eigenvalues(
 def is_asymptotically_stable(
     operator: KOperator,
     fixed_point: KState,
-    epsilon: float = 1e-6
+    epsilon: Optional[float] = None
 ) -> bool:
     """
     Check if a fixed point is asymptotically stable using eigenvalue test.
@@ -125,7 +147,8 @@ def is_asymptotically_stable(
     Args:
         operator: K-operator
         fixed_point: Fixed point to check
-        epsilon: Numerical epsilon for Jacobian computation
+        epsilon: Numerical epsilon for Jacobian computation (default: from the
+            state's precision)
         
     Returns:
         True if asymptotically stable, False otherwise
@@ -136,3 +159,42 @@ def is_asymptotically_stable(
     except Exception:
         # If Jacobian computation fails, fall back to False
         return False
+
+
+def solve_discrete_lyapunov(
+    A: np.ndarray,
+    Q: np.ndarray,
+    tolerance: float = 1e-12,
+    max_iterations: int = 64
+) -> np.ndarray:
+    """
+    Solve the discrete Lyapunov equation X = A X A^T + Q by doubling.
+    
+    The doubling iteration X_{k+1} = X_k + A_k X_k A_k^T, A_{k+1} = A_k^2
+    sums 2^k terms of the series X = Σ_j A^j Q (A^T)^j per step, so it
+    converges in O(log(1 / tolerance) / log(1 / ρ(A))) matrix products.
+    
+    Args:
+        A: Square matrix with spectral radius below 1
+        Q: Symmetric right-hand side
+        tolerance: Stop once the relative size of the added term falls below this
+        max_iterations: Maximum number of doubling steps
+        
+    Returns:
+        Solution X
+        
+    Raises:
+        ValueError: If A is not stable or the iteration does not converge
+    """
+    A_k = np.asarray(A, dtype=float)
+    if A_k.size and np.max(np.abs(np.linalg.eigvals(A_k))) >= 1.0:
+        raise ValueError("A must have spectral radius below 1")
+    
+    X = np.asarray(Q, dtype=float).copy()
+    for _ in range(max_iterations):
+        term = A_k @ X @ A_k.T
+        X = X + term
+        if np.linalg.norm(term) <= tolerance * max(np.linalg.norm(X), 1.0):
+            return X
+        A_k = A_k @ A_k
+    raise ValueError("Lyapunov doubling did not converge")
@@ -0,0 +1,370 @@
+"""
+Continuous-time K-Math: ODE integration of vector fields over K-states.
+
+A vector field assigns to every state s its time derivative ds/dt, given as
+a K-state whose node values are the derivatives. Integration works on the
+flattened node vector (node states concatenated in a fixed order); edges,
+labels and context are held constant along a trajectory.
+
+Integrators:
+
+- ``"rk45"``: explicit Dormand–Prince 5(4) with adaptive step size
+- ``"backward_euler"``: implicit (L-stable) Euler with Newton iterations and
+  a finite-difference or user-supplied Jacobian, for stiff graphs
+
+Both produce dense output (cubic Hermite interpolation between accepted
+steps) and respect a budget on accepted steps and vector-field evaluations.
+"""
+
+from typing import Any, Callable, Optional, Sequence, Tuple
+import numpy as np
+
+from kmath.core.state import KState
+from kmath.core.operators import KOperator
+from kmath.core.linear import KLinearOperator, _dense
+
+
+class KStateLayout:
+    """
+    Fixed node order and shapes used to flatten node states into a vector.
+    """
+
+    def __init__(self, template: KState, node_ids: Optional[Sequence[Any]] = None):
+        """
+        Initialize a layout.
+
+        Args:
+            template: State providing node shapes
+            node_ids: Node order (default: order of template.nodes)
+        """
+        self.node_ids = list(node_ids) if node_ids is not None else list(template.nodes)
+        self.shapes = [np.shape(template.nodes[n]) for n in self.node_ids]
+        self.sizes = [int(np.prod(shape, dtype=np.int64)) for shape in self.shapes]
+        self.size = sum(self.sizes)
+
+    def flatten(self, state: KState) -> np.ndarray:
+        """Flattened node vector of a state."""
+        if not self.node_ids:
+            return np.zeros(0)
+        return np.concatenate([np.ravel(state.nodes[n]) for n in self.node_ids]).astype(float, copy=False)
+
+    def unflatten(self, x: np.ndarray, template: KState) -> KState:
+        """New state with the layout's nodes taken from `x` and everything else from `template`."""
+        nodes = dict(template.nodes)
+        if template.precision is not None:
+            x = template.precision.to_storage(x)
+        pos = 0
+        for node_id, shape, size in zip(self.node_ids, self.shapes, self.sizes):
+            nodes[node_id] = x[pos:pos + size].reshape(shape)
+            pos += size
+        return template._derive(nodes=nodes)
+
+
+class KVectorField:
+    """
+    Time-dependent vector field ds/dt = F(s, t) on K-states.
+    """
+
+    def __init__(
+        self,
+        func: Callable[[KState, float], KState],
+        jacobian: Optional[Callable[[KState, float], np.ndarray]] = None,
+        node_ids: Optional[Sequence[Any]] = None
+    ):
+        """
+        Initialize a vector field.
+
+        Args:
+            func: Function (state, t) → state of node derivatives
+            jacobian: Optional function (state, t) → Jacobian of the flattened field
+            node_ids: Node order the Jacobian refers to (default: state order)
+        """
+        self.func = func
+        self.jacobian = jacobian
+        self.node_ids = list(node_ids) if node_ids is not None else None
+
+    @classmethod
+    def from_operator(cls, operator: KOperator) -> 'KVectorField':
+        """
+        Continuous-time counterpart ds/dt = O(s) − s of a discrete operator.
+
+        Its equilibria are the fixed points of O. For linear operators the
+        Jacobian A − I is supplied exactly.
+
+        Args:
+            operator: K-operator
+
+        Returns:
+            Vector field
+        """
+        def relax(state: KState, t: float) -> KState:
+            image = operator(state)
+            nodes = {n: image.nodes[n] - state.nodes[n] for n in state.nodes}
+            return KState._wrap(nodes, state.edges, state.labels, state.context, state.node_labels,
+                                state.precision)
+
+        if isinstance(operator, KLinearOperator) and operator.passthrough == 1:
+            A = _dense(operator.A) - np.eye(operator.dim)
+            return cls(relax, lambda state, t: A, operator.node_ids)
+        return cls(relax)
+
+
+class KDenseOutput:
+    """
+    Piecewise cubic Hermite interpolant of an integrated trajectory.
+    """
+
+    def __init__(self, ts: np.ndarray, ys: np.ndarray, fs: np.ndarray):
+        self.ts = ts
+        self.ys = ys
+        self.fs = fs
+
+    def __call__(self, t: float) -> np.ndarray:
+        """Interpolated flattened state at time t."""
+        ts = self.ts
+        forward = ts[-1] >= ts[0]
+        i = np.searchsorted(ts, t) if forward else len(ts) - np.searchsorted(ts[::-1], t)
+        i = int(min(max(i, 1), len(ts) - 1))
+        t0, t1 = ts[i - 1], ts[i]
+        h = t1 - t0
+        if h == 0:
+            return self.ys[i].copy()
+        s = (t - t0) / h
+        h00 = (1 + 2 * s) * (1 - s) ** 2
+        h10 = s * (1 - s) ** 2
+        h01 = s ** 2 * (3 - 2 * s)
+        h11 = s ** 2 * (s - 1)
+        return h00 * self.ys[i - 1] + h10 * h * self.fs[i - 1] + h01 * self.ys[i] + h11 * h * self.fs[i]
+
+
+class KODEResult:
+    """
+    Result of `integrate`.
+
+    Attributes:
+        state (KState): State at the last accepted time
+        t (np.ndarray): Accepted times
+        y (np.ndarray): Flattened states at accepted times (len(t) x n)
+        success (bool): Whether the end of the interval was reached
+        message (str): Termination reason
+        steps (int): Number of accepted steps
+        rejected (int): Number of rejected steps
+        evaluations (int): Number of vector-field evaluations
+        layout (KStateLayout): Layout of the flattened vectors
+        sol (Optional[KDenseOutput]): Dense output, if requested
+    """
+
+    def __init__(self, state, t, y, success, message, steps, rejected, evaluations, layout, sol):
+        self.state = state
+        self.t = t
+        self.y = y
+        self.success = success
+        self.message = message
+        self.steps = steps
+        self.rejected = rejected
+        self.evaluations = evaluations
+        self.layout = layout
+        self.sol = sol
+
+    def state_at(self, t: float) -> KState:
+        """Interpolated K-state at time t (requires dense output)."""
+        if self.sol is None:
+            raise ValueError("Dense output was not requested")
+        return self.layout.unflatten(self.sol(t), self.state)
+
+    def __repr__(self) -> str:
+        return (f"KODEResult(success={self.success}, t={self.t[-1]:g}, steps={self.steps}, "
+                f"evaluations={self.evaluations}, message={self.message!r})")
+
+
+class _BudgetExceeded(Exception):
+    pass
+
+
+# Dormand–Prince 5(4) tableau
+_DP_C = np.array([0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1, 1])
+_DP_A = [
+    [],
+    [1 / 5],
+    [3 / 40, 9 / 40],
+    [44 / 45, -56 / 15, 32 / 9],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+    [35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84],
+]
+_DP_E = np.array([71 / 57600, 0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40])
+
+_SAFETY = 0.9
+_MIN_FACTOR = 0.2
+_MAX_FACTOR = 10.0
+
+
+def _error_norm(err: np.ndarray, y0: np.ndarray, y1: np.ndarray, rtol: float, atol: float) -> float:
+    if err.size == 0:
+        return 0.0
+    scale = atol + rtol * np.maximum(np.abs(y0), np.abs(y1))
+    return float(np.sqrt(np.mean((err / scale) ** 2)))
+
+
+def integrate(
+    field: KVectorField,
+    state: KState,
+    t_span: Tuple[float, float],
+    method: str = "rk45",
+    rtol: float = 1e-6,
+    atol: float = 1e-9,
+    first_step: Optional[float] = None,
+    max_step: float = np.inf,
+    max_steps: int = 100000,
+    max_evaluations: int = 1000000,
+    dense_output: bool = False,
+    node_ids: Optional[Sequence[Any]] = None
+) -> KODEResult:
+    """
+    Integrate ds/dt = F(s, t) from t_span[0] to t_span[1].
+
+    Args:
+        field: Vector field (or a K-operator, used via `KVectorField.from_operator`)
+        state: Initial K-state
+        t_span: (t0, t1); t1 < t0 integrates backwards
+        method: "rk45" or "backward_euler"
+        rtol: Relative tolerance of the local error
+        atol: Absolute tolerance of the local error
+        first_step: Initial step size (default: estimated)
+        max_step: Largest allowed step size
+        max_steps: Budget of accepted steps
+        max_evaluations: Budget of vector-field evaluations (including Jacobian columns)
+        dense_output: Build a continuous interpolant of the trajectory
+        node_ids: Node order of the flattened vector (default: state order)
+
+    Returns:
+        KODEResult; `success` is False if a budget ran out or the step size underflowed
+    """
+    if isinstance(field, KOperator):
+        field = KVectorField.from_operator(field)
+    if method not in ("rk45", "backward_euler"):
+        raise ValueError(f"Unknown method {method!r}; expected 'rk45' or 'backward_euler'")
+
+    layout = KStateLayout(state, node_ids)
+    t0, t_end = float(t_span[0]), float(t_span[1])
+    direction = 1.0 if t_end >= t0 else -1.0
+    evaluations = 0
+
+    def f(t: float, x: np.ndarray) -> np.ndarray:
+        nonlocal evaluations
+        if evaluations >= max_evaluations:
+            raise _BudgetExceeded("evaluation budget exhausted")
+        evaluations += 1
+        return layout.flatten(field.func(layout.unflatten(x, state), t))
+
+    analytic = field.jacobian is not None and field.node_ids in (None, layout.node_ids)
+
+    def jacobian(t: float, x: np.ndarray, fx: np.ndarray) -> np.ndarray:
+        n = x.size
+        if analytic:
+            J = _dense(field.jacobian(layout.unflatten(x, state), t))
+            if J.shape == (n, n):
+                return J
+        J = np.empty((n, n))
+        for j in range(n):
+            dx = np.sqrt(np.finfo(float).eps) * max(1.0, abs(x[j]))
+            xp = x.copy()
+            xp[j] += dx
+            J[:, j] = (f(t, xp) - fx) / dx
+        return J
+
+    y = layout.flatten(state).copy()
+    ts, ys, fs = [t0], [y], []
+    steps = rejected = 0
+    message = "reached end of interval"
+    success = True
+
+    order = 5 if method == "rk45" else 1
+    t = t0
+    try:
+        fy = f(t, y)
+        fs.append(fy)
+        if first_step is not None:
+            h = abs(first_step)
+        else:
+            # Hairer–Wanner initial step heuristic
+            d0 = _error_norm(y, y, y, rtol, atol) if y.size else 0.0
+            d1 = _error_norm(fy, y, y, rtol, atol) if y.size else 0.0
+            h = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+        h = min(h, max_step, abs(t_end - t0)) if t_end != t0 else 0.0
+
+        while direction * (t_end - t) > 0:
+            if steps >= max_steps:
+                success, message = False, "step budget exhausted"
+                break
+            h = min(h, abs(t_end - t))
+            if h < 10 * np.spacing(abs(t)) or h == 0:
+                success, message = False, "step size underflow"
+                break
+            dt = direction * h
+
+            if method == "rk45":
+                k = [fy]
+                for stage in range(1, 7):
+                    x = y + dt * sum(a * ki for a, ki in zip(_DP_A[stage], k) if a)
+                    k.append(f(t + _DP_C[stage] * dt, x))
+                y_new, f_new = x, k[6]  # last stage is the 5th-order solution (FSAL)
+                err = dt * sum(e * ki for e, ki in zip(_DP_E, k) if e)
+                converged = True
+            else:
+                J = jacobian(t + dt, y, fy)
+                M = np.eye(y.size) - dt * J
+                y_new = y + dt * fy
+                converged = False
+                for _ in range(8):
+                    f_new = f(t + dt, y_new)
+                    residual = y_new - y - dt * f_new
+                    delta = np.linalg.solve(M, residual) if y.size else residual
+                    y_new = y_new - delta
+                    if _error_norm(delta, y, y_new, rtol, atol) < 1e-2:
+                        converged = True
+                        break
+                if converged:
+                    f_new = f(t + dt, y_new)
+                    # local error of backward Euler ~ h²/2 y'' ≈ h/2 (f1 − f0)
+                    err = 0.5 * dt * (f_new - fy)
+
+            if not converged:
+                rejected += 1
+                h *= 0.5
+                continue
+
+            error = _error_norm(err, y, y_new, rtol, atol)
+            if error <= 1.0:
+                t = t + dt
+                y, fy = y_new, f_new
+                steps += 1
+                ts.append(t)
+                ys.append(y)
+                fs.append(fy)
+                factor = _MAX_FACTOR if error == 0 else min(_MAX_FACTOR, _SAFETY * error ** (-1 / (order + 1)))
+            else:
+                rejected += 1
+                factor = max(_MIN_FACTOR, _SAFETY * error ** (-1 / (order + 1)))
+            h = min(h * factor, max_step)
+    except _BudgetExceeded as exc:
+        success, message = False, str(exc)
+
+    ts_arr = np.array(ts)
+    ys_arr = np.array(ys).reshape(len(ys), layout.size)
+    sol = None
+    if dense_output and len(fs) == len(ys):
+        fs_arr = np.array(fs[:len(ys)]).reshape(len(ys), layout.size)
+        sol = KDenseOutput(ts_arr, ys_arr, fs_arr)
+    return KODEResult(
+        state=layout.unflatten(y, state),
+        t=ts_arr,
+        y=ys_arr,
+        success=success,
+        message=message,
+        steps=steps,
+        rejected=rejected,
+        evaluations=evaluations,
+        layout=layout,
+        sol=sol,
+    )
@@ -0,0 +1,294 @@
+"""
+K-Labels: interned label sets for K-states.
+
+Label strings are interned to small integer IDs once per process, and a
+label set is stored as a bitset (a Python int). IDs depend on interning
+order and are never shared between processes: pickled label sets and
+indexes store label names and re-intern them on load. Copies are free, and
+unions, intersections and equality checks run over machine words instead
+of hashing strings.
+
+Per-node labels (roles such as "boundary" or "infected") are kept in a
+`KNodeLabels` index that maps nodes to label bitsets and each label to the
+set of nodes carrying it, so operators can select nodes by role without
+scanning the graph.
+"""
+
+import threading
+from collections.abc import MutableSet
+from typing import Any, Dict, Iterable, Iterator, List, Set, Union
+
+
+_label_ids: Dict[str, int] = {}
+_label_names: List[str] = []
+_intern_lock = threading.Lock()
+
+
+def intern_label(label: str) -> int:
+    """
+    Map a label string to its process-wide integer ID.
+
+    Args:
+        label: Label string
+
+    Returns:
+        Bit position of the label in label bitsets
+    """
+    label_id = _label_ids.get(label)
+    if label_id is None:
+        if not isinstance(label, str):
+            raise TypeError(f"Labels must be strings, got {type(label).__name__}")
+        with _intern_lock:
+            label_id = _label_ids.get(label)
+            if label_id is None:
+                label_id = len(_label_names)
+                _label_names.append(label)
+                _label_ids[label] = label_id
+    return label_id
+
+
+def _bits_of(labels: Iterable[str]) -> int:
+    if isinstance(labels, KLabelSet):
+        return labels._bits
+    bits = 0
+    for label in labels:
+        bits |= 1 << intern_label(label)
+    return bits
+
+
+def _names_of(bits: int) -> Iterator[str]:
+    while bits:
+        low = bits & -bits
+        yield _label_names[low.bit_length() - 1]
+        bits ^= low
+
+
+class KLabelSet(MutableSet):
+    """
+    Set of string labels backed by a bitset of interned label IDs.
+
+    Behaves like ``set[str]``; set operations between two KLabelSets are
+    integer bit operations.
+    """
+
+    __slots__ = ("_bits",)
+
+    def __init__(self, labels: Iterable[str] = ()):
+        """
+        Initialize a label set.
+
+        Args:
+            labels: Iterable of label strings (or another KLabelSet)
+        """
+        self._bits = _bits_of(labels)
+
+    @classmethod
+    def _from_bits(cls, bits: int) -> 'KLabelSet':
+        labels = cls.__new__(cls)
+        labels._bits = bits
+        return labels
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable[str]) -> 'KLabelSet':
+        return cls(it)
+
+    def __contains__(self, label: Any) -> bool:
+        label_id = _label_ids.get(label) if isinstance(label, str) else None
+        return label_id is not None and bool(self._bits >> label_id & 1)
+
+    def __iter__(self) -> Iterator[str]:
+        return _names_of(self._bits)
+
+    def __len__(self) -> int:
+        return bin(self._bits).count("1")
+
+    def add(self, label: str) -> None:
+        """Add a label."""
+        self._bits |= 1 << intern_label(label)
+
+    def discard(self, label: str) -> None:
+        """Remove a label if present."""
+        label_id = _label_ids.get(label)
+        if label_id is not None:
+            self._bits &= ~(1 << label_id)
+
+    def copy(self) -> 'KLabelSet':
+        """Return a copy of the label set."""
+        return KLabelSet._from_bits(self._bits)
+
+    def __reduce__(self):
+        # pickle names, not process-local IDs
+        return (KLabelSet, (list(self),))
+
+    def __or__(self, other: Iterable[str]) -> 'KLabelSet':
+        if isinstance(other, KLabelSet):
+            return KLabelSet._from_bits(self._bits | other._bits)
+        return super().__or__(other)
+
+    def __and__(self, other: Iterable[str]) -> 'KLabelSet':
+        if isinstance(other, KLabelSet):
+            return KLabelSet._from_bits(self._bits & other._bits)
+        return super().__and__(other)
+
+    def __sub__(self, other: Iterable[str]) -> 'KLabelSet':
+        if isinstance(other, KLabelSet):
+            return KLabelSet._from_bits(self._bits & ~other._bits)
+        return super().__sub__(other)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, KLabelSet):
+            return self._bits == other._bits
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return "{" + ", ".join(repr(label) for label in sorted(self)) + "}" if self._bits else "set()"
+
+
+class KNodeLabels:
+    """
+    Per-node labels with an inverted index (label → node IDs).
+
+    Copies share storage until one side is modified (copy-on-write), so
+    copying a state does not touch the index. `revision` is shared by
+    copies and replaced on every modification, which lets incremental
+    operators detect membership changes in O(1).
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._by_node: Dict[Any, int] = {}
+        self._by_label: Dict[int, Set[Any]] = {}
+        self._owned = True
+        self.revision = object()
+
+    def copy(self) -> 'KNodeLabels':
+        """Return a copy sharing storage until modified."""
+        other = KNodeLabels.__new__(KNodeLabels)
+        other._by_node = self._by_node
+        other._by_label = self._by_label
+        other._owned = False
+        other.revision = self.revision
+        self._owned = False
+        return other
+
+    def _own(self) -> None:
+        self.revision = object()
+        if not self._owned:
+            self._by_node = dict(self._by_node)
+            self._by_label = {k: set(v) for k, v in self._by_label.items()}
+            self._owned = True
+
+    def tag(self, label: str, node_ids: Iterable[Any]) -> None:
+        """
+        Attach a label to nodes.
+
+        Args:
+            label: Label string
+            node_ids: Nodes to tag
+        """
+        self._own()
+        label_id = intern_label(label)
+        bit = 1 << label_id
+        members = self._by_label.setdefault(label_id, set())
+        for node_id in node_ids:
+            self._by_node[node_id] = self._by_node.get(node_id, 0) | bit
+            members.add(node_id)
+
+    def untag(self, label: str, node_ids: Iterable[Any]) -> None:
+        """
+        Detach a label from nodes.
+
+        Args:
+            label: Label string
+            node_ids: Nodes to untag
+        """
+        label_id = _label_ids.get(label)
+        if label_id is None or label_id not in self._by_label:
+            return
+        self._own()
+        members = self._by_label[label_id]
+        for node_id in node_ids:
+            bits = self._by_node.get(node_id, 0) & ~(1 << label_id)
+            if bits:
+                self._by_node[node_id] = bits
+            else:
+                self._by_node.pop(node_id, None)
+            members.discard(node_id)
+        if not members:
+            del self._by_label[label_id]
+
+    def remove_nodes(self, node_ids: Iterable[Any]) -> None:
+        """Drop all labels of the given nodes."""
+        doomed = [n for n in node_ids if n in self._by_node]
+        if not doomed:
+            return
+        self._own()
+        for node_id in doomed:
+            for label in _names_of(self._by_node.pop(node_id)):
+                label_id = _label_ids[label]
+                members = self._by_label[label_id]
+                members.discard(node_id)
+                if not members:
+                    del self._by_label[label_id]
+
+    def __getstate__(self) -> Dict[Any, List[str]]:
+        # pickle names, not process-local IDs
+        return {node_id: list(_names_of(bits)) for node_id, bits in self._by_node.items()}
+
+    def __setstate__(self, state: Dict[Any, List[str]]) -> None:
+        self.__init__()
+        for node_id, labels in state.items():
+            bits = _bits_of(labels)
+            self._by_node[node_id] = bits
+            for label in labels:
+                self._by_label.setdefault(_label_ids[label], set()).add(node_id)
+
+    def labels_of(self, node_id: Any) -> KLabelSet:
+        """Labels attached to a node."""
+        return KLabelSet._from_bits(self._by_node.get(node_id, 0))
+
+    def nodes_with(self, label: str) -> Set[Any]:
+        """Nodes carrying a label (read-only view; do not modify)."""
+        label_id = _label_ids.get(label)
+        return self._by_label.get(label_id, set()) if label_id is not None else set()
+
+    def nodes_with_all(self, labels: Iterable[str]) -> Set[Any]:
+        """Nodes carrying every one of the given labels."""
+        groups = sorted((self.nodes_with(label) for label in labels), key=len)
+        if not groups:
+            return set(self._by_node)
+        return set(groups[0]).intersection(*groups[1:])
+
+    def nodes_with_any(self, labels: Iterable[str]) -> Set[Any]:
+        """Nodes carrying at least one of the given labels."""
+        result: Set[Any] = set()
+        for label in labels:
+            result |= self.nodes_with(label)
+        return result
+
+    def as_dict(self) -> Dict[str, Set[Any]]:
+        """Inverted index as {label: node IDs}."""
+        return {_label_names[k]: set(v) for k, v in self._by_label.items()}
+
+    def __len__(self) -> int:
+        """Number of labelled nodes."""
+        return len(self._by_node)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, KNodeLabels):
+            return NotImplemented
+        return self._by_node == other._by_node
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"KNodeLabels(nodes={len(self._by_node)}, labels={len(self._by_label)})"
+
+
+def as_label_set(labels: Union[KLabelSet, Iterable[str], None]) -> KLabelSet:
+    """Coerce labels to a KLabelSet, reusing an existing one."""
+    if isinstance(labels, KLabelSet):
+        return labels
+    return KLabelSet(labels or ())
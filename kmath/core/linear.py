@@ -0,0 +1,308 @@
+"""
+K-Linear operators: affine maps on the node state with explicit matrices.
+
+A linear K-operator acts on the flattened node vector x (node states
+concatenated in a fixed node order) as
+
+    x ↦ A x + B c + b
+
+where c is the context vector. Because the matrices are explicit,
+composition is a matrix product, T-fold application needs only
+O(log T) products, fixed points solve (I − A) x = B c + b directly and
+stability follows from the spectrum of A.
+
+Matrices may be dense ``np.ndarray`` or ``scipy.sparse`` matrices/arrays.
+Sparse operators stay sparse under composition, powers and fixed-point
+solves (scipy is only imported for sparse inputs); spectral analysis
+densifies A.
+"""
+
+import warnings
+from typing import Any, List, Optional, Sequence, Tuple
+import numpy as np
+
+from kmath.core.state import KState
+from kmath.core.operators import KOperator, KNumericalOperator
+
+
+def _is_sparse(matrix) -> bool:
+    return hasattr(matrix, "toarray")
+
+
+def _dense(matrix) -> np.ndarray:
+    """Dense copy of a (possibly sparse) matrix."""
+    return matrix.toarray() if _is_sparse(matrix) else np.asarray(matrix)
+
+
+def _identity_like(matrix, n: int):
+    """Identity matrix of the same kind (dense or sparse, same format) as `matrix`."""
+    dtype = np.result_type(matrix.dtype, np.float64)
+    if _is_sparse(matrix):
+        import scipy.sparse
+        return type(matrix)(scipy.sparse.identity(n, dtype=dtype, format=matrix.format))
+    return np.eye(n, dtype=dtype)
+
+
+class KLinearOperator(KNumericalOperator):
+    """
+    Affine K-operator x ↦ A x + B c + b on the flattened node state.
+
+    Node states outside `node_ids`, edge weights and the context are passed
+    through scaled by `passthrough` (1 by default, i.e. unchanged). The
+    factor only differs from 1 for operators produced by `operator_add`,
+    which adds those components of both operands.
+
+    Attributes:
+        A: State matrix (n x n)
+        B: Context matrix (n x m), or None
+        offset (np.ndarray): Affine term b (n,)
+        node_ids (Optional[List]): Node order of the flattened vector (None: state order)
+        passthrough (float): Scale applied to all components outside the linear block
+    """
+
+    def __init__(
+        self,
+        A,
+        offset: Optional[np.ndarray] = None,
+        node_ids: Optional[Sequence[Any]] = None,
+        B=None,
+        passthrough: float = 1.0
+    ):
+        """
+        Initialize a linear operator.
+
+        Args:
+            A: State matrix (n x n), dense or sparse
+            offset: Affine term b (default: zero)
+            node_ids: Node order of the flattened vector (default: order of state.nodes)
+            B: Context matrix (n x m); the context is treated as zero when absent
+            passthrough: Scale of components outside the linear block
+        """
+        self.A = A if hasattr(A, "toarray") else np.asarray(A)
+        if self.A.ndim != 2 or self.A.shape[0] != self.A.shape[1]:
+            raise ValueError("A must be a square matrix")
+        self.dim = self.A.shape[0]
+        self.offset = np.zeros(self.dim) if offset is None else np.asarray(offset).reshape(self.dim)
+        self.B = None if B is None else (B if hasattr(B, "toarray") else np.asarray(B))
+        if self.B is not None and (self.B.ndim != 2 or self.B.shape[0] != self.dim):
+            raise ValueError("B must have the same number of rows as A")
+        self.node_ids = list(node_ids) if node_ids is not None else None
+        self.passthrough = passthrough
+        self._cast_cache = {}
+        super().__init__(self._apply)
+
+    # ------------------------------------------------------------------
+    # State <-> vector
+    # ------------------------------------------------------------------
+
+    def _layout(self, state: KState) -> List[Any]:
+        return self.node_ids if self.node_ids is not None else list(state.nodes)
+
+    def flatten(self, state: KState) -> np.ndarray:
+        """
+        Flattened node vector of a state in this operator's node order.
+
+        Args:
+            state: K-state
+
+        Returns:
+            Vector x of length n
+        """
+        ids = self._layout(state)
+        x = np.concatenate([np.ravel(state.nodes[n]) for n in ids]) if ids else np.zeros(0)
+        if state.precision is not None:
+            x = state.precision.to_compute(x)
+        if x.size != self.dim:
+            raise ValueError(f"State has {x.size} node entries in layout, operator expects {self.dim}")
+        return x
+
+    def unflatten(self, x: np.ndarray, state: KState) -> KState:
+        """
+        Write a flattened node vector back into a copy of `state`.
+
+        Components outside the linear block are scaled by `passthrough`; the
+        result is stored in the state's precision (see `KState.precision`).
+
+        Args:
+            x: Vector of length n
+            state: Template state providing node shapes and other components
+
+        Returns:
+            New K-state
+        """
+        k = self.passthrough
+        ids = self._layout(state)
+        nodes = dict(state.nodes) if k == 1 else {n: v * k for n, v in state.nodes.items()}
+        if state.precision is not None:
+            x = state.precision.to_storage(x)
+        pos = 0
+        for n in ids:
+            shape = np.shape(state.nodes[n])
+            size = int(np.prod(shape, dtype=np.int64))
+            nodes[n] = x[pos:pos + size].reshape(shape)
+            pos += size
+        edges = None if k == 1 else {e: w * k for e, w in state.edges.items()}
+        context = state.context if (k == 1 or state.context is None) else state.context * k
+        return state._derive(nodes=nodes, edges=edges, context=context)
+
+    def _matrices(self, state: KState) -> Tuple[Any, Any, np.ndarray]:
+        """(A, B, offset) in the compute dtype of the state (cached per dtype)."""
+        if state.precision is None:
+            return self.A, self.B, self.offset
+        dtype = state.precision.compute
+        cast = self._cast_cache.get(dtype)
+        if cast is None:
+            cast = (self.A.astype(dtype),
+                    self.B.astype(dtype) if self.B is not None else None,
+                    self.offset.astype(dtype))
+            self._cast_cache[dtype] = cast
+        return cast
+
+    def _drive(self, state: KState) -> np.ndarray:
+        """Constant part B c + b for the state's context."""
+        _, B, offset = self._matrices(state)
+        if B is None or state.context is None:
+            return offset
+        return B @ np.ravel(state.context).astype(offset.dtype, copy=False) + offset
+
+    def _apply(self, state: KState) -> KState:
+        x = self.flatten(state)
+        A = self._matrices(state)[0]
+        return self.unflatten(A @ x + self._drive(state), state)
+
+    # ------------------------------------------------------------------
+    # Algebra
+    # ------------------------------------------------------------------
+
+    def _compatible(self, other: KOperator) -> bool:
+        return (isinstance(other, KLinearOperator) and other.dim == self.dim
+                and other.node_ids == self.node_ids)
+
+    def _compose_with(self, other: KOperator) -> Optional['KLinearOperator']:
+        """(A1, B1, b1, k1) ∘ (A2, B2, b2, k2) = (A1 A2, A1 B2 + k2 B1, A1 b2 + b1, k1 k2)."""
+        if not self._compatible(other):
+            return None
+        if self.B is None and other.B is None:
+            B = None
+        else:
+            m = (self.B if self.B is not None else other.B).shape[1]
+            B1 = self.B if self.B is not None else np.zeros((self.dim, m))
+            B2 = other.B if other.B is not None else np.zeros((self.dim, m))
+            B = self.A @ B2 + other.passthrough * B1
+        return KLinearOperator(
+            self.A @ other.A,
+            offset=self.A @ other.offset + self.offset,
+            node_ids=self.node_ids,
+            B=B,
+            passthrough=self.passthrough * other.passthrough,
+        )
+
+    def _add_with(self, other: KOperator) -> Optional['KLinearOperator']:
+        """(A1, B1, b1, k1) ⊕ (A2, B2, b2, k2) = (A1 + A2, B1 + B2, b1 + b2, k1 + k2)."""
+        if not self._compatible(other):
+            return None
+        if self.B is None:
+            B = other.B
+        elif other.B is None:
+            B = self.B
+        else:
+            B = self.B + other.B
+        return KLinearOperator(
+            self.A + other.A,
+            offset=self.offset + other.offset,
+            node_ids=self.node_ids,
+            B=B,
+            passthrough=self.passthrough + other.passthrough,
+        )
+
+    def identity(self) -> 'KLinearOperator':
+        """Identity operator with the same layout."""
+        return KLinearOperator(_identity_like(self.A, self.dim), node_ids=self.node_ids)
+
+    def power(self, k: int) -> 'KLinearOperator':
+        """
+        k-fold application O^k by exponentiation by squaring.
+
+        Args:
+            k: Number of applications (k >= 0)
+
+        Returns:
+            Linear operator equivalent to applying this one k times
+        """
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        result = self.identity()
+        base = self
+        while k:
+            if k & 1:
+                result = base.compose(result)
+            k >>= 1
+            if k:
+                base = base.compose(base)
+        return result
+
+    def run(self, state: KState, steps: int) -> KState:
+        """
+        Apply the operator `steps` times using O(log steps) matrix products.
+
+        Args:
+            state: Initial K-state
+            steps: Number of applications
+
+        Returns:
+            Final state
+        """
+        return self.power(steps)(state)
+
+    # ------------------------------------------------------------------
+    # Analysis
+    # ------------------------------------------------------------------
+
+    def fixed_point(self, state: KState) -> KState:
+        """
+        Fixed point x* = A x* + B c + b for the state's (constant) context.
+
+        Solves (I − A) x = B c + b directly (with a sparse LU factorization
+        when A is sparse).
+
+        Args:
+            state: State providing node shapes, context and other components
+
+        Returns:
+            Fixed-point state
+
+        Raises:
+            np.linalg.LinAlgError: If I − A is singular
+        """
+        if self.passthrough != 1:
+            raise ValueError("Fixed points require passthrough == 1")
+        self.flatten(state)  # validate layout
+        if _is_sparse(self.A):
+            import scipy.sparse.linalg
+            system = (_identity_like(self.A, self.dim) - self.A).tocsc()
+            with warnings.catch_warnings():
+                warnings.simplefilter("error", scipy.sparse.linalg.MatrixRankWarning)
+                try:
+                    x = scipy.sparse.linalg.spsolve(system, self._drive(state))
+                except scipy.sparse.linalg.MatrixRankWarning as e:
+                    raise np.linalg.LinAlgError("I - A is singular") from e
+        else:
+            x = np.linalg.solve(np.eye(self.dim) - self.A, self._drive(state))
+        return self.unflatten(x, state)
+
+    def eigenvalues(self) -> np.ndarray:
+        """Eigenvalues of A (a sparse A is converted to a dense n x n array)."""
+        return np.linalg.eigvals(_dense(self.A))
+
+    def spectral_radius(self) -> float:
+        """Largest eigenvalue magnitude of A (densifies a sparse A, see `eigenvalues`)."""
+        eigenvalues = self.eigenvalues()
+        return float(np.max(np.abs(eigenvalues))) if eigenvalues.size else 0.0
+
+    def is_stable(self) -> bool:
+        """Check asymptotic stability (spectral radius of A below 1)."""
+        return self.spectral_radius() < 1.0
+
+    def __repr__(self) -> str:
+        return (f"KLinearOperator(dim={self.dim}, context_dim="
+                f"{self.B.shape[1] if self.B is not None else None})")
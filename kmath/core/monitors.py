@@ -0,0 +1,214 @@
+"""
+K-Monitors: stopping criteria for iterated K-dynamics.
+
+A monitor inspects the run every `check_every` steps, comparing the
+current state with the state one step earlier, and may stop the run.
+Monitors that detect convergence (residual, relative change) and budgets
+(wall time) share one interface, so any combination can be passed to
+`KProgram.run_until` or `KRecurrence.iterate_until`.
+"""
+
+import time
+from typing import Callable, Optional, Sequence
+import numpy as np
+
+from kmath.core.state import KState
+
+
+def state_residual(previous: KState, current: KState, ord=None) -> float:
+    """
+    Largest per-node norm of the change between two states.
+
+    Args:
+        previous: Earlier state
+        current: Later state
+        ord: Norm order for each node's flattened change (default: 2-norm)
+
+    Returns:
+        max over nodes of ||current_v - previous_v||
+    """
+    residual = 0.0
+    for node_id, value in current.nodes.items():
+        if node_id not in previous.nodes:
+            continue
+        diff = np.ravel(np.asarray(value) - np.asarray(previous.nodes[node_id]))
+        if diff.size:
+            residual = max(residual, float(np.linalg.norm(diff, ord)))
+    return residual
+
+
+class KMonitor:
+    """
+    Base class for stopping criteria.
+
+    Attributes:
+        reason (str): Reason reported when this monitor stops the run
+        converged (bool): Whether stopping counts as convergence
+    """
+
+    reason = "monitor"
+    converged = True
+
+    def start(self) -> None:
+        """Called once before the run starts."""
+
+    def check(self, previous: KState, current: KState, step: int) -> bool:
+        """
+        Decide whether to stop.
+
+        Args:
+            previous: State one step before `current`
+            current: Current state
+            step: Number of steps taken so far
+
+        Returns:
+            True to stop the run
+        """
+        raise NotImplementedError
+
+
+class ResidualNorm(KMonitor):
+    """Stop when the largest per-node step change falls below a tolerance."""
+
+    reason = "residual"
+
+    def __init__(self, tolerance: float = 1e-6, ord=None):
+        """
+        Args:
+            tolerance: Residual threshold
+            ord: Norm order for each node (default: 2-norm)
+        """
+        self.tolerance = tolerance
+        self.ord = ord
+
+    def check(self, previous: KState, current: KState, step: int) -> bool:
+        return state_residual(previous, current, self.ord) < self.tolerance
+
+
+class RelativeChange(KMonitor):
+    """Stop when ||s_t − s_{t−1}|| / ||s_t|| over all nodes falls below a tolerance."""
+
+    reason = "relative change"
+
+    def __init__(self, tolerance: float = 1e-6):
+        """
+        Args:
+            tolerance: Relative change threshold
+        """
+        self.tolerance = tolerance
+
+    def check(self, previous: KState, current: KState, step: int) -> bool:
+        change = scale = 0.0
+        for node_id, value in current.nodes.items():
+            value = np.asarray(value)
+            if node_id not in previous.nodes:
+                continue
+            change += float(np.sum((value - np.asarray(previous.nodes[node_id])) ** 2))
+            scale += float(np.sum(value ** 2))
+        return np.sqrt(change) <= self.tolerance * max(np.sqrt(scale), np.finfo(float).tiny)
+
+
+class Predicate(KMonitor):
+    """Stop when a custom predicate on the current state holds."""
+
+    def __init__(self, func: Callable[[KState, int], bool], reason: str = "predicate", converged: bool = True):
+        """
+        Args:
+            func: Function (state, step) → True to stop
+            reason: Reason reported when the predicate stops the run
+            converged: Whether stopping counts as convergence
+        """
+        self.func = func
+        self.reason = reason
+        self.converged = converged
+
+    def check(self, previous: KState, current: KState, step: int) -> bool:
+        return bool(self.func(current, step))
+
+
+class WallTime(KMonitor):
+    """Stop once a wall-clock budget is spent (not counted as convergence)."""
+
+    reason = "wall time"
+    converged = False
+
+    def __init__(self, seconds: float):
+        """
+        Args:
+            seconds: Time budget
+        """
+        self.seconds = seconds
+        self._deadline = None
+
+    def start(self) -> None:
+        self._deadline = time.perf_counter() + self.seconds
+
+    def check(self, previous: KState, current: KState, step: int) -> bool:
+        return time.perf_counter() >= self._deadline
+
+
+class KRunResult:
+    """
+    Outcome of a monitored run.
+
+    Attributes:
+        state (KState): Final state
+        steps (int): Number of steps taken
+        residual (Optional[float]): Residual (see `state_residual`) at the last check
+        converged (bool): Whether a convergence monitor stopped the run
+        reason (str): Why the run stopped ("max_steps" if no monitor fired)
+    """
+
+    def __init__(self, state: KState, steps: int, residual: Optional[float], converged: bool, reason: str):
+        self.state = state
+        self.steps = steps
+        self.residual = residual
+        self.converged = converged
+        self.reason = reason
+
+    def __repr__(self) -> str:
+        return (f"KRunResult(steps={self.steps}, converged={self.converged}, "
+                f"reason={self.reason!r}, residual={self.residual})")
+
+
+def run_monitored(
+    step: Callable[[KState, int], KState],
+    state: KState,
+    max_steps: int,
+    monitors: Sequence[KMonitor],
+    check_every: int = 1
+) -> KRunResult:
+    """
+    Iterate `step` until a monitor fires or `max_steps` is reached.
+
+    Monitors are checked after steps check_every, 2·check_every, ...; only
+    the state one step before each check is kept.
+
+    Args:
+        step: Function (state, t) → next state
+        state: Initial state
+        max_steps: Maximum number of steps
+        monitors: Stopping criteria
+        check_every: Check interval in steps
+
+    Returns:
+        KRunResult
+    """
+    if check_every < 1:
+        raise ValueError("check_every must be at least 1")
+    for monitor in monitors:
+        monitor.start()
+
+    current = state
+    residual = None
+    for t in range(max_steps):
+        previous = current
+        current = step(current, t)
+        steps = t + 1
+        if steps % check_every:
+            continue
+        residual = state_residual(previous, current)
+        for monitor in monitors:
+            if monitor.check(previous, current, steps):
+                return KRunResult(current, steps, residual, monitor.converged, monitor.reason)
+    return KRunResult(current, max_steps, residual, False, "max_steps")
@@ -4,8 +4,10 @@ K-Operators: Functions that transform K-states.
 A K-operator is a function O: S → S that transforms a K-state.
 """
 
-from typing import Callable, Dict, Set, Tuple, Any
-from kmath.core.state import KState
+from typing import Callable, Dict, Set, Tuple, Any, Optional, Iterable, NamedTuple, Sequence
+from kmath.core.state import KState, KDelta
+from kmath.core.labels import KLabelSet
+from kmath.core.precision import precision_casts
 import numpy as np
 
 
@@ -14,8 +16,14 @@ class KOperator:
     Base class for K-operators.
     
     A K-operator is a function O: S → S where S is the space of K-states.
+    
+    Attributes:
+        memoizable (bool): Whether applying the operator twice to the same
+            state gives the same result, so expression evaluation may reuse it
     """
     
+    memoizable = True
+    
     def __init__(self, func: Callable[[KState], KState]):
         """
         Initialize a K-operator.
@@ -47,11 +55,30 @@ class KOperator:
         Returns:
             Composed operator
         """
-        return KOperator(lambda s: self(other(s)))
+        combined = self._compose_with(other)
+        if combined is not None:
+            return combined
+        return KComposedOperator(_flatten(other, KComposedOperator) + _flatten(self, KComposedOperator))
     
     def __mul__(self, other: 'KOperator') -> 'KOperator':
         """Operator composition using * syntax."""
         return self.compose(other)
+    
+    def _compose_with(self, other: 'KOperator') -> Optional['KOperator']:
+        """
+        Closed-form composition self ∘ other, if this operator type has one.
+        
+        Returns None to fall back to a lazy KComposedOperator.
+        """
+        return None
+    
+    def _add_with(self, other: 'KOperator') -> Optional['KOperator']:
+        """
+        Closed-form sum self ⊕ other, if this operator type has one.
+        
+        Returns None to fall back to a lazy KSumOperator.
+        """
+        return None
 
 
 class KStructuralOperator(KOperator):
@@ -121,38 +148,183 @@ class KNodeUpdateOperator(KNumericalOperator):
     - Current node state
     - Incident edges
     - Context vector
+    
+    In incremental mode the operator remembers which nodes it changed on its
+    previous application. When it is next applied to a state whose change
+    record (see `KState.record_changes`) reaches back to that output, only
+    nodes whose inputs may have changed are recomputed: changed nodes, their
+    out-neighbours and the targets of changed edges. All other nodes are
+    carried over unchanged, so the cost of a step is proportional to the
+    activity rather than to the size of the graph. This requires
+    `update_func` to be deterministic; an incremental operator keeps
+    per-run bookkeeping and should not be shared between concurrent runs.
+    
+    With `label` set, only nodes carrying that per-node label (see
+    `KState.node_labels`) are updated; the others are left unchanged.
     """
     
-    def __init__(self, update_func: Callable[[np.ndarray, Dict[Tuple, np.ndarray], np.ndarray], np.ndarray]):
+    def __init__(
+        self,
+        update_func: Callable[[np.ndarray, Dict[Tuple, np.ndarray], np.ndarray], np.ndarray],
+        incremental: bool = False,
+        label: Optional[str] = None
+    ):
         """
         Initialize node update operator.
         
         Args:
             update_func: Function f(x_v, incident_edges, context) → new_x_v
                 where incident_edges is a dict of {(u, v): edge_weight}
+            incremental: Recompute only nodes affected by the previous step's changes
+            label: Only update nodes carrying this per-node label
         """
         self.update_func = update_func
+        self.incremental = incremental
+        self.label = label
+        self._last_output_version: Optional[int] = None
+        self._last_changed: KDelta = KDelta()
+        self._last_label_revision: Optional[object] = None
         
         def apply_to_state(state: KState) -> KState:
-            new_state = state.copy()
+            new_nodes = dict(state.nodes)
+            topology = state.topology()
+            load, store = precision_casts(state.precision)
+            context = load(state.context) if state.context is not None else None
             
-            for node_id, node_state in state.nodes.items():
-                # Gather incident edges
-                incident_edges = {}
-                for (u, v), edge_weight in state.edges.items():
-                    if v == node_id:  # Incoming edge
-                        incident_edges[(u, v)] = edge_weight
+            for node_id in self._selected(state):
+                node_state = load(state.nodes[node_id])
+                # Gather incident (incoming) edges
+                incident_edges = {e: load(state.edges[e]) for e in topology.incoming(node_id)}
                 
                 # Update node
-                new_state.nodes[node_id] = self.update_func(
+                new_nodes[node_id] = store(self.update_func(
                     node_state,
                     incident_edges,
-                    state.context
-                )
+                    context
+                ))
             
-            return new_state
+            return state._derive(nodes=new_nodes)
         
-        super().__init__(apply_to_state)
+        super().__init__(self._apply_incremental if incremental else apply_to_state)
+    
+    def apply_subset(self, state: KState, node_ids: Iterable[Any]) -> KState:
+        """
+        Apply the update to the given nodes only.
+        
+        Nodes outside `node_ids` (or not selected by `label`) keep their
+        values; all unchanged arrays are shared with `state`. Used by
+        query-driven evaluation (see `KProgram.query`).
+        
+        Args:
+            state: Input K-state
+            node_ids: Nodes to update
+            
+        Returns:
+            New K-state
+        """
+        topology = state.topology()
+        load, store = precision_casts(state.precision)
+        context = load(state.context) if state.context is not None else None
+        members = state.node_labels.nodes_with(self.label) if self.label is not None else state.nodes
+        new_nodes = dict(state.nodes)
+        changed = []
+        for node_id in node_ids:
+            if node_id not in state.nodes or node_id not in members:
+                continue
+            incident_edges = {e: load(state.edges[e]) for e in topology.incoming(node_id)}
+            new_nodes[node_id] = store(self.update_func(load(state.nodes[node_id]), incident_edges, context))
+            changed.append(node_id)
+        
+        new_state = state._derive(nodes=new_nodes)
+        new_state.record_changes(state, KDelta(nodes=frozenset(changed)))
+        return new_state
+    
+    def _selected(self, state: KState) -> Iterable[Any]:
+        """Nodes this operator updates."""
+        if self.label is None:
+            return list(state.nodes)
+        members = state.node_labels.nodes_with(self.label)
+        return [n for n in members if n in state.nodes]
+    
+    def _affected_nodes(self, state: KState) -> Optional[Set[Any]]:
+        """Nodes whose inputs may differ from the previous application, or None for all."""
+        if self._last_output_version is None:
+            return None
+        if self.label is not None and state.node_labels.revision is not self._last_label_revision:
+            return None
+        since_output = state.changes_since(self._last_output_version)
+        if since_output is None or since_output.context:
+            return None
+        
+        topology = state.topology()
+        dirty = since_output.nodes | self._last_changed.nodes
+        affected = set(dirty)
+        for node_id in dirty:
+            affected.update(topology.successors(node_id))
+        for (_, v) in since_output.edges:
+            affected.add(v)
+        return affected
+    
+    def _apply_incremental(self, state: KState) -> KState:
+        """Apply the update to affected nodes only, sharing all other arrays."""
+        affected = self._affected_nodes(state)
+        topology = state.topology()
+        load, store = precision_casts(state.precision)
+        context = load(state.context) if state.context is not None else None
+        
+        new_nodes = dict(state.nodes)
+        if affected is None:
+            candidates = self._selected(state)
+        else:
+            members = state.node_labels.nodes_with(self.label) if self.label is not None else state.nodes
+            candidates = [n for n in affected if n in state.nodes and n in members]
+        changed = set()
+        for node_id in candidates:
+            node_state = state.nodes[node_id]
+            incident_edges = {e: load(state.edges[e]) for e in topology.incoming(node_id)}
+            new_value = store(self.update_func(load(node_state), incident_edges, context))
+            if not np.array_equal(new_value, node_state):
+                new_nodes[node_id] = new_value
+                changed.add(node_id)
+        
+        new_state = state._derive(nodes=new_nodes)
+        delta = KDelta(nodes=frozenset(changed))
+        new_state.record_changes(state, delta)
+        
+        self._last_output_version = new_state.version
+        self._last_changed = delta
+        self._last_label_revision = new_state.node_labels.revision
+        return new_state
+
+
+# Stand-in for the state of an edge endpoint that is not a node (shared, read-only)
+_MISSING_NODE = np.zeros(1)
+_MISSING_NODE.flags.writeable = False
+
+
+def _node_matrix(state: KState, node_ids: Sequence[Any]) -> np.ndarray:
+    """
+    Stack node states into a matrix with one row per entry of `node_ids`.
+    
+    Rows of IDs that are not nodes of the state are zero (masked), so
+    gathers never allocate per missing endpoint.
+    
+    Raises:
+        ValueError: If node states do not all have the same shape
+    """
+    present = [(i, state.nodes[n]) for i, n in enumerate(node_ids) if n in state.nodes]
+    if not present:
+        return np.zeros((len(node_ids), 1))
+    rows, values = zip(*present)
+    try:
+        values = np.stack(values)
+    except ValueError:
+        raise ValueError("Batched edge updates require all node states to have the same shape") from None
+    if len(rows) == len(node_ids):
+        return values
+    X = np.zeros((len(node_ids),) + values.shape[1:], dtype=values.dtype)
+    X[list(rows)] = values
+    return X
 
 
 class KEdgeUpdateOperator(KNumericalOperator):
@@ -164,41 +336,126 @@ class KEdgeUpdateOperator(KNumericalOperator):
     - Source node state
     - Target node state
     - Context vector
+    
+    With `batched=True` the update function is called once for the whole
+    graph on matrices: edge weights are stacked into W (E x k) and endpoint
+    states are gathered into Xu, Xv (E x d) through the endpoint index
+    arrays of the adjacency index (see `KTopology.edge_arrays`). This
+    requires all node states and all edge weights to have a common shape.
+    Endpoints that are not nodes of the state contribute zero rows.
     """
     
-    def __init__(self, update_func: Callable[[np.ndarray, np.ndarray, np.ndarray, np.ndarray], np.ndarray]):
+    def __init__(
+        self,
+        update_func: Callable[[np.ndarray, np.ndarray, np.ndarray, np.ndarray], np.ndarray],
+        batched: bool = False
+    ):
         """
         Initialize edge update operator.
         
         Args:
-            update_func: Function g(w_e, x_u, x_v, context) → new_w_e
+            update_func: Function g(w_e, x_u, x_v, context) → new_w_e, or with
+                `batched` a function g(W, Xu, Xv, context) → new W (E x k)
+            batched: Update all edges with a single call on stacked arrays
         """
         self.update_func = update_func
+        self.batched = batched
         
         def apply_to_state(state: KState) -> KState:
-            new_state = state.copy()
+            new_edges = {}
+            load, store = precision_casts(state.precision)
+            context = load(state.context) if state.context is not None else None
             
             for (u, v), edge_weight in state.edges.items():
-                x_u = state.nodes.get(u, np.zeros(1))
-                x_v = state.nodes.get(v, np.zeros(1))
+                x_u = load(state.nodes.get(u, _MISSING_NODE))
+                x_v = load(state.nodes.get(v, _MISSING_NODE))
                 
-                new_state.edges[(u, v)] = self.update_func(
-                    edge_weight,
+                new_edges[(u, v)] = store(self.update_func(
+                    load(edge_weight),
                     x_u,
                     x_v,
-                    state.context
-                )
+                    context
+                ))
             
-            return new_state
+            return state._derive(edges=new_edges)
         
-        super().__init__(apply_to_state)
+        super().__init__(self._apply_batched if batched else apply_to_state)
+    
+    def _update_batch(
+        self,
+        state: KState,
+        edge_ids: Sequence[Tuple[Any, Any]],
+        X: np.ndarray,
+        src: np.ndarray,
+        dst: np.ndarray
+    ) -> Dict[Tuple[Any, Any], np.ndarray]:
+        """Run the batched kernel on the given edges; return {edge_id: new weight}."""
+        load, store = precision_casts(state.precision)
+        context = load(state.context) if state.context is not None else None
+        try:
+            W = np.stack([state.edges[e] for e in edge_ids])
+        except ValueError:
+            raise ValueError("Batched edge updates require all edge weights to have the same shape") from None
+        X = load(X)
+        W_new = store(np.asarray(self.update_func(load(W), X[src], X[dst], context)))
+        if len(W_new) != len(edge_ids):
+            raise ValueError(f"Batched edge update returned {len(W_new)} rows for {len(edge_ids)} edges")
+        return dict(zip(edge_ids, W_new))
+    
+    def _apply_batched(self, state: KState) -> KState:
+        """Update all edges with one call of the batched kernel."""
+        topology = state.topology()
+        edge_ids, src, dst = topology.edge_arrays()
+        if not edge_ids:
+            return state._derive()
+        X = _node_matrix(state, topology.node_ids)
+        return state._derive(edges=self._update_batch(state, edge_ids, X, src, dst))
+    
+    def apply_subset(self, state: KState, node_ids: Iterable[Any]) -> KState:
+        """
+        Update only the incoming edges of the given nodes.
+        
+        Args:
+            state: Input K-state
+            node_ids: Nodes whose incoming edges are updated
+            
+        Returns:
+            New K-state sharing all other arrays with `state`
+        """
+        topology = state.topology()
+        edge_ids = [e for node_id in node_ids for e in topology.incoming(node_id)]
+        new_edges = dict(state.edges)
+        if self.batched and edge_ids:
+            endpoints = {}
+            for (u, v) in edge_ids:
+                endpoints.setdefault(u, len(endpoints))
+                endpoints.setdefault(v, len(endpoints))
+            src = np.fromiter((endpoints[u] for (u, _) in edge_ids), dtype=np.int64, count=len(edge_ids))
+            dst = np.fromiter((endpoints[v] for (_, v) in edge_ids), dtype=np.int64, count=len(edge_ids))
+            X = _node_matrix(state, list(endpoints))
+            new_edges.update(self._update_batch(state, edge_ids, X, src, dst))
+        else:
+            load, store = precision_casts(state.precision)
+            context = load(state.context) if state.context is not None else None
+            for (u, v) in edge_ids:
+                new_edges[(u, v)] = store(self.update_func(
+                    load(state.edges[(u, v)]),
+                    load(state.nodes.get(u, _MISSING_NODE)),
+                    load(state.nodes.get(v, _MISSING_NODE)),
+                    context
+                ))
+        
+        new_state = state._derive(edges=new_edges)
+        new_state.record_changes(state, KDelta(edges=frozenset(edge_ids)))
+        return new_state
 
 
 class KLabelOperator(KStructuralOperator):
     """
     Label operator: updates label set based on state.
     
-    Modifies the label set λ based on the current state.
+    Modifies the label set λ based on the current state. The update
+    function may return any set of strings; it is stored as a KLabelSet.
     """
     
     def __init__(self, update_func: Callable[[Set[str], KState], Set[str]]):
@@ -211,8 +468,84 @@ class KLabelOperator(KStructuralOperator):
         self.update_func = update_func
         
         def apply_to_state(state: KState) -> KState:
-            new_state = state.copy()
-            new_state.labels = self.update_func(state.labels, state)
+            return state._derive(labels=KLabelSet(self.update_func(state.labels, state)))
+        
+        super().__init__(apply_to_state)
+
+
+class KTopologyChange(NamedTuple):
+    """
+    Bulk structural change to a K-state.
+    
+    Attributes:
+        add_nodes: New (or replaced) node states {node_id: x_v}
+        remove_nodes: Node IDs to delete, together with all incident edges
+        add_edges: New (or replaced) edge weights {(u, v): w_e}
+        remove_edges: Edge IDs to delete
+    """
+    add_nodes: Optional[Dict[Any, np.ndarray]] = None
+    remove_nodes: Iterable[Any] = ()
+    add_edges: Optional[Dict[Tuple[Any, Any], np.ndarray]] = None
+    remove_edges: Iterable[Tuple[Any, Any]] = ()
+
+
+class KTopologyUpdateOperator(KStructuralOperator):
+    """
+    Topology operator: adds and removes nodes and edges in bulk.
+    
+    The adjacency index of the input state is handed over to the output and
+    updated in place, so rewiring a small fraction of the edges costs time
+    proportional to the change rather than rebuilding the index. Deletions
+    are applied before insertions; the output records the touched nodes and
+    edges (see `KState.record_changes`) for incremental operators downstream.
+    """
+    
+    def __init__(self, update_func: Callable[[KState], KTopologyChange]):
+        """
+        Initialize topology update operator.
+        
+        Args:
+            update_func: Function r(state) → KTopologyChange
+        """
+        self.update_func = update_func
+        
+        def apply_to_state(state: KState) -> KState:
+            change = self.update_func(state)
+            add_nodes = change.add_nodes or {}
+            add_edges = change.add_edges or {}
+            
+            topology = state.topology()
+            state._topology = None  # the index now belongs to the output
+            
+            nodes = dict(state.nodes)
+            edges = dict(state.edges)
+            
+            removed_nodes = [n for n in dict.fromkeys(change.remove_nodes) if n in nodes]
+            doomed = topology.incident_edges(removed_nodes) + list(change.remove_edges)
+            removed_edges = topology.remove_edges(doomed)
+            for edge_id in removed_edges:
+                del edges[edge_id]
+            for node_id in removed_nodes:
+                del nodes[node_id]
+            
+            storage = state.precision.storage if state.precision is not None else None
+            for node_id, x_v in add_nodes.items():
+                nodes[node_id] = np.array(x_v, dtype=storage)
+            for edge_id, w_e in add_edges.items():
+                edges[edge_id] = np.array(w_e, dtype=storage)
+            topology.add_edges(add_edges.keys())
+            
+            node_labels = state.node_labels.copy()
+            node_labels.remove_nodes(removed_nodes)
+            
+            new_state = KState._wrap(nodes, edges, state.labels.copy(), state.context, node_labels,
+                                     state.precision)
+            topology.bind(edges)
+            new_state._topology = topology
+            new_state.record_changes(state, KDelta(
+                nodes=frozenset(removed_nodes) | frozenset(add_nodes),
+                edges=frozenset(removed_edges) | frozenset(add_edges),
+            ))
             return new_state
         
         super().__init__(apply_to_state)
@@ -235,19 +568,195 @@ class KContextUpdateOperator(KContextOperator):
         self.update_func = update_func
         
         def apply_to_state(state: KState) -> KState:
-            new_state = state.copy()
-            new_state.context = self.update_func(state.context, state)
-            return new_state
+            context = self.update_func(state.context, state)
+            if context is not None and state.precision is not None:
+                context = state.precision.to_storage(context)
+            return state._derive(context=context)
         
         super().__init__(apply_to_state)
 
 
+def _add_states(s1: KState, s2: KState) -> KState:
+    """Add two states component-wise (entries only in s1 are shared, not copied)."""
+    nodes = dict(s1.nodes)
+    for node_id, x in s2.nodes.items():
+        if node_id in nodes:
+            nodes[node_id] = nodes[node_id] + x
+    
+    edges = dict(s1.edges)
+    for edge_id, w in s2.edges.items():
+        if edge_id in edges:
+            edges[edge_id] = edges[edge_id] + w
+    
+    context = s1.context
+    if s1.context is not None and s2.context is not None:
+        context = s1.context + s2.context
+    
+    return KState._wrap(nodes, edges, s1.labels | s2.labels, context, s1.node_labels.copy(), s1.precision)
+
+
+def _flatten(op: KOperator, kind: type) -> Tuple[KOperator, ...]:
+    """Operands of `op` if it is an expression node of the given kind, else (op,)."""
+    return op.operands if type(op) is kind else (op,)
+
+
+class KComposedOperator(KOperator):
+    """
+    Lazy composition O_n ∘ ... ∘ O_1 of operators.
+    
+    Nested compositions are flattened into a single operand list, so deep
+    chains (for example built by repeated `KMetaOperator.transform`) are
+    evaluated by a loop rather than by nested calls.
+    
+    Attributes:
+        operands (Tuple[KOperator, ...]): Operators in application order
+    """
+    
+    def __init__(self, operands: Iterable[KOperator]):
+        """
+        Initialize a composed operator.
+        
+        Args:
+            operands: Operators in application order (first applied first)
+        """
+        self.operands = tuple(operands)
+        self.memoizable = all(op.memoizable for op in self.operands)
+        super().__init__(lambda s: _evaluate(self, s))
+    
+    def __repr__(self) -> str:
+        return f"KComposedOperator(operands={len(self.operands)})"
+
+
+class KSumOperator(KOperator):
+    """
+    Lazy pointwise sum O_1 ⊕ ... ⊕ O_n of operators.
+    
+    Attributes:
+        operands (Tuple[KOperator, ...]): Summed operators
+    """
+    
+    def __init__(self, operands: Iterable[KOperator]):
+        """
+        Initialize a sum operator.
+        
+        Args:
+            operands: Operators whose results are added
+        """
+        self.operands = tuple(operands)
+        self.memoizable = all(op.memoizable for op in self.operands)
+        self._shared_prefix = _shared_prefixes(self.operands)
+        super().__init__(lambda s: _evaluate(self, s))
+    
+    def __repr__(self) -> str:
+        return f"KSumOperator(operands={len(self.operands)})"
+
+
+def _shared_prefixes(operands: Tuple[KOperator, ...]) -> Tuple[int, ...]:
+    """
+    For each sum operand, the number of leading steps it shares with another operand.
+    
+    Operands are compared as application sequences (a composition is its
+    operand list); steps match by identity and sharing stops at the first
+    operator that is not memoizable.
+    """
+    sequences = [_flatten(op, KComposedOperator) for op in operands]
+    prefixes = []
+    for i, seq in enumerate(sequences):
+        longest = 0
+        for j, other in enumerate(sequences):
+            if i == j:
+                continue
+            n = 0
+            for a, b in zip(seq, other):
+                if a is not b or not a.memoizable:
+                    break
+                n += 1
+            longest = max(longest, n)
+        prefixes.append(longest)
+    return tuple(prefixes)
+
+
+def _evaluate(root: KOperator, state: KState) -> KState:
+    """
+    Evaluate an operator expression DAG on a state.
+    
+    Uses an explicit stack instead of recursion. All operands of a sum see
+    the same input, so operands that start with the same operators (e.g.
+    op1(s) in both terms of a sum) compute that common prefix once. Only
+    those prefix results are kept, and only until the sum is complete: a
+    plain composition chain holds one intermediate state at a time.
+    Non-memoizable (stochastic) operators are never shared.
+    """
+    # Frames: [operator, input state, next operand index, partial results,
+    #          shared-prefix memo of the enclosing sum, shared prefix length]
+    # For compositions, the partial slot holds the input of the step in progress.
+    stack = [[root, state, 0, None, None, 0]]
+    result = None
+    
+    while stack:
+        frame = stack[-1]
+        op, s, index, partial, memo, prefix = frame
+        
+        if isinstance(op, KComposedOperator):
+            current = s if index == 0 else result
+            if 0 < index <= prefix:
+                memo[(id(op.operands[index - 1]), id(partial))] = current
+            while index < min(prefix, len(op.operands)):
+                key = (id(op.operands[index]), id(current))
+                if key not in memo:
+                    break
+                current = memo[key]
+                index += 1
+            if index < len(op.operands):
+                frame[2] = index + 1
+                frame[3] = current
+                stack.append([op.operands[index], current, 0, None, None, 0])
+                continue
+            result = current
+        elif isinstance(op, KSumOperator):
+            shared = op._shared_prefix
+            if index == 0:
+                partial = frame[3] = []
+                memo = frame[4] = {}
+            else:
+                partial.append(result)
+                done = op.operands[index - 1]
+                if shared[index - 1] and not isinstance(done, KComposedOperator):
+                    memo[(id(done), id(s))] = result
+            while index < len(op.operands):
+                operand = op.operands[index]
+                key = (id(operand), id(s))
+                if not (shared[index] and key in memo):
+                    break
+                partial.append(memo[key])
+                index += 1
+            if index < len(op.operands):
+                frame[2] = index + 1
+                if isinstance(operand, KComposedOperator):
+                    stack.append([operand, s, 0, None, memo, shared[index]])
+                else:
+                    stack.append([operand, s, 0, None, None, 0])
+                continue
+            result = partial[0]
+            for term in partial[1:]:
+                result = _add_states(result, term)
+        else:
+            result = op(s)
+        
+        stack.pop()
+    
+    return result
+
+
 def operator_add(op1: KOperator, op2: KOperator) -> KOperator:
     """
     Pointwise addition of operators: (O1 ⊕ O2)(s) = O1(s) + O2(s).
     
     Note: This assumes the states can be added component-wise.
     
+    The result is a lazy KSumOperator; nested sums are flattened and terms
+    with a closed-form sum (see `KOperator._add_with`) are combined.
+    
     Args:
         op1: First operator
         op2: Second operator
@@ -255,27 +764,16 @@ def operator_add(op1: KOperator, op2: KOperator) -> KOperator:
     Returns:
         Sum operator
     """
-    def add_states(s1: KState, s2: KState) -> KState:
-        """Add two states component-wise."""
-        result = s1.copy()
-        
-        # Add node states
-        for node_id in s1.nodes:
-            if node_id in s2.nodes:
-                result.nodes[node_id] = s1.nodes[node_id] + s2.nodes[node_id]
-        
-        # Add edge weights
-        for edge_id in s1.edges:
-            if edge_id in s2.edges:
-                result.edges[edge_id] = s1.edges[edge_id] + s2.edges[edge_id]
-        
-        # Union labels
-        result.labels = s1.labels | s2.labels
-        
-        # Add contexts
-        if s1.context is not None and s2.context is not None:
-            result.context = s1.context + s2.context
-        
-        return result
+    terms = []
+    for term in _flatten(op1, KSumOperator) + _flatten(op2, KSumOperator):
+        for i, existing in enumerate(terms):
+            combined = existing._add_with(term)
+            if combined is not None:
+                terms[i] = combined
+                break
+        else:
+            terms.append(term)
     
-    return KOperator(lambda s: add_states(op1(s), op2(s)))
+    if len(terms) == 1:
+        return terms[0]
+    return KSumOperator(terms)
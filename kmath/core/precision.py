@@ -0,0 +1,117 @@
+"""
+K-Precision: state-wide floating-point policies.
+
+A policy fixes the dtype in which every node, edge and context array of a
+state is stored, and the dtype in which operators compute. Storing in
+float32 halves memory and bandwidth compared to float64; float16 storage
+halves it again, with arithmetic carried out in float32 so that sums over
+many neighbours do not lose precision.
+
+Operators keep their inputs' policy: results are cast back to the storage
+dtype instead of being upcast by float64 parameters. Numerical defaults
+(convergence tolerances, finite-difference steps) follow the precision.
+"""
+
+from typing import Any, Callable, NamedTuple, Optional, Tuple, Union
+import numpy as np
+
+
+class KPrecision(NamedTuple):
+    """
+    Storage and compute dtypes of a K-state.
+
+    Attributes:
+        storage: dtype of stored arrays
+        compute: dtype in which operators evaluate updates
+    """
+    storage: np.dtype
+    compute: np.dtype
+
+    @property
+    def mixed(self) -> bool:
+        """Whether storage and compute dtypes differ."""
+        return self.storage != self.compute
+
+    def to_storage(self, value: Any) -> np.ndarray:
+        """Cast a value to the storage dtype (no copy if it already matches)."""
+        return np.asarray(value, dtype=self.storage)
+
+    def to_compute(self, value: Any) -> np.ndarray:
+        """Cast a value to the compute dtype (no copy if it already matches)."""
+        return np.asarray(value, dtype=self.compute)
+
+    @property
+    def tolerance(self) -> float:
+        """Default tolerance for state comparisons (1e-6 for float64)."""
+        return max(1e-6, 10 * float(np.finfo(self.storage).resolution))
+
+    @property
+    def jacobian_step(self) -> float:
+        """Default finite-difference step (1e-6 for float64)."""
+        return max(1e-6, float(np.sqrt(np.finfo(self.storage).eps)))
+
+
+FLOAT64 = KPrecision(np.dtype(np.float64), np.dtype(np.float64))
+FLOAT32 = KPrecision(np.dtype(np.float32), np.dtype(np.float32))
+MIXED16 = KPrecision(np.dtype(np.float16), np.dtype(np.float32))
+
+DEFAULT_TOLERANCE = 1e-6
+DEFAULT_JACOBIAN_STEP = 1e-6
+
+
+def as_precision(spec: Union[KPrecision, str, type, np.dtype, None]) -> Optional[KPrecision]:
+    """
+    Normalize a precision specification.
+
+    Args:
+        spec: None (keep each array's dtype), a KPrecision, or a float dtype.
+            "float16" means float16 storage with float32 compute.
+
+    Returns:
+        KPrecision, or None
+
+    Raises:
+        ValueError: If the dtype is not a floating-point type
+    """
+    if spec is None or isinstance(spec, KPrecision):
+        return spec
+    dtype = np.dtype(spec)
+    if dtype == np.float16:
+        return MIXED16
+    if not np.issubdtype(dtype, np.floating):
+        raise ValueError(f"Precision must be a floating-point dtype, got {dtype}")
+    return KPrecision(dtype, dtype)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def precision_casts(precision: Optional[KPrecision]) -> Tuple[Callable, Callable]:
+    """
+    Casts used by operators around an update function.
+
+    Args:
+        precision: Policy of the input state (None: no casts)
+
+    Returns:
+        (load, store): load converts stored values to the compute dtype,
+        store converts results to the storage dtype; both are the identity
+        where no conversion is needed
+    """
+    if precision is None:
+        return _identity, _identity
+    load = precision.to_compute if precision.mixed else _identity
+    return load, precision.to_storage
+
+
+def default_tolerance(state) -> float:
+    """Comparison tolerance matching the precision of a state."""
+    precision = getattr(state, "precision", None)
+    return precision.tolerance if precision is not None else DEFAULT_TOLERANCE
+
+
+def default_jacobian_step(state) -> float:
+    """Finite-difference step matching the precision of a state."""
+    precision = getattr(state, "precision", None)
+    return precision.jacobian_step if precision is not None else DEFAULT_JACOBIAN_STEP
@@ -4,9 +4,53 @@ K-Program: Sequential application of K-operators.
 A K-program is a finite sequence of operators applied left-to-right.
 """
 
-from typing import List, Sequence
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+import numpy as np
 from kmath.core.state import KState
-from kmath.core.operators import KOperator
+from kmath.core.operators import KOperator, KNodeUpdateOperator, KEdgeUpdateOperator
+from kmath.core.linear import KLinearOperator
+from kmath.core.monitors import KMonitor, KRunResult, run_monitored
+
+
+def query_nodes(
+    state: KState,
+    node_ids: Iterable[Any],
+    applications: int,
+    apply_subset: Callable[[KState, int, List[Any]], KState]
+) -> Dict[Any, np.ndarray]:
+    """
+    Evaluate a sequence of local updates only on the backward cone of `node_ids`.
+    
+    Each application may read the incoming edges and in-neighbours of the
+    nodes it updates (one hop). Application i of n therefore only needs to
+    update nodes within n − 1 − i hops of the queried nodes; everything else
+    is left stale. The edge structure must not change during the run.
+    
+    Args:
+        state: Initial K-state
+        node_ids: Queried nodes
+        applications: Number of one-hop applications n
+        apply_subset: Function (state, i, nodes) → state applying application i to `nodes`
+        
+    Returns:
+        Mapping of queried node ID → value after all applications
+    """
+    node_ids = list(node_ids)
+    layers = state.topology().backward_cone(node_ids, max(applications - 1, 0))
+    order = [n for n in chain.from_iterable(layers) if n in state.nodes]
+    distance = {n: h for h, layer in enumerate(layers) for n in layer}
+    ends = [0] * len(layers)
+    for n in order:
+        ends[distance[n]] += 1
+    for h in range(1, len(ends)):
+        ends[h] += ends[h - 1]
+    
+    current = state
+    for i in range(applications):
+        hops = min(applications - 1 - i, len(ends) - 1)
+        current = apply_subset(current, i, order[:ends[hops]])
+    return {n: current.nodes[n] for n in node_ids}
 
 
 class KProgram:
@@ -41,10 +85,30 @@ class KProgram:
             current_state = op(current_state)
         return current_state
     
+    def linear_map(self) -> Optional[KLinearOperator]:
+        """
+        Fuse the program into a single linear operator, if possible.
+        
+        Returns:
+            KLinearOperator equivalent to one step, or None if some operator
+            is not linear (or layouts differ)
+        """
+        if not self.ops or not all(isinstance(op, KLinearOperator) for op in self.ops):
+            return None
+        fused = self.ops[0]
+        for op in self.ops[1:]:
+            fused = op.compose(fused)
+            if not isinstance(fused, KLinearOperator):
+                return None
+        return fused
+    
     def run(self, state: KState, steps: int) -> KState:
         """
         Run the program for multiple steps.
         
+        Programs made only of linear operators are fused and run with
+        O(log steps) matrix products (see `KLinearOperator.power`).
+        
         Args:
             state: Initial K-state
             steps: Number of times to apply the full operator sequence
@@ -52,11 +116,63 @@ class KProgram:
         Returns:
             Final state after `steps` iterations
         """
+        fused = self.linear_map()
+        if fused is not None:
+            return fused.run(state, steps)
+        
         current_state = state
         for _ in range(steps):
             current_state = self.step(current_state)
         return current_state
     
+    def run_until(
+        self,
+        state: KState,
+        max_steps: int,
+        monitors: Sequence[KMonitor],
+        check_every: int = 1
+    ) -> KRunResult:
+        """
+        Run the program until a monitor stops it or `max_steps` is reached.
+        
+        Args:
+            state: Initial K-state
+            max_steps: Maximum number of program steps
+            monitors: Stopping criteria (see kmath.core.monitors)
+            check_every: Check the monitors every this many steps
+            
+        Returns:
+            KRunResult with the final state, steps taken and final residual
+        """
+        fused = self.linear_map()
+        step = fused if fused is not None else self.step
+        return run_monitored(lambda s, t: step(s), state, max_steps, monitors, check_every)
+    
+    def query(self, state: KState, steps: int, node_ids: Iterable[Any]) -> Dict[Any, np.ndarray]:
+        """
+        Final values of selected nodes after `steps` steps.
+        
+        Programs made only of node and edge update operators are evaluated
+        on the backward dependency cone of the queried nodes (see
+        `query_nodes`), so the cost depends on the cone size rather than the
+        graph size. Other programs fall back to a full `run`.
+        
+        Args:
+            state: Initial K-state
+            steps: Number of program steps
+            node_ids: Nodes to report
+            
+        Returns:
+            Mapping of node ID → final value
+        """
+        node_ids = list(node_ids)
+        if not self.ops or not all(isinstance(op, (KNodeUpdateOperator, KEdgeUpdateOperator)) for op in self.ops):
+            final = self.run(state, steps)
+            return {n: final.nodes[n] for n in node_ids}
+        ops = self.ops
+        return query_nodes(state, node_ids, steps * len(ops),
+                           lambda s, i, nodes: ops[i % len(ops)].apply_subset(s, nodes))
+    
     def trajectory(self, state: KState, steps: int) -> List[KState]:
         """
         Generate the trajectory of states over multiple steps.
@@ -2,14 +2,19 @@
 K-Recurrence: Recursive dynamics engine for K-Math.
 
 Supports time-invariant and time-variant recurrence relations with
-fixed-point and cycle detection.
+fixed-point and cycle detection, and scheduled recurrences whose map
+depends on time only through a periodic or piecewise-constant schedule.
 """
 
+import bisect
 import numpy as np
-from typing import Callable, Optional, List, Tuple
+from typing import Any, Callable, Dict, Optional, List, Sequence, Tuple
 from kmath.core.state import KState
 from kmath.core.operators import KOperator
+from kmath.core.linear import KLinearOperator
 from kmath.core.program import KProgram
+from kmath.core.monitors import KMonitor, KRunResult, run_monitored
+from kmath.core.precision import default_tolerance
 
 
 class KRecurrence:
@@ -55,6 +60,9 @@ class KRecurrence:
         Returns:
             Final state s_steps
         """
+        if isinstance(self.recurrence_map, KLinearOperator):
+            return self.recurrence_map.run(state, steps)
+        
         current_state = state
         for t in range(steps):
             if self.is_time_invariant:
@@ -63,6 +71,31 @@ class KRecurrence:
                 current_state = self.time_variant_map(current_state, t)
         return current_state
     
+    def iterate_until(
+        self,
+        state: KState,
+        max_steps: int,
+        monitors: Sequence[KMonitor],
+        check_every: int = 1
+    ) -> KRunResult:
+        """
+        Iterate the recurrence until a monitor stops it or `max_steps` is reached.
+        
+        Args:
+            state: Initial state s_0
+            max_steps: Maximum number of iterations
+            monitors: Stopping criteria (see kmath.core.monitors)
+            check_every: Check the monitors every this many steps
+            
+        Returns:
+            KRunResult with the final state, steps taken and final residual
+        """
+        if self.is_time_invariant:
+            step = lambda s, t: self.recurrence_map(s)
+        else:
+            step = self.time_variant_map
+        return run_monitored(step, state, max_steps, monitors, check_every)
+    
     def trajectory(self, state: KState, steps: int) -> List[KState]:
         """
         Generate trajectory of states.
@@ -88,7 +121,7 @@ class KRecurrence:
         self,
         initial_state: KState,
         max_iterations: int = 1000,
-        tolerance: float = 1e-6
+        tolerance: Optional[float] = None
     ) -> Optional[KState]:
         """
         Find a fixed point of the recurrence: R(s*) = s*.
@@ -96,16 +129,23 @@ class KRecurrence:
         Args:
             initial_state: Starting point for iteration
             max_iterations: Maximum number of iterations
-            tolerance: Convergence tolerance
+            tolerance: Convergence tolerance (default: from the state's precision)
             
         Returns:
             Fixed point if found, None otherwise
             
-        Note: Only works for time-invariant recurrence.
+        Note: Only works for time-invariant recurrence. For a linear
+        recurrence map the fixed point is solved for directly.
         """
         if not self.is_time_invariant:
             raise ValueError("Fixed point detection only works for time-invariant recurrence")
         
+        if isinstance(self.recurrence_map, KLinearOperator) and self.recurrence_map.passthrough == 1:
+            try:
+                return self.recurrence_map.fixed_point(initial_state)
+            except np.linalg.LinAlgError:
+                pass  # singular I - A: fall back to iteration
+        
         current_state = initial_state
         for _ in range(max_iterations):
             next_state = self.recurrence_map(current_state)
@@ -122,7 +162,7 @@ class KRecurrence:
         self,
         initial_state: KState,
         max_iterations: int = 1000,
-        tolerance: float = 1e-6
+        tolerance: Optional[float] = None
     ) -> Optional[List[KState]]:
         """
         Detect cycles in the recurrence using Floyd's algorithm.
@@ -130,7 +170,7 @@ class KRecurrence:
         Args:
             initial_state: Starting point
             max_iterations: Maximum iterations
-            tolerance: Tolerance for state comparison
+            tolerance: Tolerance for state comparison (default: from the state's precision)
             
         Returns:
             Cycle as list of states if found, None otherwise
@@ -178,18 +218,22 @@ class KRecurrence:
         
         return cycle
     
-    def _states_close(self, s1: KState, s2: KState, tolerance: float) -> bool:
+    def _states_close(self, s1: KState, s2: KState, tolerance: Optional[float] = None) -> bool:
         """
         Check if two states are close within tolerance.
         
         Args:
             s1: First state
             s2: Second state
-            tolerance: Tolerance for comparison
+            tolerance: Tolerance for comparison (default: derived from the
+                precision of s1, 1e-6 for float64 or unconstrained states)
             
         Returns:
             True if states are close, False otherwise
         """
+        if tolerance is None:
+            tolerance = default_tolerance(s1)
+        
         # Check nodes
         if set(s1.nodes.keys()) != set(s2.nodes.keys()):
             return False
@@ -227,4 +271,205 @@ class KRecurrence:
         Returns:
             KRecurrence instance
         """
-        return KRecurrence(recurrence_map=KOperator(program.step))
+        fused = program.linear_map()
+        return KRecurrence(recurrence_map=fused if fused is not None else KOperator(program.step))
+
+
+class KScheduledRecurrence(KRecurrence):
+    """
+    Time-variant recurrence driven by a schedule of phases.
+    
+    s_{t+1} = R_{φ(t)}(s_t), where φ(t) is looked up in a precomputed table
+    (periodic schedules) or from phase start times (piecewise-constant
+    schedules). Each phase's operator is built once and cached.
+    
+    For periodic schedules the period map P = R_{φ(T-1)} ∘ ... ∘ R_{φ(0)}
+    is composed once (fusing into a single matrix when all phases are
+    linear); `iterate` runs whole periods with it, and fixed-point and cycle
+    detection operate on it: a fixed point of P is a T-periodic orbit of the
+    scheduled system.
+    """
+    
+    def __init__(
+        self,
+        schedule: Sequence[Any],
+        durations: Optional[Sequence[int]] = None,
+        start_times: Optional[Sequence[int]] = None,
+        builder: Optional[Callable[[Any], KOperator]] = None
+    ):
+        """
+        Initialize a scheduled recurrence.
+        
+        Args:
+            schedule: Per-phase operators, or per-phase parameters if `builder` is given
+            durations: Steps spent in each phase per period (periodic schedule;
+                default: one step per phase)
+            start_times: Start step of each phase, increasing from 0
+                (piecewise-constant schedule; the last phase lasts forever)
+            builder: Function params → KOperator used to compile each phase once
+            
+        Note: Provide at most one of durations or start_times.
+        """
+        if durations is not None and start_times is not None:
+            raise ValueError("Provide at most one of durations or start_times")
+        if len(schedule) == 0:
+            raise ValueError("Schedule must contain at least one phase")
+        
+        self.schedule = list(schedule)
+        self.builder = builder
+        self._compiled: Dict[int, KOperator] = {}
+        self._period_map: Optional[KOperator] = None
+        
+        self.is_periodic = start_times is None
+        if self.is_periodic:
+            durations = list(durations) if durations is not None else [1] * len(self.schedule)
+            if len(durations) != len(self.schedule) or any(d < 0 for d in durations) or sum(durations) == 0:
+                raise ValueError("durations must give a non-negative step count per phase with a positive total")
+            self.phase_table = np.repeat(np.arange(len(self.schedule)), durations)
+            self.period = len(self.phase_table)
+            self.start_times = None
+        else:
+            self.start_times = list(start_times)
+            if len(self.start_times) != len(self.schedule) or self.start_times[0] != 0 \
+                    or any(b <= a for a, b in zip(self.start_times, self.start_times[1:])):
+                raise ValueError("start_times must be increasing from 0, one per phase")
+            self.phase_table = None
+            self.period = None
+        
+        super().__init__(time_variant_map=lambda state, t: self.operator_at(t)(state))
+    
+    def phase_at(self, t: int) -> int:
+        """
+        Schedule phase active at step t.
+        
+        Args:
+            t: Time step
+            
+        Returns:
+            Phase index
+        """
+        if self.is_periodic:
+            return int(self.phase_table[t % self.period])
+        return bisect.bisect_right(self.start_times, t) - 1
+    
+    def phase_operator(self, phase: int) -> KOperator:
+        """
+        Compiled operator for a phase (built once, then cached).
+        
+        Args:
+            phase: Phase index
+            
+        Returns:
+            K-operator of the phase
+        """
+        op = self._compiled.get(phase)
+        if op is None:
+            entry = self.schedule[phase]
+            op = self.builder(entry) if self.builder is not None else entry
+            self._compiled[phase] = op
+        return op
+    
+    def operator_at(self, t: int) -> KOperator:
+        """Operator applied at step t."""
+        return self.phase_operator(self.phase_at(t))
+    
+    def period_map(self) -> KOperator:
+        """
+        Composition of the operators over one period (cached).
+        
+        Returns:
+            Period map P
+        """
+        if not self.is_periodic:
+            raise ValueError("Period map only exists for periodic schedules")
+        if self._period_map is None:
+            period_map = self.operator_at(0)
+            for t in range(1, self.period):
+                period_map = self.operator_at(t).compose(period_map)
+            self._period_map = period_map
+        return self._period_map
+    
+    def iterate(self, state: KState, steps: int) -> KState:
+        """
+        Iterate the recurrence for a number of steps.
+        
+        Periodic schedules advance whole periods with the period map.
+        Piecewise-constant schedules advance each constant segment with a
+        time-invariant recurrence of its phase operator.
+        
+        Args:
+            state: Initial state s_0
+            steps: Number of iterations
+            
+        Returns:
+            Final state s_steps
+        """
+        if self.is_periodic:
+            periods, remainder = divmod(steps, self.period)
+            current_state = KRecurrence(recurrence_map=self.period_map()).iterate(state, periods)
+            for t in range(remainder):
+                current_state = self.operator_at(t)(current_state)
+            return current_state
+        
+        current_state = state
+        bounds = self.start_times[1:] + [None]
+        for phase, (begin, end) in enumerate(zip(self.start_times, bounds)):
+            if begin >= steps:
+                break
+            length = (min(end, steps) if end is not None else steps) - begin
+            current_state = KRecurrence(recurrence_map=self.phase_operator(phase)).iterate(current_state, length)
+        return current_state
+    
+    def _stationary(self, state: KState) -> Tuple[KRecurrence, KState]:
+        """Time-invariant recurrence describing the long-run dynamics, and its start state."""
+        if self.is_periodic:
+            return KRecurrence(recurrence_map=self.period_map()), state
+        last_start = self.start_times[-1]
+        last_phase = len(self.schedule) - 1
+        return KRecurrence(recurrence_map=self.phase_operator(last_phase)), self.iterate(state, last_start)
+    
+    def find_fixed_point(
+        self,
+        initial_state: KState,
+        max_iterations: int = 1000,
+        tolerance: Optional[float] = None
+    ) -> Optional[KState]:
+        """
+        Find a fixed point of the long-run dynamics.
+        
+        For periodic schedules this is a fixed point of the period map
+        (a state the system returns to after every period); iterations are
+        counted in periods. For piecewise-constant schedules the state is
+        advanced to the last phase and a fixed point of that phase's
+        operator is sought.
+        
+        Args:
+            initial_state: Starting point for iteration
+            max_iterations: Maximum number of iterations
+            tolerance: Convergence tolerance (default: from the state's precision)
+            
+        Returns:
+            Fixed point if found, None otherwise
+        """
+        recurrence, start = self._stationary(initial_state)
+        return recurrence.find_fixed_point(start, max_iterations, tolerance)
+    
+    def find_cycle(
+        self,
+        initial_state: KState,
+        max_iterations: int = 1000,
+        tolerance: Optional[float] = None
+    ) -> Optional[List[KState]]:
+        """
+        Detect cycles of the long-run dynamics (period map or last phase).
+        
+        Args:
+            initial_state: Starting point
+            max_iterations: Maximum iterations
+            tolerance: Tolerance for state comparison (default: from the state's precision)
+            
+        Returns:
+            Cycle as list of states if found, None otherwise
+        """
+        recurrence, start = self._stationary(initial_state)
+        return recurrence.find_cycle(start, max_iterations, tolerance)
@@ -0,0 +1,258 @@
+"""
+K-State serialization: compact binary format for snapshots and IPC.
+
+Layout of a serialized K-state:
+
+    magic (4 bytes) | version (u8) | codec (u8) | reserved (u16)
+    header length (u32) | payload length (u64) | header (JSON, utf-8)
+    padding to a 64-byte boundary | payload
+
+The header describes node ids, edge ids, labels, per-node labels, the
+precision policy and, for every array, its dtype, shape and byte offset
+inside the payload. The payload holds the raw array buffers back to back
+(nodes, then edges, then context), each aligned to 16 bytes, so arrays can
+be read back with ``np.frombuffer`` or from a memory map without copying.
+"""
+
+import json
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from kmath.core.labels import KNodeLabels
+from kmath.core.precision import KPrecision
+from kmath.core.state import KState
+
+try:  # optional fast codec
+    import lz4.frame as _lz4
+except ImportError:  # pragma: no cover - depends on environment
+    _lz4 = None
+
+
+MAGIC = b"KSTB"
+FORMAT_VERSION = 1
+
+_PREAMBLE = struct.Struct("<4sBBHIQ")
+_HEADER_ALIGN = 64
+_ARRAY_ALIGN = 16
+
+_CODEC_NONE = 0
+_CODEC_ZLIB = 1
+_CODEC_LZ4 = 2
+_CODEC_NAMES = {None: _CODEC_NONE, "zlib": _CODEC_ZLIB, "lz4": _CODEC_LZ4}
+
+
+def _align(offset: int, alignment: int) -> int:
+    return (offset + alignment - 1) // alignment * alignment
+
+
+def _encode_key(key: Any) -> Any:
+    """Encode a node/edge id as a JSON value (tuples become lists)."""
+    if isinstance(key, tuple):
+        return [_encode_key(k) for k in key]
+    if key is None or isinstance(key, (str, bool, int, float)):
+        return key
+    if isinstance(key, np.generic):
+        return key.item()
+    raise TypeError(f"Cannot serialize id of type {type(key).__name__}: {key!r}")
+
+
+def _decode_key(value: Any) -> Any:
+    """Inverse of `_encode_key`."""
+    if isinstance(value, list):
+        return tuple(_decode_key(v) for v in value)
+    return value
+
+
+def _resolve_codec(compression: Optional[str]) -> int:
+    if compression not in _CODEC_NAMES:
+        raise ValueError(f"Unknown compression {compression!r}; expected None, 'zlib' or 'lz4'")
+    codec = _CODEC_NAMES[compression]
+    if codec == _CODEC_LZ4 and _lz4 is None:
+        # lz4 is optional; zlib is always available
+        codec = _CODEC_ZLIB
+    return codec
+
+
+def _compress(payload, codec: int, level: int) -> bytes:
+    if codec == _CODEC_ZLIB:
+        return zlib.compress(payload, level)
+    if codec == _CODEC_LZ4:
+        return _lz4.compress(payload)
+    return payload
+
+
+def _decompress(payload, codec: int) -> bytes:
+    if codec == _CODEC_ZLIB:
+        return zlib.decompress(payload)
+    if codec == _CODEC_LZ4:
+        if _lz4 is None:
+            raise ValueError("State was compressed with lz4, but the lz4 package is not installed")
+        return _lz4.decompress(payload)
+    return payload
+
+
+def _layout(arrays: List[np.ndarray], offset: int) -> Tuple[List[list], int]:
+    """Assign aligned payload offsets to arrays; return descriptors and end offset."""
+    descriptors = []
+    for arr in arrays:
+        if arr.dtype.hasobject:
+            raise TypeError("Cannot serialize arrays with dtype=object")
+        offset = _align(offset, _ARRAY_ALIGN)
+        descriptors.append([arr.dtype.str, list(arr.shape), offset])
+        offset += arr.nbytes
+    return descriptors, offset
+
+
+def _write_arrays(buffer: bytearray, arrays, base: int) -> None:
+    """Copy each array into ``buffer`` at ``base`` plus its descriptor offset."""
+    for arr, (_, _, offset) in arrays:
+        if arr.nbytes:
+            view = np.frombuffer(buffer, dtype=arr.dtype, count=arr.size, offset=base + offset)
+            view[...] = arr.ravel()
+
+
+def state_to_bytes(state: KState, compression: Optional[str] = None, level: int = 6) -> bytearray:
+    """
+    Serialize a K-state to a bytes-like buffer.
+
+    Uncompressed states are written straight into the returned buffer, so
+    array data is copied exactly once.
+
+    Args:
+        state: K-state to serialize
+        compression: None, "zlib" or "lz4" (falls back to zlib if lz4 is unavailable)
+        level: Compression level for zlib
+
+    Returns:
+        Serialized state (a bytearray; pass through ``bytes()`` if an immutable copy is needed)
+    """
+    codec = _resolve_codec(compression)
+
+    node_ids = list(state.nodes.keys())
+    edge_ids = list(state.edges.keys())
+    node_arrays = [np.asarray(state.nodes[k]) for k in node_ids]
+    edge_arrays = [np.asarray(state.edges[k]) for k in edge_ids]
+    context_arrays = [np.asarray(state.context)] if state.context is not None else []
+
+    node_desc, end = _layout(node_arrays, 0)
+    edge_desc, end = _layout(edge_arrays, end)
+    context_desc, end = _layout(context_arrays, end)
+
+    header = {
+        "nodes": [[_encode_key(k)] + d for k, d in zip(node_ids, node_desc)],
+        "edges": [[_encode_key(k)] + d for k, d in zip(edge_ids, edge_desc)],
+        "labels": sorted(state.labels),
+        "node_labels": {label: [_encode_key(n) for n in members]
+                        for label, members in sorted(state.node_labels.as_dict().items())},
+        "context": context_desc[0] if context_desc else None,
+        "precision": ([state.precision.storage.str, state.precision.compute.str]
+                      if state.precision is not None else None),
+    }
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    data_start = _align(_PREAMBLE.size + len(header_bytes), _HEADER_ALIGN)
+    arrays = zip(node_arrays + edge_arrays + context_arrays, node_desc + edge_desc + context_desc)
+
+    if codec == _CODEC_NONE:
+        # Write the arrays straight into the output buffer: one allocation, no copies
+        out = bytearray(data_start + end)
+        _write_arrays(out, arrays, data_start)
+        body_len = end
+    else:
+        payload = bytearray(end)
+        _write_arrays(payload, arrays, 0)
+        body = _compress(payload, codec, level)
+        del payload
+        out = bytearray(data_start + len(body))
+        out[data_start:] = body
+        body_len = len(body)
+
+    _PREAMBLE.pack_into(out, 0, MAGIC, FORMAT_VERSION, codec, 0, len(header_bytes), body_len)
+    out[_PREAMBLE.size:_PREAMBLE.size + len(header_bytes)] = header_bytes
+    return out
+
+
+def _read_array(buffer, descriptor: list, copy: bool) -> np.ndarray:
+    dtype_str, shape, offset = descriptor
+    dtype = np.dtype(dtype_str)
+    count = int(np.prod(shape, dtype=np.int64))
+    arr = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset).reshape(shape)
+    return arr.copy() if copy else arr
+
+
+def state_from_bytes(data, copy: bool = False) -> KState:
+    """
+    Deserialize a K-state produced by `state_to_bytes`.
+
+    Uncompressed node, edge and context arrays are views into ``data``
+    (read-only if ``data`` is immutable) unless ``copy`` is True.
+
+    Args:
+        data: Bytes-like object (bytes, bytearray, memoryview, np.memmap)
+        copy: Copy arrays out of the buffer instead of viewing it
+
+    Returns:
+        Deserialized K-state
+    """
+    view = memoryview(data).cast("B")
+    if len(view) < _PREAMBLE.size:
+        raise ValueError("Buffer too small to contain a serialized KState")
+    magic, version, codec, _, header_len, payload_len = _PREAMBLE.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a serialized KState (bad magic)")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported KState format version {version}")
+
+    header = json.loads(bytes(view[_PREAMBLE.size:_PREAMBLE.size + header_len]).decode("utf-8"))
+    data_start = _align(_PREAMBLE.size + header_len, _HEADER_ALIGN)
+    payload = view[data_start:data_start + payload_len]
+    if codec != _CODEC_NONE:
+        payload = _decompress(payload, codec)
+
+    nodes = {_decode_key(entry[0]): _read_array(payload, entry[1:], copy) for entry in header["nodes"]}
+    edges = {_decode_key(entry[0]): _read_array(payload, entry[1:], copy) for entry in header["edges"]}
+    context = _read_array(payload, header["context"], copy) if header["context"] is not None else None
+    node_labels = KNodeLabels()
+    for label, members in header.get("node_labels", {}).items():
+        node_labels.tag(label, [_decode_key(n) for n in members])
+    precision = header.get("precision")
+    if precision is not None:
+        precision = KPrecision(np.dtype(precision[0]), np.dtype(precision[1]))
+    return KState._wrap(nodes, edges, header["labels"], context, node_labels, precision)
+
+
+def save_state(state: KState, path: Union[str, Path], compression: Optional[str] = None, level: int = 6) -> None:
+    """
+    Write a K-state to a file.
+
+    Args:
+        state: K-state to save
+        path: Destination file
+        compression: None, "zlib" or "lz4"
+        level: Compression level for zlib
+    """
+    Path(path).write_bytes(state_to_bytes(state, compression=compression, level=level))
+
+
+def load_state(path: Union[str, Path], mmap_mode: Optional[str] = "r") -> KState:
+    """
+    Load a K-state from a file.
+
+    With ``mmap_mode`` set (default "r"), the file is memory-mapped and the
+    arrays of an uncompressed state are views into the mapping. Use "c" for
+    writable copy-on-write arrays, or None to read the whole file into memory.
+
+    Args:
+        path: Source file
+        mmap_mode: np.memmap mode ("r", "c") or None
+
+    Returns:
+        Loaded K-state
+    """
+    path = Path(path)
+    if mmap_mode is None or path.stat().st_size == 0:
+        return state_from_bytes(path.read_bytes())
+    return state_from_bytes(np.memmap(path, dtype=np.uint8, mode=mmap_mode))
@@ -7,9 +7,38 @@ A K-state is a triple (x, λ, c) where:
 - c is a control/context vector
 """
 
-from typing import Dict, Set, Optional, Tuple, Any
+from typing import Dict, Set, FrozenSet, Iterable, Optional, Tuple, Any, Union, NamedTuple
+from pathlib import Path
+import itertools
 import numpy as np
-import copy
+
+from kmath.core.labels import KLabelSet, KNodeLabels, as_label_set
+from kmath.core.topology import KTopology
+from kmath.core.precision import KPrecision, as_precision
+
+
+# Number of ancestor states a state keeps change records for
+MAX_DELTA_HISTORY = 8
+
+_state_versions = itertools.count()
+
+
+class KDelta(NamedTuple):
+    """
+    Record of what differs between a state and one of its ancestors.
+    
+    Attributes:
+        nodes: IDs of nodes whose state changed (or that were added/removed)
+        edges: IDs of edges whose weight changed (or that were added/removed)
+        context: Whether the context vector changed
+    """
+    nodes: FrozenSet[Any] = frozenset()
+    edges: FrozenSet[Tuple[Any, Any]] = frozenset()
+    context: bool = False
+    
+    def merge(self, other: 'KDelta') -> 'KDelta':
+        """Combine two consecutive change records."""
+        return KDelta(self.nodes | other.nodes, self.edges | other.edges, self.context or other.context)
 
 
 class KState:
@@ -19,8 +48,15 @@ class KState:
     Attributes:
         nodes (Dict[Any, np.ndarray]): Mapping from node IDs to state vectors
         edges (Dict[Tuple[Any, Any], np.ndarray]): Mapping from edge IDs to weight vectors
-        labels (Set[str]): Finite set of labels (tags, types, roles)
+        labels (KLabelSet): Finite set of labels (tags, types, roles)
         context (Optional[np.ndarray]): Control/context vector
+        node_labels (KNodeLabels): Per-node labels with label → node index
+        precision (Optional[KPrecision]): dtype policy of all arrays, or None
+            if each array keeps its own dtype
+        version (int): Unique ID of this state object
+        deltas (Dict[int, KDelta]): Changes relative to recent ancestor states,
+            keyed by ancestor version (most recent first). Only operators that
+            track changes fill this in; it is empty for states built directly.
     """
     
     def __init__(
@@ -28,7 +64,9 @@ class KState:
         nodes: Dict[Any, np.ndarray],
         edges: Dict[Tuple[Any, Any], np.ndarray],
         labels: Optional[Set[str]] = None,
-        context: Optional[np.ndarray] = None
+        context: Optional[np.ndarray] = None,
+        node_labels: Optional[Dict[str, Iterable[Any]]] = None,
+        dtype: Union[KPrecision, str, type, np.dtype, None] = None
     ):
         """
         Initialize a K-state.
@@ -38,21 +76,217 @@ class KState:
             edges: Dictionary mapping (source, target) tuples to edge weight vectors
             labels: Set of string labels (default: empty set)
             context: Context vector as np.ndarray (default: None)
+            node_labels: Mapping from label to the node IDs carrying it (default: none)
+            dtype: Precision policy: "float64", "float32", "float16" (float16
+                storage, float32 compute) or a KPrecision. Default None keeps
+                the dtype numpy infers for each array.
         """
-        self.nodes = {k: np.array(v) for k, v in nodes.items()}
-        self.edges = {k: np.array(v) for k, v in edges.items()}
-        self.labels = set(labels or [])
-        self.context = np.array(context) if context is not None else None
+        self.precision = as_precision(dtype)
+        storage = self.precision.storage if self.precision is not None else None
+        self.nodes = {k: np.array(v, dtype=storage) for k, v in nodes.items()}
+        self.edges = {k: np.array(v, dtype=storage) for k, v in edges.items()}
+        self.labels = KLabelSet(labels or [])
+        self.context = np.array(context, dtype=storage) if context is not None else None
+        self.node_labels = KNodeLabels()
+        for label, node_ids in (node_labels or {}).items():
+            self.node_labels.tag(label, node_ids)
+        self.version = next(_state_versions)
+        self.deltas: Dict[int, KDelta] = {}
+        self._topology: Optional[KTopology] = None
+    
+    @classmethod
+    def from_arrays(
+        cls,
+        nodes: Dict[Any, np.ndarray],
+        edges: Dict[Tuple[Any, Any], np.ndarray],
+        labels: Optional[Iterable[str]] = None,
+        context: Optional[np.ndarray] = None,
+        node_labels: Optional[Dict[str, Iterable[Any]]] = None,
+        dtype: Union[KPrecision, str, type, np.dtype, None] = None,
+        copy: bool = False
+    ) -> 'KState':
+        """
+        Build a state from existing arrays, validating them once.
+        
+        Unlike `__init__`, arrays are used as given (no copy) unless `copy`
+        is True or a conversion to the policy dtype is needed. The dicts
+        themselves are copied shallowly. Inputs that are not arrays are
+        converted with ``np.asarray``.
+        
+        Args:
+            nodes: Dictionary mapping node IDs to state arrays
+            edges: Dictionary mapping (source, target) tuples to edge weight arrays
+            labels: Set of string labels (default: empty set)
+            context: Context vector (default: None)
+            node_labels: Mapping from label to the node IDs carrying it (default: none)
+            dtype: Precision policy (see `__init__`)
+            copy: Copy every array
+            
+        Returns:
+            New K-state
+            
+        Raises:
+            TypeError: If an array has dtype=object
+            ValueError: If an edge ID is not a (source, target) pair
+        """
+        precision = as_precision(dtype)
+        storage = precision.storage if precision is not None else None
+        
+        def check(value: Any) -> np.ndarray:
+            arr = np.array(value, dtype=storage) if copy else np.asarray(value, dtype=storage)
+            if arr.dtype.hasobject:
+                raise TypeError("K-state arrays must have a numeric dtype, got dtype=object")
+            return arr
+        
+        for edge_id in edges:
+            if not (isinstance(edge_id, tuple) and len(edge_id) == 2):
+                raise ValueError(f"Edge IDs must be (source, target) pairs, got {edge_id!r}")
+        index = KNodeLabels()
+        for label, node_ids in (node_labels or {}).items():
+            index.tag(label, node_ids)
+        return cls._wrap(
+            {k: check(v) for k, v in nodes.items()},
+            {k: check(v) for k, v in edges.items()},
+            KLabelSet(labels or ()),
+            check(context) if context is not None else None,
+            index,
+            precision,
+        )
+    
+    @classmethod
+    def _wrap(
+        cls,
+        nodes: Dict[Any, np.ndarray],
+        edges: Dict[Tuple[Any, Any], np.ndarray],
+        labels: Iterable[str],
+        context: Optional[np.ndarray],
+        node_labels: Optional[KNodeLabels] = None,
+        precision: Optional[KPrecision] = None
+    ) -> 'KState':
+        """
+        Build a state around existing arrays without copying or checking them.
+        
+        This is the internal fast constructor: callers guarantee that the
+        arrays are valid and already follow `precision`, and hand over
+        ownership of the dicts and label objects.
+        """
+        state = cls.__new__(cls)
+        state.nodes = nodes
+        state.edges = edges
+        state.labels = as_label_set(labels)
+        state.context = context
+        state.node_labels = node_labels if node_labels is not None else KNodeLabels()
+        state.precision = precision
+        state.version = next(_state_versions)
+        state.deltas = {}
+        state._topology = None
+        return state
+    
+    def _derive(
+        self,
+        nodes: Optional[Dict[Any, np.ndarray]] = None,
+        edges: Optional[Dict[Tuple[Any, Any], np.ndarray]] = None,
+        context: Any = ...,
+        labels: Optional[KLabelSet] = None
+    ) -> 'KState':
+        """
+        New state that replaces some components and shares all others.
+        
+        Used by operators: unchanged node and edge arrays are shared (the
+        dicts are copied shallowly), labels and per-node labels are copied
+        cheaply, and the precision policy and adjacency index are carried
+        over.
+        
+        Args:
+            nodes: New node dict (ownership is taken), or None to share
+            edges: New edge dict (ownership is taken), or None to share
+            context: New context, or ... to keep the current one
+            labels: New label set (ownership is taken), or None to copy
+            
+        Returns:
+            Derived K-state
+        """
+        state = KState._wrap(
+            dict(self.nodes) if nodes is None else nodes,
+            dict(self.edges) if edges is None else edges,
+            self.labels.copy() if labels is None else labels,
+            self.context if context is ... else context,
+            self.node_labels.copy(),
+            self.precision,
+        )
+        state._topology = self._topology  # revalidated lazily by topology()
+        return state
+    
+    def topology(self) -> KTopology:
+        """
+        Adjacency index of the edge set, built lazily and cached.
+        
+        The cache is validated against the current edge IDs, so direct
+        modification of `edges` is picked up on the next call.
+        """
+        if self._topology is None or not self._topology.matches(self.edges):
+            self._topology = KTopology(self.edges.keys())
+        return self._topology
+    
+    def record_changes(self, parent: 'KState', delta: KDelta) -> None:
+        """
+        Record that this state was derived from `parent` by changing only
+        the entries listed in `delta`.
+        
+        Change records of the parent are extended so that this state also
+        knows what changed relative to the parent's recent ancestors.
+        
+        Args:
+            parent: State this state was computed from
+            delta: Entries that differ from `parent`
+        """
+        deltas = {parent.version: delta}
+        for base, older in parent.deltas.items():
+            if len(deltas) >= MAX_DELTA_HISTORY:
+                break
+            deltas[base] = older.merge(delta)
+        self.deltas = deltas
+    
+    def changes_since(self, version: int) -> Optional[KDelta]:
+        """
+        Changes relative to an ancestor state.
+        
+        Args:
+            version: Version of the ancestor state
+            
+        Returns:
+            KDelta, or None if no change record for that ancestor exists
+        """
+        if version == self.version:
+            return KDelta()
+        return self.deltas.get(version)
     
     def copy(self) -> 'KState':
-        """Create a deep copy of this state."""
-        return KState(
-            nodes=copy.deepcopy(self.nodes),
-            edges=copy.deepcopy(self.edges),
-            labels=copy.deepcopy(self.labels),
-            context=copy.deepcopy(self.context)
+        """Create a deep copy of this state (every array is copied once)."""
+        return KState._wrap(
+            {k: np.array(v) for k, v in self.nodes.items()},
+            {k: np.array(v) for k, v in self.edges.items()},
+            self.labels.copy(),
+            np.array(self.context) if self.context is not None else None,
+            self.node_labels.copy(),
+            self.precision,
         )
     
+    def astype(self, dtype: Union[KPrecision, str, type, np.dtype, None]) -> 'KState':
+        """
+        Copy of the state under another precision policy.
+        
+        Args:
+            dtype: Precision policy (see `__init__`)
+            
+        Returns:
+            New K-state with all arrays converted
+        """
+        new_state = KState.from_arrays(self.nodes, self.edges, self.labels, self.context,
+                                       dtype=dtype, copy=True)
+        new_state.node_labels = self.node_labels.copy()
+        return new_state
+    
     def __eq__(self, other: 'KState') -> bool:
         """Check equality of two K-states."""
         if not isinstance(other, KState):
@@ -73,7 +307,7 @@ class KState:
                 return False
         
         # Check labels
-        if self.labels != other.labels:
+        if self.labels != other.labels or self.node_labels != other.node_labels:
             return False
         
         # Check context
@@ -83,6 +317,62 @@ class KState:
             return False
         return np.allclose(self.context, other.context)
     
+    def to_bytes(self, compression: Optional[str] = None, level: int = 6) -> bytearray:
+        """
+        Serialize the state to a compact binary buffer.
+        
+        Args:
+            compression: None, "zlib" or "lz4" (falls back to zlib if lz4 is unavailable)
+            level: Compression level for zlib
+            
+        Returns:
+            Serialized state as a bytearray (see `kmath.core.serialization`)
+        """
+        from kmath.core.serialization import state_to_bytes
+        return state_to_bytes(self, compression=compression, level=level)
+    
+    @classmethod
+    def from_bytes(cls, data, copy: bool = False) -> 'KState':
+        """
+        Deserialize a state produced by `to_bytes`.
+        
+        Args:
+            data: Bytes-like buffer
+            copy: If False, uncompressed arrays are zero-copy views into `data`
+            
+        Returns:
+            Deserialized K-state
+        """
+        from kmath.core.serialization import state_from_bytes
+        return state_from_bytes(data, copy=copy)
+    
+    def save(self, path: Union[str, Path], compression: Optional[str] = None, level: int = 6) -> None:
+        """
+        Save the state to a file in the binary format of `to_bytes`.
+        
+        Args:
+            path: Destination file
+            compression: None, "zlib" or "lz4"
+            level: Compression level for zlib
+        """
+        from kmath.core.serialization import save_state
+        save_state(self, path, compression=compression, level=level)
+    
+    @classmethod
+    def load(cls, path: Union[str, Path], mmap_mode: Optional[str] = "r") -> 'KState':
+        """
+        Load a state saved with `save`.
+        
+        Args:
+            path: Source file
+            mmap_mode: np.memmap mode for zero-copy reads ("r", "c"), or None to read into memory
+            
+        Returns:
+            Loaded K-state
+        """
+        from kmath.core.serialization import load_state
+        return load_state(path, mmap_mode=mmap_mode)
+    
     def __repr__(self) -> str:
         """String representation of K-state."""
         return (f"KState(nodes={len(self.nodes)}, edges={len(self.edges)}, "
@@ -0,0 +1,274 @@
+"""
+Stochastic K-Math: operators O: S × Ω → S and ensemble statistics.
+
+Randomness is drawn from ``np.random.Generator`` streams. A run binds its
+stream with `rng_stream`; every stochastic operator applied inside the
+block draws from it. Ensembles give each realization its own stream,
+spawned from one ``np.random.SeedSequence``, and reduce node states with
+streaming (Welford) moments over fixed blocks of realizations, so the
+result is bit-for-bit reproducible for a given seed whatever the number of
+worker threads.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+import numpy as np
+
+from kmath.core.state import KState
+from kmath.core.operators import KOperator
+from kmath.core.program import KProgram
+from kmath.core.recurrence import KRecurrence
+
+
+_current_rng: ContextVar[Optional[np.random.Generator]] = ContextVar("kmath_rng", default=None)
+
+
+@contextmanager
+def rng_stream(rng: Union[np.random.Generator, int, None]) -> Iterator[np.random.Generator]:
+    """
+    Bind a random stream for stochastic operators applied in this block.
+
+    The binding is per thread (and per asyncio task), so concurrent runs can
+    use different streams.
+
+    Args:
+        rng: Generator, or seed for a new one
+
+    Yields:
+        The bound generator
+    """
+    generator = np.random.default_rng(rng)
+    token = _current_rng.set(generator)
+    try:
+        yield generator
+    finally:
+        _current_rng.reset(token)
+
+
+def current_rng() -> Optional[np.random.Generator]:
+    """Generator bound by the innermost `rng_stream`, or None."""
+    return _current_rng.get()
+
+
+class KStochasticOperator(KOperator):
+    """
+    Stochastic operator: O(s, ω) with ω drawn from a random stream.
+
+    The stream bound with `rng_stream` is used if present; otherwise the
+    operator falls back to its own generator, seeded at construction.
+    Each application draws anew, so expression evaluation never reuses a
+    result (see `KOperator.memoizable`).
+    """
+
+    memoizable = False
+
+    def __init__(
+        self,
+        func: Callable[[KState, np.random.Generator], KState],
+        seed: Union[int, np.random.SeedSequence, None] = None
+    ):
+        """
+        Initialize a stochastic operator.
+
+        Args:
+            func: Function (state, rng) → state
+            seed: Seed of the fallback generator
+        """
+        self.stochastic_func = func
+        self.rng = np.random.default_rng(seed)
+        super().__init__(lambda state: self.stochastic_func(state, self._generator()))
+
+    def _generator(self) -> np.random.Generator:
+        rng = _current_rng.get()
+        return rng if rng is not None else self.rng
+
+
+class KNoiseOperator(KStochasticOperator):
+    """
+    Additive Gaussian noise on node states (and optionally edge weights).
+
+    All noise for a step is drawn with a single vectorized call and split
+    across nodes.
+    """
+
+    def __init__(
+        self,
+        scale: float,
+        include_edges: bool = False,
+        seed: Union[int, np.random.SeedSequence, None] = None
+    ):
+        """
+        Initialize a noise operator.
+
+        Args:
+            scale: Standard deviation of the noise
+            include_edges: Also perturb edge weights
+            seed: Seed of the fallback generator
+        """
+        self.scale = scale
+        self.include_edges = include_edges
+
+        def add_noise(state: KState, rng: np.random.Generator) -> KState:
+            dtype = state.precision.storage if state.precision is not None else None
+            nodes = _perturb(state.nodes, rng, self.scale, dtype)
+            edges = _perturb(state.edges, rng, self.scale, dtype) if self.include_edges else None
+            return state._derive(nodes=nodes, edges=edges)
+
+        super().__init__(add_noise, seed=seed)
+
+
+def _perturb(
+    arrays: Dict[Any, np.ndarray],
+    rng: np.random.Generator,
+    scale: float,
+    dtype: Optional[np.dtype] = None
+) -> Dict[Any, np.ndarray]:
+    """Add N(0, scale²) noise to every array, drawing all samples at once."""
+    sizes = [np.size(a) for a in arrays.values()]
+    noise = rng.standard_normal(sum(sizes)) * scale
+    if dtype is not None:
+        noise = noise.astype(dtype)
+    result = {}
+    pos = 0
+    for (key, value), size in zip(arrays.items(), sizes):
+        value = np.asarray(value)
+        result[key] = value + noise[pos:pos + size].reshape(value.shape)
+        pos += size
+    return result
+
+
+class KEnsembleResult:
+    """
+    Streaming moments of node states over an ensemble of realizations.
+
+    Attributes:
+        count (int): Number of realizations
+        mean (Dict[Any, np.ndarray]): Mean of each node state
+        m2 (Dict[Any, np.ndarray]): Sum of squared deviations of each node state
+    """
+
+    def __init__(self, count: int, mean: Dict[Any, np.ndarray], m2: Dict[Any, np.ndarray]):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    def variance(self, ddof: int = 0) -> Dict[Any, np.ndarray]:
+        """
+        Variance of each node state.
+
+        Args:
+            ddof: Delta degrees of freedom (1 for the sample variance)
+
+        Returns:
+            Mapping node ID → variance
+        """
+        return {k: v / max(self.count - ddof, 1) for k, v in self.m2.items()}
+
+    def std(self, ddof: int = 0) -> Dict[Any, np.ndarray]:
+        """Standard deviation of each node state."""
+        return {k: np.sqrt(v) for k, v in self.variance(ddof).items()}
+
+    def mean_state(self, template: KState) -> KState:
+        """State with node values replaced by their ensemble means."""
+        nodes = dict(self.mean)
+        if template.precision is not None:
+            nodes = {k: template.precision.to_storage(v) for k, v in nodes.items()}
+        return template._derive(nodes=nodes)
+
+    def __repr__(self) -> str:
+        return f"KEnsembleResult(count={self.count}, nodes={len(self.mean)})"
+
+
+class _Welford:
+    """Welford accumulator over flattened node vectors."""
+
+    def __init__(self, size: int):
+        self.count = 0
+        self.mean = np.zeros(size)
+        self.m2 = np.zeros(size)
+
+    def add(self, x: np.ndarray) -> None:
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+    def merge(self, other: '_Welford') -> None:
+        """Chan et al. pairwise combination."""
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean = self.mean + delta * (other.count / total)
+        self.m2 = self.m2 + other.m2 + delta ** 2 * (self.count * other.count / total)
+        self.count = total
+
+
+def run_ensemble(
+    dynamics: Union[KProgram, KOperator],
+    initial_state: KState,
+    steps: int,
+    realizations: int,
+    seed: Union[int, np.random.SeedSequence, None] = None,
+    workers: int = 1,
+    block_size: int = 64
+) -> KEnsembleResult:
+    """
+    Run independent realizations and accumulate moments of the final node states.
+
+    Realization i draws from stream i of ``SeedSequence(seed).spawn``.
+    Realizations are grouped into fixed blocks of `block_size`; each block is
+    reduced with Welford's algorithm and blocks are merged in order, so no
+    trajectory is stored and the result does not depend on `workers`.
+
+    Args:
+        dynamics: K-program (run for `steps`) or K-operator (iterated `steps` times)
+        initial_state: Initial state of every realization
+        steps: Number of steps per realization
+        realizations: Number of realizations
+        seed: Root seed
+        workers: Number of worker threads
+        block_size: Realizations per reduction block
+
+    Returns:
+        KEnsembleResult with per-node mean and variance
+    """
+    if isinstance(dynamics, KProgram):
+        run = dynamics.run
+    else:
+        run = KRecurrence(recurrence_map=dynamics).iterate
+
+    node_ids = list(initial_state.nodes)
+    shapes = [np.shape(initial_state.nodes[n]) for n in node_ids]
+    sizes = [int(np.prod(shape, dtype=np.int64)) for shape in shapes]
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    streams = root.spawn(realizations)
+    blocks = [streams[i:i + block_size] for i in range(0, realizations, block_size)]
+
+    def run_block(block: List[np.random.SeedSequence]) -> _Welford:
+        acc = _Welford(sum(sizes))
+        for stream in block:
+            with rng_stream(np.random.Generator(np.random.PCG64(stream))):
+                final = run(initial_state, steps)
+            acc.add(np.concatenate([np.ravel(final.nodes[n]) for n in node_ids]).astype(float))
+        return acc
+
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            partials = list(pool.map(run_block, blocks))
+    else:
+        partials = [run_block(block) for block in blocks]
+
+    total = _Welford(sum(sizes))
+    for partial in partials:
+        total.merge(partial)
+
+    mean, m2 = {}, {}
+    pos = 0
+    for node_id, shape, size in zip(node_ids, shapes, sizes):
+        mean[node_id] = total.mean[pos:pos + size].reshape(shape)
+        m2[node_id] = total.m2[pos:pos + size].reshape(shape)
+        pos += size
+    return KEnsembleResult(total.count, mean, m2)
@@ -0,0 +1,248 @@
+"""
+K-Topology: adjacency indices over the edge set of a K-state.
+
+Operators that need incident edges or neighbours use these indices instead
+of scanning every edge for every node. The index also keeps the edge list
+as integer endpoint arrays (for vectorized kernels). These arrays grow
+geometrically, removed edges leave tombstones, and the arrays are compacted
+once tombstones outnumber live edges. Bulk insertions and deletions
+therefore update the index in time proportional to the change.
+"""
+
+from typing import Any, Dict, Iterable, KeysView, List, Optional, Tuple
+import numpy as np
+
+
+_MIN_CAPACITY = 16
+_MIN_COMPACT = 32
+
+
+class KTopology:
+    """
+    Adjacency index for the directed graph G = (V, E) of a K-state.
+
+    Attributes:
+        in_edges (Dict[Any, Dict[Tuple, None]]): Node ID → incoming edge IDs, in insertion order
+        out_neighbors (Dict[Any, Dict[Any, None]]): Node ID → targets of outgoing edges
+        node_ids (List[Any]): Node index → node ID for every endpoint seen
+        node_index (Dict[Any, int]): Node ID → node index
+    """
+
+    def __init__(self, edge_ids: Iterable[Tuple[Any, Any]] = ()):
+        """
+        Build the index from edge IDs.
+
+        Args:
+            edge_ids: Iterable of (source, target) tuples
+        """
+        self.in_edges: Dict[Any, Dict[Tuple[Any, Any], None]] = {}
+        self.out_neighbors: Dict[Any, Dict[Any, None]] = {}
+        self.node_ids: List[Any] = []
+        self.node_index: Dict[Any, int] = {}
+        self.edge_slot: Dict[Tuple[Any, Any], int] = {}
+        self._slot_keys: List[Optional[Tuple[Any, Any]]] = []
+        self._src = np.empty(_MIN_CAPACITY, dtype=np.int64)
+        self._dst = np.empty(_MIN_CAPACITY, dtype=np.int64)
+        self._alive = np.zeros(_MIN_CAPACITY, dtype=bool)
+        self._tombstones = 0
+        self._bound: Optional[dict] = None
+        self.add_edges(edge_ids)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def matches(self, edges: Dict[Tuple[Any, Any], Any]) -> bool:
+        """
+        Check whether the index still describes the given edge dict.
+
+        The index remembers the dict it was last validated against; for that
+        dict only the size is compared. Other dicts are compared key by key.
+        """
+        if edges is self._bound and len(edges) == len(self.edge_slot):
+            return True
+        if self.edge_slot.keys() == edges.keys():
+            self._bound = edges
+            return True
+        return False
+
+    def bind(self, edges: Dict[Tuple[Any, Any], Any]) -> None:
+        """Declare that the index describes `edges` (used by structural operators)."""
+        self._bound = edges
+
+    def incoming(self, node_id: Any) -> KeysView:
+        """Incoming edge IDs of a node."""
+        return self.in_edges.get(node_id, {}).keys()
+
+    def successors(self, node_id: Any) -> KeysView:
+        """Targets of outgoing edges of a node."""
+        return self.out_neighbors.get(node_id, {}).keys()
+
+    def predecessors(self, node_id: Any) -> List[Any]:
+        """Sources of incoming edges of a node."""
+        return [u for (u, _) in self.incoming(node_id)]
+
+    def edge_arrays(self) -> Tuple[List[Tuple[Any, Any]], np.ndarray, np.ndarray]:
+        """
+        Live edges as endpoint index arrays.
+
+        Returns:
+            (edge_ids, src, dst) where src[i], dst[i] are the node indices
+            (see `node_ids`) of the endpoints of edge_ids[i]. Edges are in
+            insertion order, matching the order of the state's edge dict.
+        """
+        n = len(self._slot_keys)
+        if self._tombstones == 0:
+            return list(self._slot_keys), self._src[:n].copy(), self._dst[:n].copy()
+        alive = self._alive[:n]
+        edge_ids = [k for k in self._slot_keys if k is not None]
+        return edge_ids, self._src[:n][alive], self._dst[:n][alive]
+
+    @property
+    def num_edges(self) -> int:
+        """Number of live edges."""
+        return len(self.edge_slot)
+
+    @property
+    def capacity(self) -> int:
+        """Allocated length of the endpoint arrays."""
+        return len(self._src)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def _node(self, node_id: Any) -> int:
+        index = self.node_index.get(node_id)
+        if index is None:
+            index = len(self.node_ids)
+            self.node_index[node_id] = index
+            self.node_ids.append(node_id)
+        return index
+
+    def _reserve(self, extra: int) -> None:
+        needed = len(self._slot_keys) + extra
+        capacity = len(self._src)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ("_src", "_dst", "_alive"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def add_edges(self, edge_ids: Iterable[Tuple[Any, Any]]) -> List[Tuple[Any, Any]]:
+        """
+        Insert edges (existing edges are ignored).
+
+        Args:
+            edge_ids: Edges to insert
+
+        Returns:
+            Edges that were actually inserted
+        """
+        new_edges = [e for e in dict.fromkeys(edge_ids) if e not in self.edge_slot]
+        self._reserve(len(new_edges))
+        for edge_id in new_edges:
+            u, v = edge_id
+            slot = len(self._slot_keys)
+            self._slot_keys.append(edge_id)
+            self.edge_slot[edge_id] = slot
+            self._src[slot] = self._node(u)
+            self._dst[slot] = self._node(v)
+            self._alive[slot] = True
+            self.in_edges.setdefault(v, {})[edge_id] = None
+            self.out_neighbors.setdefault(u, {})[v] = None
+        return new_edges
+
+    def remove_edges(self, edge_ids: Iterable[Tuple[Any, Any]]) -> List[Tuple[Any, Any]]:
+        """
+        Delete edges, leaving tombstones in the endpoint arrays.
+
+        Args:
+            edge_ids: Edges to delete (missing edges are ignored)
+
+        Returns:
+            Edges that were actually removed
+        """
+        removed = []
+        for edge_id in edge_ids:
+            slot = self.edge_slot.pop(edge_id, None)
+            if slot is None:
+                continue
+            u, v = edge_id
+            self._slot_keys[slot] = None
+            self._alive[slot] = False
+            self._tombstones += 1
+            del self.in_edges[v][edge_id]
+            if not self.in_edges[v]:
+                del self.in_edges[v]
+            del self.out_neighbors[u][v]
+            if not self.out_neighbors[u]:
+                del self.out_neighbors[u]
+            removed.append(edge_id)
+        if self._tombstones > max(_MIN_COMPACT, len(self.edge_slot)):
+            self.compact()
+        return removed
+
+    def incident_edges(self, node_ids: Iterable[Any]) -> List[Tuple[Any, Any]]:
+        """All edges into or out of the given nodes."""
+        incident = {}
+        for node_id in node_ids:
+            incident.update(self.in_edges.get(node_id, {}))
+            for v in self.out_neighbors.get(node_id, {}):
+                incident[(node_id, v)] = None
+        return list(incident)
+
+    def backward_cone(self, node_ids: Iterable[Any], hops: int) -> List[List[Any]]:
+        """
+        Nodes that can influence `node_ids` within `hops` steps along incoming edges.
+
+        Args:
+            node_ids: Target nodes
+            hops: Maximum number of edges to walk backwards
+
+        Returns:
+            Layers [L_0, L_1, ...] where L_h holds the nodes at backward
+            distance exactly h (L_0 are the targets). Empty layers are dropped
+            from the end.
+        """
+        seen = dict.fromkeys(node_ids)
+        layers = [list(seen)]
+        for _ in range(hops):
+            layer = []
+            for v in layers[-1]:
+                for (u, _) in self.in_edges.get(v, {}):
+                    if u not in seen:
+                        seen[u] = None
+                        layer.append(u)
+            if not layer:
+                break
+            layers.append(layer)
+        return layers
+
+    def compact(self) -> None:
+        """Drop tombstones and unreferenced node indices."""
+        edge_ids = [k for k in self._slot_keys if k is not None]
+        n = len(edge_ids)
+        capacity = max(_MIN_CAPACITY, 1 << max(n - 1, 0).bit_length())
+        self.node_ids = []
+        self.node_index = {}
+        self.edge_slot = {}
+        self._slot_keys = edge_ids
+        self._src = np.empty(capacity, dtype=np.int64)
+        self._dst = np.empty(capacity, dtype=np.int64)
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._alive[:n] = True
+        self._tombstones = 0
+        for slot, (u, v) in enumerate(edge_ids):
+            self.edge_slot[(u, v)] = slot
+            self._src[slot] = self._node(u)
+            self._dst[slot] = self._node(v)
+
+    def __repr__(self) -> str:
+        """String representation of the index."""
+        return (f"KTopology(edges={self.num_edges}, nodes={len(self.node_ids)}, "
+                f"capacity={self.capacity})")
@@ -9,6 +9,8 @@ import numpy as np
 from typing import Dict, List, Tuple, Callable
 from kmath.core.state import KState
 from kmath.core.operators import KNodeUpdateOperator
+from kmath.core.monitors import ResidualNorm, run_monitored
+from kmath.core.program import query_nodes
 
 
 class GNNDynamics:
@@ -155,6 +157,31 @@ class GNNDynamics:
         
         return trajectory
     
+    def query(
+        self,
+        initial_state: KState,
+        node_ids: List,
+        num_iterations: int
+    ) -> Dict[any, np.ndarray]:
+        """
+        Features of selected nodes after message passing, computed on their
+        `num_iterations`-hop neighbourhood only.
+        
+        Args:
+            initial_state: Initial graph state
+            node_ids: Nodes to report
+            num_iterations: Number of message-passing iterations
+            
+        Returns:
+            Dict mapping each requested node ID to its final features
+        """
+        return query_nodes(
+            initial_state,
+            node_ids,
+            num_iterations,
+            lambda state, t, nodes: self.get_full_operator(state).apply_subset(state, nodes),
+        )
+    
     def steady_state(
         self,
         initial_state: KState,
@@ -172,21 +199,10 @@ class GNNDynamics:
         Returns:
             Steady state
         """
-        current_state = initial_state
-        
-        for _ in range(max_iterations):
-            operator = self.get_full_operator(current_state)
-            next_state = operator(current_state)
-            
-            # Check convergence
-            max_diff = 0.0
-            for node_id in current_state.nodes:
-                diff = np.linalg.norm(next_state.nodes[node_id] - current_state.nodes[node_id])
-                max_diff = max(max_diff, diff)
-            
-            if max_diff < tolerance:
-                return next_state
-            
-            current_state = next_state
-        
-        return current_state
+        result = run_monitored(
+            lambda state, t: self.get_full_operator(state)(state),
+            initial_state,
+            max_iterations,
+            [ResidualNorm(tolerance)],
+        )
+        return result.state
@@ -7,7 +7,8 @@ Implements the discrete-time LTI system:
 
 import numpy as np
 from kmath.core.state import KState
-from kmath.core.operators import KOperator
+from kmath.core.linear import KLinearOperator
+from kmath.analysis.stability import solve_discrete_lyapunov
 
 
 class LTISystem:
@@ -39,6 +40,7 @@ class LTISystem:
         
         self.state_dim = self.A.shape[0]
         self.control_dim = self.B.shape[1]
+        self._impulse = np.zeros((0, self.state_dim, self.control_dim))
     
     def create_initial_state(self, x0: np.ndarray, u0: np.ndarray = None) -> KState:
         """
@@ -54,48 +56,44 @@ class LTISystem:
         if u0 is None:
             u0 = np.zeros(self.control_dim)
         
-        return KState(
+        return KState.from_arrays(
             nodes={'x': np.array(x0)},
             edges={},
             labels={'lti_system'},
             context=np.array(u0)
         )
     
-    def get_operator(self) -> KOperator:
+    def get_operator(self) -> KLinearOperator:
         """
         Get the K-operator implementing the LTI dynamics.
         
+        The operator is a KLinearOperator on node 'x' with the context as
+        control input (treated as zero when absent), so compositions, long
+        runs and fixed points use closed-form matrix algebra.
+        
         Returns:
             K-operator that applies x_{t+1} = A x_t + B u_t
         """
-        def lti_step(state: KState) -> KState:
-            x_t = state.nodes['x']
-            u_t = state.context if state.context is not None else np.zeros(self.control_dim)
-            
-            # Apply LTI dynamics
-            x_next = self.A @ x_t + self.B @ u_t
-            
-            # Create next state (control remains the same)
-            return KState(
-                nodes={'x': x_next},
-                edges={},
-                labels=state.labels,
-                context=u_t
-            )
-        
-        return KOperator(lti_step)
+        return KLinearOperator(self.A, node_ids=['x'], B=self.B)
     
-    def simulate(self, x0: np.ndarray, control_sequence: np.ndarray) -> np.ndarray:
+    def simulate(self, x0: np.ndarray, control_sequence: np.ndarray, method: str = "step") -> np.ndarray:
         """
         Simulate the LTI system with a control sequence.
         
         Args:
             x0: Initial state (n,)
             control_sequence: Control inputs (T x m) for T time steps
+            method: "step" applies the K-operator step by step; "fft" uses
+                `forced_response` (faster for long horizons)
             
         Returns:
             State trajectory (T+1 x n)
         """
+        if method == "fft":
+            return self.forced_response(x0, control_sequence)
+        if method != "step":
+            raise ValueError(f"Unknown method {method!r}; expected 'step' or 'fft'")
+        
         T = len(control_sequence)
         trajectory = np.zeros((T + 1, self.state_dim))
         trajectory[0] = x0
@@ -131,3 +129,122 @@ class LTISystem:
         """
         eigenvalues = self.compute_eigenvalues()
         return np.all(np.abs(eigenvalues) < 1.0)
+    
+    def steady_state(self, u: np.ndarray) -> np.ndarray:
+        """
+        Steady state under a constant input: solves (I - A) x = B u.
+        
+        Args:
+            u: Constant control input (m,)
+            
+        Returns:
+            Steady-state vector x* (n,)
+            
+        Raises:
+            np.linalg.LinAlgError: If I - A is singular (eigenvalue at 1)
+        """
+        return np.linalg.solve(np.eye(self.state_dim) - self.A, self.B @ np.asarray(u, dtype=float))
+    
+    def controllability_gramian(self) -> np.ndarray:
+        """
+        Infinite-horizon controllability Gramian W_c = Σ_t A^t B B^T (A^T)^t.
+        
+        Solves W_c = A W_c A^T + B B^T with a doubling algorithm.
+        
+        Returns:
+            Gramian (n x n)
+            
+        Raises:
+            ValueError: If the system is not stable
+        """
+        return solve_discrete_lyapunov(self.A, self.B @ self.B.T)
+    
+    def observability_gramian(self, C: np.ndarray) -> np.ndarray:
+        """
+        Infinite-horizon observability Gramian W_o = Σ_t (A^T)^t C^T C A^t.
+        
+        Solves W_o = A^T W_o A + C^T C with a doubling algorithm.
+        
+        Args:
+            C: Output matrix (p x n)
+            
+        Returns:
+            Gramian (n x n)
+            
+        Raises:
+            ValueError: If the system is not stable
+        """
+        C = np.atleast_2d(np.asarray(C, dtype=float))
+        if C.shape[1] != self.state_dim:
+            raise ValueError("C must have as many columns as A")
+        return solve_discrete_lyapunov(self.A.T, C.T @ C)
+    
+    def impulse_response(self, horizon: int) -> np.ndarray:
+        """
+        Markov parameters H_j = A^j B for j = 0, ..., horizon - 1.
+        
+        Blocks are extended by doubling (H_{k:2k} = A^k H_{0:k}), so only
+        O(log horizon) batched products are needed. Results are cached.
+        
+        Args:
+            horizon: Number of terms
+            
+        Returns:
+            Array (horizon x n x m)
+        """
+        H = self._impulse
+        if len(H) < horizon:
+            if len(H) == 0:
+                H = self.B.astype(float)[None]
+            A_k = np.linalg.matrix_power(self.A.astype(float), len(H))
+            while len(H) < horizon:
+                H = np.concatenate([H, np.einsum('ij,tjk->tik', A_k, H)])
+                A_k = A_k @ A_k
+            self._impulse = H
+        return H[:horizon]
+    
+    def free_response(self, x0: np.ndarray, horizon: int) -> np.ndarray:
+        """
+        Unforced trajectory A^t x0 for t = 0, ..., horizon, by doubling.
+        
+        Args:
+            x0: Initial state (n,)
+            horizon: Last time step
+            
+        Returns:
+            Array (horizon+1 x n)
+        """
+        X = np.asarray(x0, dtype=float).reshape(1, self.state_dim)
+        A_k = self.A.astype(float)
+        while len(X) < horizon + 1:
+            X = np.concatenate([X, X @ A_k.T])
+            A_k = A_k @ A_k
+        return X[:horizon + 1]
+    
+    def forced_response(self, x0: np.ndarray, control_sequence: np.ndarray) -> np.ndarray:
+        """
+        Trajectory from the impulse-response convolution, computed with FFT.
+        
+        x_t = A^t x0 + Σ_{k<t} A^{t-1-k} B u_k, with the convolution
+        evaluated in O(n m T log T) instead of T sequential steps.
+        
+        Args:
+            x0: Initial state (n,)
+            control_sequence: Control inputs (T x m)
+            
+        Returns:
+            State trajectory (T+1 x n), matching `simulate`
+        """
+        U = np.asarray(control_sequence, dtype=float).reshape(-1, self.control_dim)
+        T = len(U)
+        trajectory = self.free_response(x0, T)
+        if T == 0:
+            return trajectory
+        
+        H = self.impulse_response(T)
+        nfft = 1 << (2 * T - 1).bit_length()
+        Hf = np.fft.rfft(H, n=nfft, axis=0)
+        Uf = np.fft.rfft(U, n=nfft, axis=0)
+        forced = np.fft.irfft(np.einsum('fij,fj->fi', Hf, Uf), n=nfft, axis=0)[:T]
+        trajectory[1:] += forced
+        return trajectory
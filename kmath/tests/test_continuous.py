@@ -0,0 +1,77 @@
+"""
+Tests for continuous-time integration.
+"""
+
+import numpy as np
+import pytest
+from kmath.core.state import KState
+from kmath.core.linear import KLinearOperator
+from kmath.core.continuous import KVectorField, integrate
+
+
+def oscillator():
+    def field(state, t):
+        return KState({'x': state.nodes['v'], 'v': -state.nodes['x']}, {})
+    return KVectorField(field)
+
+
+def test_rk45_accuracy_and_dense_output():
+    """Test Dormand-Prince on a harmonic oscillator."""
+    state = KState({'x': np.array([1.0]), 'v': np.array([0.0])}, {('x', 'v'): np.array([1.0])})
+    result = integrate(oscillator(), state, (0.0, 10.0), rtol=1e-8, atol=1e-10, dense_output=True)
+
+    assert result.success
+    assert np.isclose(result.state.nodes['x'][0], np.cos(10.0), atol=1e-6)
+    assert np.isclose(result.state_at(5.0).nodes['x'][0], np.cos(5.0), atol=1e-5)
+    assert result.state.edges == state.edges
+    assert result.evaluations < 2000
+
+
+def test_backward_integration():
+    """Test integrating with t1 < t0."""
+    state = KState({'x': np.array([1.0]), 'v': np.array([0.0])}, {})
+    result = integrate(oscillator(), state, (0.0, -3.0), rtol=1e-8, atol=1e-10)
+
+    assert np.isclose(result.state.nodes['x'][0], np.cos(3.0), atol=1e-6)
+    assert np.isclose(result.state.nodes['v'][0], np.sin(3.0), atol=1e-6)
+
+
+def test_backward_euler_stiff():
+    """Test that the implicit method takes far fewer evaluations on a stiff problem."""
+    A = np.diag([-1e4, -1.0])
+    field = KVectorField(lambda state, t: KState({'x': A @ state.nodes['x']}, {}))
+    state = KState({'x': np.ones(2)}, {})
+
+    explicit = integrate(field, state, (0.0, 2.0), rtol=1e-3, atol=1e-6)
+    implicit = integrate(field, state, (0.0, 2.0), method="backward_euler", rtol=1e-3, atol=1e-6)
+
+    assert implicit.success
+    assert np.isclose(implicit.state.nodes['x'][1], np.exp(-2.0), rtol=0.05)
+    assert abs(implicit.state.nodes['x'][0]) < 1e-6
+    assert implicit.evaluations < explicit.evaluations
+
+
+def test_operator_relaxation():
+    """Test ds/dt = O(s) - s converging to the operator's fixed point."""
+    op = KLinearOperator(0.5 * np.eye(2), offset=[1.0, 2.0])
+    state = KState({'x': np.zeros(2)}, {})
+    result = integrate(op, state, (0.0, 40.0), method="backward_euler", rtol=1e-4)
+
+    assert np.allclose(result.state.nodes['x'], [2.0, 4.0], atol=1e-3)
+
+
+def test_budgets():
+    """Test step and evaluation budgets."""
+    state = KState({'x': np.array([1.0]), 'v': np.array([0.0])}, {})
+
+    by_evals = integrate(oscillator(), state, (0.0, 100.0), max_evaluations=50)
+    assert not by_evals.success
+    assert by_evals.evaluations == 50
+    assert by_evals.t[-1] < 100.0
+
+    by_steps = integrate(oscillator(), state, (0.0, 100.0), max_steps=5)
+    assert not by_steps.success
+    assert by_steps.steps == 5
+
+    with pytest.raises(ValueError):
+        integrate(oscillator(), state, (0.0, 1.0), method="euler")
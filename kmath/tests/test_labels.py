@@ -0,0 +1,130 @@
+"""
+Tests for interned label sets and per-node labels.
+"""
+
+import numpy as np
+import pytest
+from kmath.core.labels import KLabelSet, KNodeLabels
+from kmath.core.state import KState
+from kmath.core.operators import KNodeUpdateOperator, operator_add, KOperator
+
+
+def test_label_set_behaves_like_set():
+    """Test set semantics of KLabelSet."""
+    labels = KLabelSet({'a', 'b'})
+    labels.add('c')
+    labels.discard('a')
+    labels.discard('never-seen')
+
+    assert labels == {'b', 'c'}
+    assert 'b' in labels and 'a' not in labels
+    assert len(labels) == 2
+    assert sorted(labels) == ['b', 'c']
+    assert labels | KLabelSet({'d'}) == {'b', 'c', 'd'}
+    assert labels & {'c', 'x'} == {'c'}
+    assert labels - KLabelSet({'b'}) == {'c'}
+    assert repr(KLabelSet()) == 'set()'
+
+
+def test_label_set_copy_is_independent():
+    """Test that copies do not share mutations."""
+    labels = KLabelSet({'a'})
+    other = labels.copy()
+    other.add('b')
+
+    assert labels == {'a'}
+    assert other == {'a', 'b'}
+
+
+def test_node_labels_index():
+    """Test tagging, untagging and inverted-index queries."""
+    index = KNodeLabels()
+    index.tag('boundary', [1, 2, 3])
+    index.tag('infected', [3, 4])
+
+    assert index.nodes_with('boundary') == {1, 2, 3}
+    assert index.nodes_with_all(['boundary', 'infected']) == {3}
+    assert index.nodes_with_any(['boundary', 'infected']) == {1, 2, 3, 4}
+    assert index.labels_of(3) == {'boundary', 'infected'}
+
+    index.untag('boundary', [3])
+    index.remove_nodes([4])
+    assert index.labels_of(3) == {'infected'}
+    assert index.nodes_with('infected') == {3}
+    assert index.nodes_with('unknown') == set()
+
+
+def test_node_labels_copy_on_write():
+    """Test that copies share storage until modified."""
+    index = KNodeLabels()
+    index.tag('a', [1])
+    other = index.copy()
+    assert other.revision is index.revision
+
+    other.tag('a', [2])
+    assert index.nodes_with('a') == {1}
+    assert other.nodes_with('a') == {1, 2}
+    assert other.revision is not index.revision
+
+
+def test_state_labels_and_node_labels():
+    """Test label storage on states, equality and operator_add union."""
+    s1 = KState({'a': np.array([1.0])}, {}, {'x'}, node_labels={'role': ['a']})
+    s2 = KState({'a': np.array([1.0])}, {}, {'x'}, node_labels={'role': ['a']})
+    assert isinstance(s1.labels, KLabelSet)
+    assert s1 == s2
+
+    s2.node_labels.untag('role', ['a'])
+    assert s1 != s2
+
+    op1 = KOperator(lambda s: KState(s.nodes, s.edges, {'p'}))
+    op2 = KOperator(lambda s: KState(s.nodes, s.edges, {'q'}))
+    assert operator_add(op1, op2)(s1).labels == {'p', 'q'}
+
+
+def test_node_update_selected_by_label():
+    """Test node updates restricted to a role, including incremental mode."""
+    nodes = {i: np.array([1.0]) for i in range(4)}
+    state = KState(nodes, {}, node_labels={'active': [0, 2]})
+
+    for incremental in (False, True):
+        op = KNodeUpdateOperator(lambda x, e, c: x * 2, incremental=incremental, label='active')
+        result = op(op(state))
+        assert [result.nodes[i][0] for i in range(4)] == [4.0, 1.0, 4.0, 1.0]
+
+        # Tagging a new node is picked up on the next step
+        result.node_labels.tag('active', [3])
+        result = op(result)
+        assert [result.nodes[i][0] for i in range(4)] == [8.0, 1.0, 8.0, 2.0]
+
+
+def test_labels_pickle_across_processes():
+    """Test that pickled labels are re-interned by name in another process."""
+    import pickle
+    import subprocess
+    import sys
+
+    state = KState({'a': np.array([1.0])}, {}, {'alpha', 'beta'}, node_labels={'gamma': ['a']})
+    payload = pickle.dumps(state)
+    # the child interns other labels first, so every ID differs from this process
+    script = (
+        "import pickle, sys\n"
+        "from kmath.core.labels import intern_label\n"
+        "for label in ['infected', 'boundary', 'x', 'y', 'z', 'w']:\n"
+        "    intern_label(label)\n"
+        "s = pickle.loads(sys.stdin.buffer.read())\n"
+        "print(sorted(s.labels), sorted(s.node_labels.labels_of('a')), sorted(s.node_labels.nodes_with('gamma')))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", script], input=payload, capture_output=True, check=True)
+    assert out.stdout.decode().strip() == "['alpha', 'beta'] ['gamma'] ['a']"
+
+
+def test_intern_label_threads():
+    """Test that concurrent interning never assigns one ID to two labels."""
+    from concurrent.futures import ThreadPoolExecutor
+    from kmath.core.labels import intern_label
+
+    names = [f"thread-label-{i}" for i in range(2000)]
+    with ThreadPoolExecutor(8) as pool:
+        ids = list(pool.map(intern_label, names))
+    assert len(set(ids)) == len(names)
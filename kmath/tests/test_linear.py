@@ -0,0 +1,136 @@
+"""
+Tests for linear K-operators.
+"""
+
+import numpy as np
+import pytest
+from kmath.core.state import KState
+from kmath.core.operators import KOperator, operator_add
+from kmath.core.linear import KLinearOperator
+from kmath.core.program import KProgram
+from kmath.core.recurrence import KRecurrence
+from kmath.analysis.stability import compute_jacobian_eigenvalues, is_asymptotically_stable
+
+
+A = np.array([[0.5, 0.1], [0.0, 0.8]])
+B = np.array([[1.0], [0.5]])
+
+
+def make_state():
+    return KState({'x': np.array([1.0]), 'y': np.array([2.0])},
+                  {('x', 'y'): np.array([0.3])}, {'lin'}, np.array([0.2]))
+
+
+def iterate(op, state, steps):
+    for _ in range(steps):
+        state = op(state)
+    return state
+
+
+def test_linear_apply():
+    """Test x' = A x + B c + b on the flattened node vector."""
+    op = KLinearOperator(A, offset=np.array([0.0, 1.0]), node_ids=['x', 'y'], B=B)
+    result = op(make_state())
+
+    expected = A @ np.array([1.0, 2.0]) + B @ np.array([0.2]) + np.array([0.0, 1.0])
+    assert np.allclose([result.nodes['x'][0], result.nodes['y'][0]], expected)
+    assert np.allclose(result.edges[('x', 'y')], [0.3])
+    assert 'lin' in result.labels
+
+
+def test_linear_composition_is_matrix_product():
+    """Test that composing linear operators yields a linear operator."""
+    op1 = KLinearOperator(A, node_ids=['x', 'y'], B=B)
+    op2 = KLinearOperator(A.T, offset=np.array([1.0, 0.0]), node_ids=['x', 'y'])
+    composed = op2 * op1
+
+    assert isinstance(composed, KLinearOperator)
+    assert composed(make_state()) == op2(op1(make_state()))
+
+
+def test_linear_sum_is_simplified():
+    """Test that sums of linear operators combine exactly like the lazy sum."""
+    op1 = KLinearOperator(A, node_ids=['x', 'y'], B=B)
+    op2 = KLinearOperator(np.eye(2), node_ids=['x', 'y'])
+    other = KOperator(lambda s: s)
+
+    simplified = operator_add(op1, op2)
+    assert isinstance(simplified, KLinearOperator)
+
+    lazy = operator_add(operator_add(op1, other), op2)
+    reference = operator_add(op1, operator_add(op2, other))
+    state = make_state()
+    assert simplified(state) == operator_add(KOperator(op1), KOperator(op2))(state)
+    assert lazy(state) == reference(state)
+
+
+def test_linear_power_and_program_run():
+    """Test exponentiation by squaring against step-by-step iteration."""
+    op = KLinearOperator(A, offset=np.array([0.1, 0.0]), node_ids=['x', 'y'], B=B)
+    state = make_state()
+
+    assert op.run(state, 37) == iterate(op, state, 37)
+    assert op.power(0)(state) == state
+
+    program = KProgram([op, op])
+    assert program.linear_map() is not None
+    assert program.run(state, 10) == iterate(op, state, 20)
+    assert KRecurrence(recurrence_map=op).iterate(state, 13) == iterate(op, state, 13)
+
+
+def test_linear_fixed_point_and_stability():
+    """Test direct fixed-point solve and spectrum-based stability."""
+    op = KLinearOperator(A, offset=np.array([1.0, 1.0]), node_ids=['x', 'y'], B=B)
+    state = make_state()
+
+    fixed = KRecurrence(recurrence_map=op).find_fixed_point(state)
+    assert fixed == op(fixed)
+    assert op.is_stable()
+    assert np.isclose(op.spectral_radius(), 0.8)
+    assert np.allclose(sorted(compute_jacobian_eigenvalues(op, fixed).real), [0.5, 0.8])
+    assert is_asymptotically_stable(op, fixed)
+
+    unstable = KLinearOperator(2 * np.eye(2), node_ids=['x', 'y'])
+    assert not unstable.is_stable()
+    # Iteration diverges, but the fixed point exists and is found directly
+    assert KRecurrence(recurrence_map=unstable).find_fixed_point(state) is not None
+
+
+def test_linear_layout_mismatch():
+    """Test that a state not matching the operator dimension is rejected."""
+    op = KLinearOperator(np.eye(3))
+    with pytest.raises(ValueError):
+        op(make_state())
+
+
+def test_sparse_operator_stays_sparse():
+    """Test powers, runs and fixed points of a sparse operator without densifying."""
+    sparse = pytest.importorskip("scipy.sparse")
+    n = 200
+    rng = np.random.default_rng(0)
+    A_sparse = sparse.random(n, n, density=0.02, format="csr", random_state=1) * 0.1
+    offset = rng.standard_normal(n)
+    op = KLinearOperator(A_sparse, offset=offset)
+    dense = KLinearOperator(A_sparse.toarray(), offset=offset)
+    state = KState({i: np.array([rng.standard_normal()]) for i in range(n)}, {})
+
+    power = op.power(7)
+    assert sparse.issparse(power.A) and power.A.format == "csr"
+    assert np.allclose(op.run(state, 7).nodes[5], iterate(dense, state, 7).nodes[5])
+
+    fixed = op.fixed_point(state)
+    assert np.allclose(op(fixed).nodes[3], fixed.nodes[3])
+    assert np.allclose(fixed.nodes[3], dense.fixed_point(state).nodes[3])
+
+    # an n = 1e5 identity would need 80 GB if built densely
+    big = KLinearOperator(sparse.identity(100000, format="csr") * 0.5)
+    identity = big.identity()
+    assert sparse.issparse(identity.A) and identity.A.nnz == 100000
+
+
+def test_sparse_singular_fixed_point():
+    """Test that a singular sparse system raises LinAlgError."""
+    sparse = pytest.importorskip("scipy.sparse")
+    op = KLinearOperator(sparse.identity(2, format="csr"))
+    with pytest.raises(np.linalg.LinAlgError):
+        op.fixed_point(KState({'x': np.array([1.0]), 'y': np.array([1.0])}, {}))
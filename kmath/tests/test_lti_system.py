@@ -0,0 +1,56 @@
+"""
+Tests for the LTI system embedding.
+"""
+
+import numpy as np
+import pytest
+from kmath.examples.lti_system import LTISystem
+
+
+A = np.array([[0.9, 0.1], [0.0, 0.8]])
+B = np.array([[1.0], [0.5]])
+
+
+def test_lti_steady_state():
+    """Test closed-form steady state against long simulation."""
+    lti = LTISystem(A, B)
+    u = np.array([0.3])
+    x_ss = lti.steady_state(u)
+
+    trajectory = lti.simulate(np.zeros(2), np.tile(u, (400, 1)))
+    assert np.allclose(trajectory[-1], x_ss, atol=1e-8)
+    assert np.allclose(A @ x_ss + B @ u, x_ss)
+
+
+def test_lti_gramians():
+    """Test Gramians satisfy their Lyapunov equations."""
+    lti = LTISystem(A, B)
+    C = np.array([[1.0, 0.0]])
+
+    Wc = lti.controllability_gramian()
+    Wo = lti.observability_gramian(C)
+    assert np.allclose(Wc, A @ Wc @ A.T + B @ B.T)
+    assert np.allclose(Wo, A.T @ Wo @ A + C.T @ C)
+
+    with pytest.raises(ValueError):
+        LTISystem(2 * np.eye(2), B).controllability_gramian()
+
+
+def test_lti_impulse_response():
+    """Test Markov parameters H_j = A^j B."""
+    lti = LTISystem(A, B)
+    H = lti.impulse_response(7)
+
+    assert H.shape == (7, 2, 1)
+    assert np.allclose(H[5], np.linalg.matrix_power(A, 5) @ B)
+    assert np.allclose(lti.impulse_response(3), H[:3])
+
+
+def test_lti_fft_response_matches_simulation():
+    """Test FFT convolution against step-by-step simulation."""
+    rng = np.random.default_rng(0)
+    lti = LTISystem(A, np.array([[1.0, 0.0], [0.5, 1.0]]))
+    x0 = np.array([1.0, -1.0])
+    control = rng.normal(size=(100, 2))
+
+    assert np.allclose(lti.simulate(x0, control, method="fft"), lti.simulate(x0, control))
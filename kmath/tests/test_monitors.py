@@ -0,0 +1,77 @@
+"""
+Tests for convergence monitors and early-exit runs.
+"""
+
+import numpy as np
+import pytest
+from kmath.core.state import KState
+from kmath.core.operators import KNodeUpdateOperator
+from kmath.core.linear import KLinearOperator
+from kmath.core.program import KProgram
+from kmath.core.recurrence import KRecurrence
+from kmath.core.monitors import ResidualNorm, RelativeChange, Predicate, WallTime
+
+
+def halving():
+    return KNodeUpdateOperator(lambda x, incoming, context: 0.5 * x)
+
+
+def make_state():
+    return KState({'a': np.array([1.0]), 'b': np.array([2.0, -2.0])}, {})
+
+
+def test_residual_norm_stops_early():
+    """Test that a residual monitor stops a contracting program."""
+    result = KProgram([halving()]).run_until(make_state(), 1000, [ResidualNorm(1e-6)])
+
+    assert result.converged
+    assert result.reason == "residual"
+    assert result.steps < 30
+    assert result.residual < 1e-6
+
+
+def test_check_every():
+    """Test that monitors are only checked on multiples of check_every."""
+    seen = []
+    monitor = Predicate(lambda state, step: seen.append(step) or step >= 12)
+    result = KProgram([halving()]).run_until(make_state(), 100, [monitor], check_every=4)
+
+    assert seen == [4, 8, 12]
+    assert result.steps == 12
+
+
+def test_max_steps_and_linear_program():
+    """Test exhausting max_steps, and fused linear programs."""
+    program = KProgram([KLinearOperator(np.eye(3))])
+    result = program.run_until(make_state(), 7, [RelativeChange(-1.0)])
+
+    assert not result.converged
+    assert result.reason == "max_steps"
+    assert result.steps == 7
+    assert result.residual == 0.0
+
+
+def test_wall_time():
+    """Test that the wall-time budget stops the run without convergence."""
+    result = KProgram([halving()]).run_until(make_state(), 10 ** 9, [WallTime(0.0)])
+
+    assert not result.converged
+    assert result.reason == "wall time"
+    assert result.steps == 1
+
+
+def test_iterate_until_time_variant():
+    """Test monitored iteration of a time-variant recurrence."""
+    def shift(state, t):
+        result = state.copy()
+        result.nodes['a'] = state.nodes['a'] + t
+        return result
+
+    recurrence = KRecurrence(time_variant_map=shift)
+    result = recurrence.iterate_until(make_state(), 50, [Predicate(lambda s, k: s.nodes['a'][0] > 10)])
+
+    assert result.converged
+    assert result.state.nodes['a'][0] == 1 + sum(range(result.steps))
+
+    with pytest.raises(ValueError):
+        recurrence.iterate_until(make_state(), 5, [], check_every=0)
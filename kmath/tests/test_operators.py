@@ -7,10 +7,15 @@ import pytest
 from kmath.core.state import KState
 from kmath.core.operators import (
     KOperator,
+    KComposedOperator,
+    KSumOperator,
+    KMetaOperator,
     KNodeUpdateOperator,
     KEdgeUpdateOperator,
     KLabelOperator,
     KContextUpdateOperator,
+    KTopologyChange,
+    KTopologyUpdateOperator,
     operator_add,
 )
 
@@ -190,3 +195,224 @@ def test_operator_add():
     
     # (0 + 1) + (0 + 2) = 3
     assert np.allclose(result.nodes['a'], np.array([3.0]))
+
+
+def test_node_update_operator_incremental():
+    """Test that incremental node updates match full recomputation."""
+    # Spreading on a chain: a node activates once any in-neighbour is active
+    n = 30
+    nodes = {i: np.array([1.0 if i == 0 else 0.0]) for i in range(n)}
+    edges = {(i, i + 1): np.array([1.0]) for i in range(n - 1)}
+    current = {}
+    calls = []
+
+    def spread(x_v, incident_edges, context):
+        calls.append(1)
+        if any(current['state'].nodes[u][0] > 0 for (u, _) in incident_edges):
+            return np.array([1.0])
+        return x_v
+
+    full_op = KNodeUpdateOperator(spread)
+    state_full = KState(nodes, edges)
+    for _ in range(10):
+        current['state'] = state_full
+        state_full = full_op(state_full)
+    full_calls = len(calls)
+
+    op = KNodeUpdateOperator(spread, incremental=True)
+    state = KState(nodes, edges)
+    calls.clear()
+    for _ in range(10):
+        current['state'] = state
+        state = op(state)
+
+    assert state == state_full
+    assert np.allclose(state.nodes[10], [1.0])
+    assert np.allclose(state.nodes[11], [0.0])
+    # First step evaluates every node, afterwards only the frontier
+    assert len(calls) < full_calls / 3
+
+
+def test_node_update_operator_incremental_external_change():
+    """Test that changes made outside the operator trigger recomputation."""
+    op = KNodeUpdateOperator(lambda x, e, c: x * 0.5, incremental=True)
+    state = KState({'a': np.array([4.0]), 'b': np.array([0.0])}, {})
+
+    state = op(state)
+    state = op(state)
+    assert np.allclose(state.nodes['a'], [1.0])
+
+    # A plain copy has no change record, so everything is recomputed
+    state = state.copy()
+    state.nodes['b'] = np.array([8.0])
+    state = op(state)
+    assert np.allclose(state.nodes['a'], [0.5])
+    assert np.allclose(state.nodes['b'], [4.0])
+
+
+def test_topology_update_operator():
+    """Test bulk rewiring with incremental index maintenance."""
+    nodes = {i: np.array([float(i)]) for i in range(4)}
+    edges = {(0, 1): np.array([1.0]), (1, 2): np.array([1.0]), (2, 3): np.array([1.0])}
+    state = KState(nodes, edges, {'net'})
+    state.topology()
+
+    def rewire(s):
+        return KTopologyChange(
+            add_nodes={4: np.array([4.0])},
+            remove_nodes=[3],
+            add_edges={(4, 0): np.array([0.5])},
+            remove_edges=[(0, 1)],
+        )
+
+    result = KTopologyUpdateOperator(rewire)(state)
+
+    assert set(result.nodes) == {0, 1, 2, 4}
+    assert set(result.edges) == {(1, 2), (4, 0)}
+    assert list(result.topology().incoming(0)) == [(4, 0)]
+    assert result.topology().matches(result.edges)
+    assert result.changes_since(state.version).edges == {(0, 1), (2, 3), (4, 0)}
+    # Input state is untouched and rebuilds its own index
+    assert set(state.edges) == {(0, 1), (1, 2), (2, 3)}
+    assert list(state.topology().incoming(1)) == [(0, 1)]
+
+
+def test_topology_update_with_incremental_nodes():
+    """Test incremental node updates after rewiring."""
+    def in_degree(x_v, incident_edges, context):
+        return np.array([float(len(incident_edges))])
+
+    op = KNodeUpdateOperator(in_degree, incremental=True)
+    rewire = KTopologyUpdateOperator(lambda s: KTopologyChange(
+        add_edges={(0, 2): np.array([1.0])}, remove_edges=[(0, 1)]))
+
+    state = KState({i: np.array([0.0]) for i in range(3)}, {(0, 1): np.array([1.0])})
+    state = op(rewire(op(state)))
+
+    assert np.allclose(state.nodes[1], [0.0])
+    assert np.allclose(state.nodes[2], [1.0])
+
+
+def test_composition_is_flattened():
+    """Test that nested compositions form a single lazy operand list."""
+    ops = [KOperator(lambda s, k=k: KState({'a': s.nodes['a'] * 10 + k}, {})) for k in range(3)]
+    composed = ops[2] * (ops[1] * ops[0])
+
+    assert isinstance(composed, KComposedOperator)
+    assert composed.operands == (ops[0], ops[1], ops[2])
+    assert np.allclose(composed(KState({'a': np.array([0.0])}, {})).nodes['a'], [12.0])
+
+
+def test_deep_meta_composition():
+    """Test that deep chains built by a meta operator do not hit the recursion limit."""
+    step = KOperator(lambda s: KState({'a': s.nodes['a'] + 1}, {}))
+    append_step = KMetaOperator(lambda op: op * step)
+
+    op = step
+    for _ in range(5000):
+        op = append_step.transform(op)
+
+    result = op(KState({'a': np.array([0.0])}, {}))
+    assert np.allclose(result.nodes['a'], [5001.0])
+
+
+def test_operator_add_shares_subexpressions():
+    """Test that a subexpression used twice in a sum is evaluated once."""
+    calls = []
+
+    def expensive(state: KState) -> KState:
+        calls.append(1)
+        return KState({'a': state.nodes['a'] + 1}, {})
+
+    shared = KOperator(expensive)
+    double = KOperator(lambda s: KState({'a': s.nodes['a'] * 2}, {}))
+    sum_op = operator_add(shared, operator_add(double * shared, shared))
+
+    assert isinstance(sum_op, KSumOperator)
+    assert len(sum_op.operands) == 3
+
+    result = sum_op(KState({'a': np.array([1.0])}, {}))
+    # 2 + 4 + 2
+    assert np.allclose(result.nodes['a'], [8.0])
+    assert len(calls) == 1
+
+
+def test_composition_releases_intermediates():
+    """Test that evaluating a long composition keeps only the current intermediate alive."""
+    import weakref
+    live = [0]
+    peak = [0]
+
+    def released():
+        live[0] -= 1
+
+    def step(state: KState) -> KState:
+        result = KState({'a': state.nodes['a'] + 1}, {})
+        weakref.finalize(result, released)
+        live[0] += 1
+        peak[0] = max(peak[0], live[0])
+        return result
+
+    op = KOperator(step)
+    chain = op
+    for _ in range(199):
+        chain = chain * op
+    other = KOperator(lambda s: s)
+
+    for expr in (chain, operator_add(chain, other)):
+        peak[0] = 0
+        result = expr(KState({'a': np.zeros(1000)}, {}))
+        assert np.allclose(result.nodes['a'][0], 200.0)
+        assert peak[0] <= 3
+
+
+def test_operators_share_unchanged_arrays():
+    """Test that operators share arrays they do not update."""
+    state = KState({'a': np.array([1.0]), 'b': np.array([2.0])}, {('a', 'b'): np.array([1.0])},
+                   context=np.array([0.0]), node_labels={'hot': ['a']})
+
+    node_op = KNodeUpdateOperator(lambda x, e, c: x + 1, label='hot')
+    result = node_op(state)
+    assert result.nodes['b'] is state.nodes['b']
+    assert result.edges[('a', 'b')] is state.edges[('a', 'b')]
+    assert result.nodes['a'][0] == 2.0 and state.nodes['a'][0] == 1.0
+
+    context_op = KContextUpdateOperator(lambda c, s: c + 1)
+    result = context_op(state)
+    assert result.nodes['a'] is state.nodes['a']
+    assert result.context[0] == 1.0 and state.context[0] == 0.0
+
+
+def test_batched_edge_update_matches_per_edge():
+    """Test the vectorized edge kernel against the per-edge path."""
+    rng = np.random.default_rng(0)
+    nodes = {i: rng.standard_normal(3) for i in range(20)}
+    edges = {(i, (i * 7) % 20): rng.standard_normal(3) for i in range(20)}
+    edges[(3, 'ghost')] = rng.standard_normal(3)  # endpoint without a node state
+    state = KState(nodes, edges, context=np.array([0.5]))
+
+    def hebbian(w, x_u, x_v, c):
+        return w + c[0] * x_u * x_v
+
+    def hebbian_batched(W, Xu, Xv, c):
+        return W + c[0] * Xu * Xv
+
+    per_edge = KEdgeUpdateOperator(hebbian)(state)
+    batched = KEdgeUpdateOperator(hebbian_batched, batched=True)(state)
+
+    assert batched.edges.keys() == per_edge.edges.keys()
+    for e in per_edge.edges:
+        assert np.allclose(batched.edges[e], per_edge.edges[e])
+
+    subset = KEdgeUpdateOperator(hebbian_batched, batched=True).apply_subset(state, [0, 'ghost'])
+    assert np.allclose(subset.edges[(3, 'ghost')], state.edges[(3, 'ghost')])
+    assert np.allclose(subset.edges[(0, 0)], per_edge.edges[(0, 0)])
+    assert subset.edges[(1, 7)] is state.edges[(1, 7)]
+
+
+def test_batched_edge_update_shape_errors():
+    """Test that ragged shapes are rejected by the batched kernel."""
+    state = KState({'a': np.zeros(2), 'b': np.zeros(3)}, {('a', 'b'): np.ones(1)})
+    op = KEdgeUpdateOperator(lambda W, Xu, Xv, c: W, batched=True)
+    with pytest.raises(ValueError):
+        op(state)
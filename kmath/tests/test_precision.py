@@ -0,0 +1,86 @@
+"""
+Tests for precision policies.
+"""
+
+import numpy as np
+import pytest
+from kmath.core.state import KState
+from kmath.core.precision import KPrecision, MIXED16, as_precision
+from kmath.core.operators import KNodeUpdateOperator, KEdgeUpdateOperator, KContextUpdateOperator
+from kmath.core.linear import KLinearOperator
+from kmath.core.recurrence import KRecurrence
+from kmath.analysis.stability import compute_jacobian_eigenvalues
+
+
+def make_state(dtype):
+    return KState({'a': [1, 2], 'b': np.array([0.5, 0.25], dtype=np.float64)},
+                  {('a', 'b'): [1]}, context=[0.1], dtype=dtype)
+
+
+def test_state_dtype_policy():
+    """Test that all arrays follow the state-wide dtype."""
+    state = make_state("float32")
+    assert state.precision == KPrecision(np.dtype(np.float32), np.dtype(np.float32))
+    assert all(v.dtype == np.float32 for v in state.nodes.values())
+    assert state.edges[('a', 'b')].dtype == np.float32
+    assert state.context.dtype == np.float32
+    assert state.copy().precision == state.precision
+
+    assert as_precision("float16") == MIXED16
+    assert make_state(None).nodes['a'].dtype.kind == 'i'
+    with pytest.raises(ValueError):
+        as_precision("int32")
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float16"])
+def test_operators_preserve_dtype(dtype):
+    """Test that operators do not upcast states with a policy."""
+    state = make_state(dtype)
+    W = np.array([[0.5, 0.1], [0.0, 0.5]])  # float64 parameters
+    seen = []
+
+    def node_update(x, incident_edges, context):
+        seen.append(x.dtype)
+        return W @ x + sum(incident_edges.values()) + context
+
+    ops = [
+        KNodeUpdateOperator(node_update),
+        KNodeUpdateOperator(node_update, incremental=True),
+        KEdgeUpdateOperator(lambda w, x_u, x_v, c: w * 1.5),
+        KContextUpdateOperator(lambda c, s: c * np.float64(2.0)),
+        KLinearOperator(0.5 * np.eye(4), offset=np.ones(4)),
+    ]
+    storage = np.dtype(dtype)
+    for op in ops:
+        result = op(state)
+        assert result.precision == state.precision
+        for value in list(result.nodes.values()) + list(result.edges.values()) + [result.context]:
+            assert value.dtype == storage
+    # float16 storage is computed in float32
+    assert set(seen) == {np.dtype(np.float32)}
+
+
+def test_round_trip_keeps_policy():
+    """Test serialization and astype of policies."""
+    state = make_state("float16")
+    restored = KState.from_bytes(state.to_bytes())
+    assert restored.precision == MIXED16
+    assert restored.nodes['b'].dtype == np.float16
+
+    wide = state.astype("float64")
+    assert wide.nodes['b'].dtype == np.float64
+    assert wide.precision.tolerance == 1e-6
+
+
+def test_precision_adaptive_defaults():
+    """Test tolerance and Jacobian step defaults for low precision."""
+    start = KState({'x': np.zeros(2)}, {}, dtype="float32")
+
+    fixed = KRecurrence(recurrence_map=KNodeUpdateOperator(
+        lambda x, e, c: np.array([0.5, 0.25], dtype=np.float32) * x + 1.0)).find_fixed_point(start)
+    assert fixed is not None
+    assert np.allclose(fixed.nodes['x'], [2.0, 4.0 / 3.0], atol=1e-4)
+
+    eigenvalues = compute_jacobian_eigenvalues(
+        KNodeUpdateOperator(lambda x, e, c: np.array([0.5, 0.25]) * x + 1.0), fixed)
+    assert np.allclose(sorted(eigenvalues.real), [0.25, 0.5], atol=1e-3)
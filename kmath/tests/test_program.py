@@ -5,7 +5,7 @@ Tests for K-programs.
 import numpy as np
 import pytest
 from kmath.core.state import KState
-from kmath.core.operators import KOperator
+from kmath.core.operators import KOperator, KNodeUpdateOperator, KEdgeUpdateOperator
 from kmath.core.program import KProgram
 
 
@@ -122,3 +122,38 @@ def test_kprogram_complex():
     
     # ((0 + 1) * 2) + 1 = 3
     assert np.allclose(result.nodes['a'], np.array([3.0]))
+
+
+def make_chain(n):
+    nodes = {i: np.array([float(i)]) for i in range(n)}
+    edges = {(i, i + 1): np.array([0.5]) for i in range(n - 1)}
+    return KState(nodes, edges)
+
+
+def test_kprogram_query_matches_run():
+    """Test that query-driven evaluation agrees with a full run."""
+    calls = []
+
+    def diffuse(x, incident_edges, context):
+        calls.append(1)
+        return 0.5 * x + sum(w for w in incident_edges.values())
+
+    def reweight(w, x_u, x_v, context):
+        return w + 0.1 * x_u[:1]
+
+    state = make_chain(500)
+    program = KProgram([KEdgeUpdateOperator(reweight), KNodeUpdateOperator(diffuse)])
+    values = program.query(state, 3, [10, 499])
+    query_calls = len(calls)
+    final = program.run(state, 3)
+
+    for node_id in (10, 499):
+        assert np.allclose(values[node_id], final.nodes[node_id])
+    assert query_calls < 20
+
+
+def test_kprogram_query_fallback():
+    """Test that programs with non-local operators fall back to a full run."""
+    state = make_chain(5)
+    program = KProgram([KOperator(lambda s: s.copy())])
+    assert np.array_equal(program.query(state, 2, [3])[3], state.nodes[3])
@@ -7,7 +7,8 @@ import pytest
 from kmath.core.state import KState
 from kmath.core.operators import KOperator
 from kmath.core.program import KProgram
-from kmath.core.recurrence import KRecurrence
+from kmath.core.recurrence import KRecurrence, KScheduledRecurrence
+from kmath.core.linear import KLinearOperator
 
 
 def test_krecurrence_time_invariant():
@@ -163,3 +164,56 @@ def test_krecurrence_invalid():
     op = KOperator(lambda s: s)
     with pytest.raises(ValueError):
         KRecurrence(recurrence_map=op, time_variant_map=lambda s, t: s)
+
+
+def test_scheduled_recurrence_periodic():
+    """Test periodic schedules against the equivalent time-variant map."""
+    def add(k):
+        return KOperator(lambda s: KState({'a': s.nodes['a'] + k}, {}))
+
+    built = []
+
+    def builder(k):
+        built.append(k)
+        return add(k)
+
+    recurrence = KScheduledRecurrence([1.0, 10.0], durations=[2, 1], builder=builder)
+    reference = KRecurrence(time_variant_map=lambda s, t: add([1.0, 1.0, 10.0][t % 3])(s))
+
+    state = KState({'a': np.array([0.0])}, {})
+    for steps in (0, 2, 7, 9):
+        assert recurrence.iterate(state, steps) == reference.iterate(state, steps)
+    assert recurrence.trajectory(state, 4)[-1] == reference.iterate(state, 4)
+    assert sorted(built) == [1.0, 10.0]
+
+
+def test_scheduled_recurrence_fixed_point():
+    """Test fixed points of the period map (linear phases fuse)."""
+    grow = KLinearOperator(np.array([[2.0]]), offset=np.array([1.0]), node_ids=['a'])
+    shrink = KLinearOperator(np.array([[0.2]]), node_ids=['a'])
+    recurrence = KScheduledRecurrence([grow, shrink])
+
+    assert isinstance(recurrence.period_map(), KLinearOperator)
+
+    fixed = recurrence.find_fixed_point(KState({'a': np.array([5.0])}, {}))
+    # x = 0.2 * (2x + 1)  =>  x = 1/3
+    assert np.allclose(fixed.nodes['a'], [1.0 / 3.0])
+    assert np.allclose(recurrence.iterate(fixed, 10).nodes['a'], [1.0 / 3.0])
+
+
+def test_scheduled_recurrence_piecewise():
+    """Test piecewise-constant schedules."""
+    halve = KOperator(lambda s: KState({'a': s.nodes['a'] * 0.5 + 0.5}, {}))
+    add_one = KOperator(lambda s: KState({'a': s.nodes['a'] + 1}, {}))
+    recurrence = KScheduledRecurrence([add_one, halve], start_times=[0, 3])
+
+    state = KState({'a': np.array([0.0])}, {})
+    assert recurrence.phase_at(2) == 0
+    assert recurrence.phase_at(100) == 1
+    assert np.allclose(recurrence.iterate(state, 4).nodes['a'], [2.0])
+
+    fixed = recurrence.find_fixed_point(state)
+    assert np.allclose(fixed.nodes['a'], [1.0], atol=1e-5)
+
+    with pytest.raises(ValueError):
+        KScheduledRecurrence([add_one, halve], start_times=[1, 3])
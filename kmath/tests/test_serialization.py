@@ -0,0 +1,89 @@
+"""
+Tests for K-state serialization.
+"""
+
+import numpy as np
+import pytest
+from kmath.core.state import KState
+
+
+def make_state():
+    nodes = {
+        'a': np.array([1.0, 2.0]),
+        2: np.arange(6, dtype=np.int32).reshape(2, 3),
+        ('grid', 0, 1): np.array([0.5], dtype=np.float32),
+    }
+    edges = {
+        ('a', 2): np.array([0.25]),
+        (2, ('grid', 0, 1)): np.array([1.0, -1.0]),
+    }
+    return KState(nodes, edges, {'test', 'graph'}, np.array([0.1, 0.2]),
+                  node_labels={'source': ['a'], 'grid': [('grid', 0, 1), 2]})
+
+
+def assert_same(s1, s2):
+    assert s1 == s2
+    for k in s1.nodes:
+        assert s1.nodes[k].dtype == s2.nodes[k].dtype
+        assert s1.nodes[k].shape == s2.nodes[k].shape
+
+
+def test_roundtrip_bytes():
+    """Test to_bytes/from_bytes round trip with mixed ids and dtypes."""
+    state = make_state()
+    restored = KState.from_bytes(state.to_bytes())
+
+    assert_same(state, restored)
+    assert restored.labels == {'test', 'graph'}
+    assert restored.node_labels.nodes_with('grid') == {('grid', 0, 1), 2}
+
+
+def test_from_bytes_is_zero_copy():
+    """Test that uncompressed reads view the input buffer."""
+    state = make_state()
+    data = state.to_bytes()
+    assert isinstance(data, bytearray)
+    restored = KState.from_bytes(data)
+
+    restored.nodes['a'][0] = 42.0
+    assert KState.from_bytes(data).nodes['a'][0] == 42.0
+
+    copied = KState.from_bytes(data, copy=True)
+    copied.nodes['a'][0] = 0.0
+    assert KState.from_bytes(data).nodes['a'][0] == 42.0
+
+
+@pytest.mark.parametrize("compression", ["zlib", "lz4"])
+def test_roundtrip_compressed(compression):
+    """Test compressed round trip (lz4 falls back to zlib when unavailable)."""
+    state = KState({i: np.zeros(64) for i in range(50)}, {})
+    data = state.to_bytes(compression=compression)
+
+    assert len(data) < len(state.to_bytes())
+    assert KState.from_bytes(data) == state
+
+
+def test_save_load(tmp_path):
+    """Test file save/load with and without memory mapping."""
+    state = make_state()
+    path = tmp_path / "state.kst"
+    state.save(path)
+
+    assert_same(state, KState.load(path))
+    assert_same(state, KState.load(path, mmap_mode=None))
+
+
+def test_no_context_and_empty_arrays():
+    """Test states without context and with zero-size arrays."""
+    state = KState({'a': np.zeros(0), 'b': np.array(3.0)}, {})
+    restored = KState.from_bytes(state.to_bytes())
+
+    assert restored.context is None
+    assert restored.nodes['a'].shape == (0,)
+    assert restored.nodes['b'].shape == ()
+
+
+def test_bad_buffer():
+    """Test rejection of buffers that are not serialized states."""
+    with pytest.raises(ValueError):
+        KState.from_bytes(b"not a state at all, definitely")
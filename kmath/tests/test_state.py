@@ -4,7 +4,7 @@ Tests for KState class.
 
 import numpy as np
 import pytest
-from kmath.core.state import KState
+from kmath.core.state import KState, KDelta
 
 
 def test_kstate_creation():
@@ -88,3 +88,66 @@ def test_kstate_repr():
     assert 'KState' in repr_str
     assert 'nodes=1' in repr_str
     assert 'edges=0' in repr_str
+
+
+def test_kstate_topology():
+    """Test adjacency index construction and invalidation."""
+    edges = {('a', 'b'): np.array([1.0]), ('c', 'b'): np.array([2.0])}
+    state = KState({'a': np.array([0.0]), 'b': np.array([0.0]), 'c': np.array([0.0])}, edges)
+
+    topology = state.topology()
+    assert list(topology.incoming('b')) == [('a', 'b'), ('c', 'b')]
+    assert list(topology.successors('a')) == ['b']
+    assert state.topology() is topology
+
+    state.edges[('b', 'a')] = np.array([1.0])
+    assert list(state.topology().successors('b')) == ['a']
+
+
+def test_kstate_change_records():
+    """Test change records across derived states."""
+    s0 = KState({'a': np.array([0.0])}, {})
+    s1 = s0.copy()
+    s1.record_changes(s0, KDelta(nodes=frozenset({'a'})))
+    s2 = s1.copy()
+    s2.record_changes(s1, KDelta(context=True))
+
+    assert s2.changes_since(s2.version) == KDelta()
+    assert s2.changes_since(s1.version) == KDelta(context=True)
+    assert s2.changes_since(s0.version) == KDelta(frozenset({'a'}), frozenset(), True)
+    assert s1.copy().changes_since(s0.version) is None
+
+
+def test_kstate_from_arrays():
+    """Test the no-copy constructor and its validation."""
+    x = np.array([1.0, 2.0])
+    w = np.array([0.5])
+    state = KState.from_arrays({'a': x}, {('a', 'a'): w}, {'test'}, node_labels={'src': ['a']})
+
+    assert state.nodes['a'] is x
+    assert state.edges[('a', 'a')] is w
+    assert state.labels == {'test'}
+    assert state.node_labels.nodes_with('src') == {'a'}
+
+    copied = KState.from_arrays({'a': x}, {}, copy=True)
+    assert copied.nodes['a'] is not x
+    assert KState.from_arrays({'a': [1, 2]}, {}, dtype="float32").nodes['a'].dtype == np.float32
+
+    with pytest.raises(ValueError):
+        KState.from_arrays({'a': x}, {'a': w})
+    with pytest.raises(TypeError):
+        KState.from_arrays({'a': np.array([{}, 1], dtype=object)}, {})
+
+
+def test_kstate_copy_is_independent():
+    """Test that copy() copies every array."""
+    state = KState({'a': np.array([1.0])}, {('a', 'a'): np.array([1.0])}, context=np.array([0.0]))
+    copied = state.copy()
+    copied.nodes['a'][0] = 5.0
+    copied.edges[('a', 'a')][0] = 5.0
+    copied.context[0] = 5.0
+
+    assert state.nodes['a'][0] == 1.0
+    assert state.edges[('a', 'a')][0] == 1.0
+    assert state.context[0] == 0.0
+    assert copied.labels == state.labels
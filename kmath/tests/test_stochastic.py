@@ -0,0 +1,93 @@
+"""
+Tests for stochastic K-operators and ensembles.
+"""
+
+import numpy as np
+import pytest
+from kmath.core.state import KState
+from kmath.core.linear import KLinearOperator
+from kmath.core.program import KProgram
+from kmath.core.stochastic import KNoiseOperator, KStochasticOperator, rng_stream, current_rng, run_ensemble
+from kmath.analysis.stability import check_lyapunov_stability
+
+
+def make_state():
+    return KState({'a': np.array([1.0, 2.0]), 'b': np.array([0.0])}, {('a', 'b'): np.array([1.0])})
+
+
+def test_rng_stream_binding():
+    """Test that operators draw from the bound stream."""
+    noise = KNoiseOperator(1.0, seed=0)
+    state = make_state()
+
+    with rng_stream(5):
+        first = noise(state)
+    with rng_stream(5):
+        second = noise(state)
+    assert first == second
+    assert current_rng() is None
+
+    expected = np.random.default_rng(5).standard_normal(3)
+    np.testing.assert_array_equal(first.nodes['a'], state.nodes['a'] + expected[:2])
+
+
+def test_reused_noise_draws_independently():
+    """Test that a noise operator used twice in one expression draws twice."""
+    from kmath.core.operators import KOperator, operator_add
+
+    noise = KNoiseOperator(1.0)
+    identity = KOperator(lambda s: s)
+    state = KState({'a': np.zeros(4)}, {})
+
+    for expr in (operator_add(noise, noise), operator_add(noise * identity, noise * identity)):
+        with rng_stream(3):
+            result = expr(state)
+        draws = np.random.default_rng(3).standard_normal(8)
+        np.testing.assert_allclose(result.nodes['a'], draws[:4] + draws[4:])
+
+
+def test_stochastic_operator_fallback_seed():
+    """Test the per-operator generator used outside any stream."""
+    def jitter(state, rng):
+        result = state.copy()
+        result.context = rng.uniform(size=2)
+        return result
+
+    s1 = KStochasticOperator(jitter, seed=1)(make_state())
+    s2 = KStochasticOperator(jitter, seed=1)(make_state())
+    np.testing.assert_array_equal(s1.context, s2.context)
+
+
+def test_ensemble_moments():
+    """Test ensemble mean/variance of an Ornstein-Uhlenbeck-like process."""
+    decay = KLinearOperator(0.5 * np.eye(3))
+    program = KProgram([KNoiseOperator(1.0).compose(decay)])
+    result = run_ensemble(program, make_state(), steps=20, realizations=4000, seed=0)
+
+    assert result.count == 4000
+    # stationary variance of x' = 0.5 x + n is 1 / (1 - 0.25)
+    assert np.allclose(result.variance()['a'], 4.0 / 3.0, rtol=0.1)
+    assert np.allclose(result.mean['b'], 0.0, atol=0.1)
+    assert result.mean_state(make_state()).nodes['a'].shape == (2,)
+
+
+@pytest.mark.parametrize("workers", [2, 4])
+def test_ensemble_reproducible_across_workers(workers):
+    """Test bit-for-bit identical moments for any worker count."""
+    noise = KNoiseOperator(0.3, include_edges=True)
+    serial = run_ensemble(noise, make_state(), steps=5, realizations=300, seed=42, block_size=32)
+    parallel = run_ensemble(noise, make_state(), steps=5, realizations=300, seed=42,
+                            workers=workers, block_size=32)
+
+    for node_id in serial.mean:
+        assert np.array_equal(serial.mean[node_id], parallel.mean[node_id])
+        assert np.array_equal(serial.m2[node_id], parallel.m2[node_id])
+
+
+def test_lyapunov_check_rng():
+    """Test that the Lyapunov check is reproducible with an explicit rng."""
+    op = KLinearOperator(0.5 * np.eye(3))
+    fixed = KState({'a': np.zeros(2), 'b': np.zeros(1)}, {})
+
+    assert check_lyapunov_stability(op, fixed, rng=0)
+    assert check_lyapunov_stability(op, fixed, rng=np.random.default_rng(1))
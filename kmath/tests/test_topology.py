@@ -0,0 +1,66 @@
+"""
+Tests for KTopology adjacency index.
+"""
+
+import numpy as np
+import pytest
+from kmath.core.topology import KTopology
+
+
+def test_topology_growth():
+    """Test amortized growth of the endpoint arrays."""
+    topology = KTopology()
+    topology.add_edges((i, i + 1) for i in range(100))
+
+    assert topology.num_edges == 100
+    assert topology.capacity == 128
+    edge_ids, src, dst = topology.edge_arrays()
+    assert edge_ids[5] == (5, 6)
+    assert topology.node_ids[src[5]] == 5
+    assert topology.node_ids[dst[5]] == 6
+
+
+def test_topology_tombstones_and_compaction():
+    """Test edge removal leaves tombstones until compaction."""
+    topology = KTopology([(0, 1), (1, 2), (2, 0)])
+    removed = topology.remove_edges([(1, 2), ('x', 'y')])
+
+    assert removed == [(1, 2)]
+    assert list(topology.successors(1)) == []
+    assert list(topology.incoming(0)) == [(2, 0)]
+    edge_ids, src, dst = topology.edge_arrays()
+    assert edge_ids == [(0, 1), (2, 0)]
+    assert [topology.node_ids[i] for i in dst] == [1, 0]
+
+    topology.add_edges([(1, 2)])
+    topology.compact()
+    edge_ids, src, dst = topology.edge_arrays()
+    assert edge_ids == [(0, 1), (2, 0), (1, 2)]
+    assert [topology.node_ids[i] for i in src] == [0, 2, 1]
+
+
+def test_topology_automatic_compaction():
+    """Test compaction once tombstones outnumber live edges."""
+    topology = KTopology((i, i + 1) for i in range(200))
+    topology.remove_edges((i, i + 1) for i in range(150))
+
+    assert topology.num_edges == 50
+    assert topology.capacity == 64
+    assert len(topology.edge_arrays()[0]) == 50
+
+
+def test_topology_incident_edges():
+    """Test collection of edges touching a node set."""
+    topology = KTopology([('a', 'b'), ('b', 'c'), ('c', 'a')])
+
+    assert set(topology.incident_edges(['b'])) == {('a', 'b'), ('b', 'c')}
+    assert topology.predecessors('a') == ['c']
+
+
+def test_backward_cone():
+    """Test backward cone layers by hop distance."""
+    topo = KTopology([('a', 'b'), ('b', 'c'), ('x', 'c'), ('c', 'd'), ('d', 'a')])
+
+    assert topo.backward_cone(['c'], 0) == [['c']]
+    assert topo.backward_cone(['c'], 2) == [['c'], ['b', 'x'], ['a']]
+    assert topo.backward_cone(['c'], 10) == [['c'], ['b', 'x'], ['a'], ['d']]
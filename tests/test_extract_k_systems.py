@@ -0,0 +1,500 @@
+"""
+Tests for the extract_k_systems.py export script.
+"""
+
+import bz2
+import gzip
+import hashlib
+import io
+import json
+import lzma
+import os
+import random
+import sys
+import tarfile
+import threading
+import zlib
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import extract_k_systems as eks
+
+
+def make_tree(root, files):
+    for rel, data in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return root
+
+
+def run_extract(target, out, keywords=("omega",), **options):
+    options.setdefault("workers", 2)
+    summary = eks.extract(Path(target), Path(out), list(keywords), [], set(), None, **options)
+    return Path(summary["archive"])
+
+
+def read_members(archive):
+    with tarfile.open(archive) as tar:
+        return {m.name: (tar.extractfile(m).read() if m.isfile() else m.linkname)
+                for m in tar.getmembers() if not m.isdir()}
+
+
+def test_keyword_matcher_matches_naive_search():
+    """Test the automaton against substring search, with overlapping and case-folded keywords."""
+    keywords = ["k-sys", "K-SYS-GUMS", "k-sys-gums", "sys", "gums-2025", "ΩCOIN", "Ω", "aa", "aaa", "ab"]
+    matcher = eks.KeywordMatcher(keywords)
+    assert matcher.keywords == ["k-sys", "K-SYS-GUMS", "sys", "gums-2025", "ΩCOIN", "Ω", "aa", "aaa", "ab"]
+
+    rng = random.Random(0)
+    alphabet = "kKsSyY-gGuUmM2025Ωωcoinab "
+    texts = ["K-Sys-Gums-2025 final", "ωcoin", "aaab", ""]
+    texts += ["".join(rng.choice(alphabet) for _ in range(rng.randrange(40))) for _ in range(500)]
+    for text in texts:
+        lowered = text.lower()
+        expected = [kw for kw in matcher.keywords if kw.lower() in lowered]
+        assert matcher.names(matcher.scan(lowered)[1]) == expected, text
+
+
+def test_keyword_matcher_resumes_from_state():
+    """Test that scanning in pieces from the returned state equals one scan."""
+    matcher = eks.KeywordMatcher(["omega", "crown"])
+    state, first = matcher.scan("report-ome")
+    _, rest = matcher.scan("ga crown", state)
+
+    assert matcher.names(first | rest) == ["omega", "crown"]
+
+
+def walk(target, exclude=(), **options):
+    return sorted(os.path.relpath(entry.path, target) for _, entry, _ in eks.iter_files(target, exclude, **options))
+
+
+def test_iter_files_exclusions(tmp_path):
+    """Test that excluded directories and everything below them are pruned."""
+    target = make_tree(tmp_path / "t", {"a.txt": b"", "skip/b.txt": b"", "skip/deep/c.txt": b"", "keep/d.txt": b""})
+
+    assert walk(target) == ["a.txt", "keep/d.txt", "skip/b.txt", "skip/deep/c.txt"]
+    assert walk(target, {str(target / "skip")}) == ["a.txt", "keep/d.txt"]
+    assert walk(target / "skip", {str(target / "skip")}) == ["b.txt"]
+
+
+def test_iter_files_symlink_loops(tmp_path):
+    """Test that directory link cycles terminate and each directory is visited once."""
+    target = make_tree(tmp_path / "t", {"a.txt": b"a", "sub/b.txt": b"b"})
+    os.symlink(target, target / "sub" / "loop")
+    os.symlink(target / "sub", target / "again")
+    os.symlink(target / "a.txt", target / "link.txt")
+    os.symlink(target / "missing", target / "broken.txt")
+
+    assert walk(target) == ["a.txt", "link.txt", "sub/b.txt"]
+    # sub/ is listed once, under whichever of its two paths the walk reaches first
+    followed = walk(target, follow_symlinks=True)
+    assert followed in (["a.txt", "again/b.txt", "link.txt"], ["a.txt", "link.txt", "sub/b.txt"])
+
+
+def test_iter_files_unreadable_directory(tmp_path, monkeypatch, capsys):
+    """Test that a directory that cannot be listed is reported and skipped."""
+    target = make_tree(tmp_path / "t", {"a.txt": b"", "locked/b.txt": b"", "open/c.txt": b""})
+    scandir = os.scandir
+
+    def guarded(path):
+        if os.path.basename(path) == "locked":
+            raise PermissionError(13, "Permission denied", path)
+        return scandir(path)
+
+    monkeypatch.setattr(eks.os, "scandir", guarded)
+
+    assert walk(target) == ["a.txt", "open/c.txt"]
+    assert "[!] Cannot list" in capsys.readouterr().out
+
+
+def test_member_reader_pads_short_file():
+    """Test that a file shorter than its stat is zero-padded to the member size."""
+    reader = eks._MemberReader(io.BytesIO(b"abc"), 6)
+
+    assert reader.read(4) + reader.read(4) == b"abc\0\0\0"
+    assert reader.missing == 3
+    assert reader.read(4) == b""
+
+
+def test_add_file_uses_size_at_write_time(tmp_path):
+    """Test that a file changed after the scan is archived whole, with later members intact."""
+    grown = tmp_path / "grown.txt"
+    grown.write_bytes(b"short")
+    scan_stat = grown.stat()
+    grown.write_bytes(b"much longer than at scan time")
+    other = tmp_path / "other.txt"
+    other.write_bytes(b"other")
+
+    archive = tmp_path / "out.tar.gz"
+    writer = eks.ArchiveWriter(archive)
+    digest = writer.add_file(grown, "grown.txt", scan_stat)
+    writer.add_file(other, "other.txt")
+    writer.close()
+
+    assert digest == hashlib.sha256(b"much longer than at scan time").hexdigest()
+
+    assert read_members(archive) == {"grown.txt": b"much longer than at scan time", "other.txt": b"other"}
+
+
+def test_add_file_shrunk_file_fails_cleanly(tmp_path, monkeypatch):
+    """Test that a file shorter than its stat raises but leaves a valid stream."""
+    shrunk = tmp_path / "shrunk.txt"
+    shrunk.write_bytes(b"data")
+    other = tmp_path / "other.txt"
+    other.write_bytes(b"other")
+    real_fstat = eks.os.fstat
+
+    def stale_fstat(fd):
+        st = real_fstat(fd)
+        return eks.os.stat_result(tuple(st)[:6] + (st.st_size + 4,) + tuple(st)[7:10])
+
+    archive = tmp_path / "out.tar"
+    writer = eks.ArchiveWriter(archive, compression="none")
+    monkeypatch.setattr(eks.os, "fstat", stale_fstat)
+    with pytest.raises(OSError, match="shrank by 4 bytes"):
+        writer.add_file(shrunk, "shrunk.txt")
+    monkeypatch.undo()
+    writer.add_file(other, "other.txt")
+    writer.close()
+
+    assert read_members(archive) == {"shrunk.txt": b"data\0\0\0\0", "other.txt": b"other"}
+
+
+def test_copy_pipeline_isolates_errors(tmp_path):
+    """Test that a failing copy is recorded on its entry without affecting the others."""
+    def handler(src, dst, st):
+        if src.name.startswith("bad"):
+            raise OSError(f"cannot read {src.name}")
+        return {"sha256": src.name}
+
+    done = []
+    pipeline = eks.CopyPipeline(handler, workers=3, queue_depth=2, on_done=done.append)
+    st = tmp_path.stat()
+    names = [f"bad{i}" if i % 4 == 0 else f"ok{i}" for i in range(20)]
+    for name in names:
+        pipeline.submit(Path(name), None, st, {"source_path": name})
+    pipeline.close()
+
+    entries = {e["source_path"]: e for e in done}
+    assert sorted(entries) == sorted(names)
+    assert all(entries[n] == {"source_path": n, "error": f"cannot read {n}"} for n in names if n.startswith("bad"))
+    assert all(entries[n] == {"source_path": n, "sha256": n} for n in names if n.startswith("ok"))
+    assert (pipeline.progress.files, pipeline.progress.errors) == (20, 5)
+
+
+def test_content_store_dedup(tmp_path, monkeypatch):
+    """Test one stored copy per content, links for duplicates, and no pre-hash for unique sizes."""
+    src = tmp_path / "src"
+    src.mkdir()
+    files = {"a.txt": b"same", "b.txt": b"same", "c.txt": b"diff", "d.txt": b"unique size"}
+    for name, data in files.items():
+        (src / name).write_bytes(data)
+    hashed = []
+    compute_sha256 = eks.compute_sha256
+    monkeypatch.setattr(eks, "compute_sha256", lambda path, size=None: hashed.append(path.name) or compute_sha256(path, size))
+
+    stored, linked = [], []
+    store = eks.ContentStore(lambda s, d, st: stored.append(d.name) or eks.copy_with_metadata(s, d, st),
+                             lambda o, d, st: linked.append((o.name, d.name)) or eks.link_staged(o, d, st))
+    staging = tmp_path / "staging"
+    fields = {name: store.put(src / name, staging / name, (src / name).stat()) for name in files}
+
+    assert stored == ["a.txt", "c.txt", "d.txt"]
+    assert linked == [("a.txt", "b.txt")]
+    assert hashed == ["b.txt", "c.txt"]
+    assert fields["b.txt"] == {"sha256": hashlib.sha256(b"same").hexdigest(), "duplicate_of": str(staging / "a.txt")}
+    assert all(fields[name]["sha256"] == hashlib.sha256(data).hexdigest() for name, data in files.items())
+    assert (staging / "a.txt").stat().st_ino == (staging / "b.txt").stat().st_ino
+    assert (store.duplicates, store.duplicate_bytes) == (1, 4)
+
+
+def test_index_only_when_requested(tmp_path):
+    """Test that the SQLite index is written only with use_index or incremental."""
+    target = make_tree(tmp_path / "t", {"omega.txt": b"x"})
+
+    run_extract(target, tmp_path / "plain")
+    run_extract(target, tmp_path / "indexed", use_index=True)
+
+    assert not (tmp_path / "plain" / eks.INDEX_NAME).exists()
+    assert (tmp_path / "indexed" / eks.INDEX_NAME).exists()
+
+
+def test_incremental_exports_only_changes(tmp_path):
+    """Test that a second, incremental run archives only new and modified files."""
+    target = make_tree(tmp_path / "t", {"omega_a.txt": b"a", "omega_b.txt": b"b", "sub/omega_c.txt": b"c"})
+    out = tmp_path / "out"
+    first = run_extract(target, out, use_index=True)
+    assert {"omega_a.txt", "omega_b.txt", "sub/omega_c.txt"} <= set(read_members(first))
+
+    (target / "omega_b.txt").write_bytes(b"changed")
+    (target / "omega_new.txt").write_bytes(b"new")
+    (target / "sub" / "omega_c.txt").unlink()
+    delta = run_extract(target, out, incremental=True)
+
+    members = read_members(delta)
+    assert {name for name in members if name.startswith("omega") or name.startswith("sub/")} == {
+        "omega_b.txt", "omega_new.txt"}
+    assert members["omega_b.txt"] == b"changed"
+    totals = eks.summarize_manifest(out / "EXTRACTION_MANIFEST.jsonl")
+    assert (totals["files"], totals["deleted"]) == (2, 1)
+
+
+@pytest.mark.parametrize("argv", [
+    ["--compression", "bz2", "--compress-level", "0"],
+    ["--compression", "gzip", "--compress-level", "10"],
+    ["--compression", "xz", "--compress-level", "-1"],
+    ["--compression", "none", "--compress-level", "1"],
+])
+def test_compress_level_validated(argv, monkeypatch, capsys):
+    """Test that out-of-range compression levels are rejected while parsing arguments."""
+    monkeypatch.setattr(sys, "argv", ["extract_k_systems.py"] + argv)
+    with pytest.raises(SystemExit) as exc:
+        eks.main()
+
+    assert exc.value.code == 2
+    assert "--compress-level" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("codec", ["gzip", "xz", "bz2"])
+@pytest.mark.parametrize("threads", [1, 3])
+def test_compressed_writer_members_round_trip(codec, threads, monkeypatch):
+    """Test that level switches and parallel blocks write several members that decompress as one stream."""
+    monkeypatch.setattr(eks, "COMPRESS_BLOCK", 1000)
+    data = [bytes(range(256)) * 20, b"stored" * 500, b"tail" * 10]
+    out = io.BytesIO()
+    writer = eks.CompressedWriter(out, codec, eks.COMPRESSION[codec][1], threads)
+    for i, chunk in enumerate(data):
+        writer.set_stored(i == 1)
+        writer.write(chunk)
+    writer.close()
+
+    stream = out.getvalue()
+    first = {"gzip": lambda: zlib.decompressobj(31), "xz": lzma.LZMADecompressor, "bz2": bz2.BZ2Decompressor}[codec]()
+    first.decompress(stream)
+    assert first.unused_data
+    assert {"gzip": gzip, "xz": lzma, "bz2": bz2}[codec].decompress(stream) == b"".join(data)
+
+
+def test_mmap_threshold_below_content_cap():
+    """Test that files within the content-search size cap can take the mmap path."""
+    assert eks.MMAP_THRESHOLD < eks.CONTENT_MAX_SIZE
+
+
+@pytest.mark.parametrize("threshold", [0, 1 << 40])
+def test_search_content_across_chunks(tmp_path, monkeypatch, threshold):
+    """Test content search through mmap and buffered reads, with keywords split across chunks."""
+    monkeypatch.setattr(eks, "MMAP_THRESHOLD", threshold)
+    monkeypatch.setattr(eks, "CONTENT_CHUNK", 16)
+    path = tmp_path / "notes.txt"
+    text = "x" * 13 + "OMEGA" + "y" * 20 + "ΩCOIN" + "z" * 7
+    path.write_text(text, encoding="utf-8")
+    eks._init_content_search(["crown", "omega", "Ωcoin"])
+
+    assert sorted(eks.search_content(path, path.stat().st_size)) == [1, 2]
+
+
+def manifest_files(out, staged=False):
+    path = out / "staging" / "EXTRACTION_MANIFEST.jsonl" if staged else out / "EXTRACTION_MANIFEST.jsonl"
+    return {r["relative_path"]: r for r in eks.read_manifest(path) if r["type"] == "file"}
+
+
+def test_content_search_processes_agree(tmp_path, monkeypatch):
+    """Test that content search gives the same matches with one or several processes."""
+    monkeypatch.setattr(eks, "CONTENT_BATCH", 3)
+    files = {f"d{i % 4}/note{i}.txt": (b"mentions OMEGA here" if i % 3 == 0 else b"nothing") for i in range(40)}
+    files["d0/crown.bin"] = b"matched by name"
+    target = make_tree(tmp_path / "t", files)
+
+    results = []
+    for processes in (1, 3):
+        out = tmp_path / f"out{processes}"
+        run_extract(target, out, keywords=("omega", "crown"), content_search=True, content_processes=processes)
+        results.append({rel: (r.get("matched_by"), r["matched_keywords"]) for rel, r in manifest_files(out).items()})
+
+    assert results[0] == results[1]
+    assert len(results[0]) == 15
+    assert results[0]["d0/note0.txt"] == ("content", ["omega"])
+
+
+def test_manifest_lines_parse_independently(tmp_path):
+    """Test that every manifest line, written from many threads, is a complete JSON record."""
+    path = tmp_path / "EXTRACTION_MANIFEST.jsonl"
+    writer = eks.ManifestWriter(path, {"source": "src", "keywords": ["Ω"]})
+    threads = [threading.Thread(target=lambda t=t: [writer.write("file", {"source_path": f"{t}/{i}\n\u03a9"})
+                                                    for i in range(50)]) for t in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    writer.close({"total_files": 200})
+
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [r["type"] for r in records] == ["header"] + ["file"] * 200 + ["summary"]
+    assert len({r["source_path"] for r in records[1:-1]}) == 200
+
+    # a crash mid-line leaves the complete records readable
+    with path.open("a", encoding="utf-8") as f:
+        f.write('{"type": "file", "source_')
+    assert len(list(eks.read_manifest(path))) == 202
+    assert eks.summarize_manifest(path)["complete"] is True
+
+
+def test_manifest_of_run(tmp_path):
+    """Test the manifest of a streamed run line by line and its summary."""
+    target = make_tree(tmp_path / "t", {"omega.txt": b"1", "sub/omega.md": b"1", "crown.txt": b"22"})
+    out = tmp_path / "out"
+    run_extract(target, out, keywords=("omega", "crown"))
+
+    lines = (out / "EXTRACTION_MANIFEST.jsonl").read_text(encoding="utf-8").splitlines()
+    records = [json.loads(line) for line in lines]
+    assert records[0]["type"] == "header" and records[-1]["type"] == "summary"
+    assert sorted(r["relative_path"] for r in records if r["type"] == "file") == ["crown.txt", "omega.txt", "sub/omega.md"]
+    totals = eks.summarize_manifest(out / "EXTRACTION_MANIFEST.jsonl")
+    assert (totals["files"], totals["bytes"], totals["duplicates"], totals["complete"]) == (3, 4, 1, True)
+    assert totals["interrupted"] is False
+
+
+def interrupt_after(monkeypatch, count):
+    iter_files = eks.iter_files
+
+    def interrupted(*args, **kwargs):
+        for n, item in enumerate(iter_files(*args, **kwargs)):
+            if n == count:
+                raise KeyboardInterrupt
+            yield item
+
+    monkeypatch.setattr(eks, "iter_files", interrupted)
+    return iter_files
+
+
+def test_resume_after_interrupt(tmp_path, monkeypatch):
+    """Test that an interrupted staging run resumed with resume=True archives the same files as one run."""
+    files = {f"d{i % 5}/omega{i}.txt": f"content {i % 7}".encode() for i in range(30)}
+    target = make_tree(tmp_path / "t", files)
+    full = run_extract(target, tmp_path / "full", use_staging=True)
+
+    out = tmp_path / "out"
+    iter_files = interrupt_after(monkeypatch, 12)
+    run_extract(target, out, use_staging=True)
+    assert (out / eks.JOURNAL_NAME).exists()
+    totals = eks.summarize_manifest(out / "staging" / "EXTRACTION_MANIFEST.jsonl")
+    assert totals["files"] < 30
+    assert (totals["complete"], totals["interrupted"]) == (False, True)
+    assert json.loads((out / "EXTRACTION_SUMMARY.json").read_text())["interrupted"] is True
+
+    monkeypatch.setattr(eks, "iter_files", iter_files)
+    resumed = run_extract(target, out, resume=True)
+
+    assert not (out / eks.JOURNAL_NAME).exists()
+    assert set(manifest_files(out, staged=True)) == set(manifest_files(tmp_path / "full", staged=True)) == set(files)
+    expected = read_members(full)
+    members = read_members(resumed)
+    assert set(members) == set(expected)
+    # duplicates are hard links, possibly to a different first copy than in the full run
+    content = {name: members[value] if isinstance(value, str) else value for name, value in members.items()}
+    assert all(content[name] == data for name, data in files.items())
+
+
+@pytest.mark.parametrize("use_staging", [False, True])
+def test_output_inside_target_is_not_archived(tmp_path, monkeypatch, use_staging):
+    """Test that a default-style export under the scanned tree skips its own archive, manifest and staging."""
+    monkeypatch.setattr(eks, "user_confirm", lambda prompt: True)
+    target = make_tree(tmp_path / "home", {"omega.txt": b"1", "docs/k-systems-notes.md": b"2"})
+    out = target / "k-systems-export"
+
+    first = run_extract(target, out, keywords=("omega", "k-systems"), use_staging=use_staging)
+    second = run_extract(target, out, keywords=("omega", "k-systems"), use_staging=use_staging)
+
+    for archive in (first, second):
+        files = {name for name in read_members(archive) if not name.startswith(("EXTRACTION_", "CROWN_SEAL"))}
+        assert files == {"omega.txt", "docs/k-systems-notes.md"}
+
+
+def test_output_equal_to_target_is_refused(tmp_path):
+    """Test that exporting into the scanned folder itself is refused."""
+    target = make_tree(tmp_path / "t", {"omega.txt": b"1"})
+    with pytest.raises(SystemExit):
+        run_extract(target, target)
+
+
+def test_incremental_keeps_unmatched_existing_files(tmp_path):
+    """Test that only files gone from disk are reported deleted and dropped from the index."""
+    target = make_tree(tmp_path / "t", {"omega_a.txt": b"a", "omega_big.txt": b"b" * 100})
+    out = tmp_path / "out"
+    run_extract(target, out, use_index=True)
+
+    (target / "omega_a.txt").unlink()
+    eks.extract(target, out, ["omega"], [], set(), 10, incremental=True, workers=2)
+    records = list(eks.read_manifest(out / "EXTRACTION_MANIFEST.jsonl"))
+    assert [r["source_path"] for r in records if r["type"] == "deleted"] == [str(target / "omega_a.txt")]
+
+    # the big file was skipped by the size limit, not deleted: still indexed and unchanged
+    delta = run_extract(target, out, incremental=True)
+    assert "omega_big.txt" not in read_members(delta)
+    assert eks.summarize_manifest(out / "EXTRACTION_MANIFEST.jsonl")["deleted"] == 0
+
+
+def test_incremental_refuses_other_keywords(tmp_path):
+    """Test that an incremental run against an index built with other keywords is refused."""
+    target = make_tree(tmp_path / "t", {"omega.txt": b"1", "crown.txt": b"2"})
+    out = tmp_path / "out"
+    run_extract(target, out, keywords=("omega",), use_index=True)
+
+    run_extract(target, out, keywords=("OMEGA", "omega"), incremental=True)
+    with pytest.raises(SystemExit):
+        run_extract(target, out, keywords=("omega", "crown"), incremental=True)
+
+
+def test_search_content_matches_naive_search(tmp_path, monkeypatch):
+    """Test chunked content search against substring search on the whole decoded file."""
+    keywords = ["omega", "ΩCOIN", "k-sys", "k-sys-gums", "crown"]
+    eks._init_content_search(keywords)
+    rng = random.Random(1)
+    alphabet = "omegaΩCOINk-sysgumcrwn ωé"
+    for n in range(100):
+        monkeypatch.setattr(eks, "CONTENT_CHUNK", rng.choice([1, 2, 3, 7, 64]))
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randrange(60)))
+        path = tmp_path / f"{n}.txt"
+        path.write_text(text, encoding="utf-8")
+        expected = [i for i, kw in enumerate(keywords) if kw.lower() in text.lower()]
+        assert eks.search_content(path, path.stat().st_size) == expected, text
+
+
+def test_content_search_keeps_priority_extensions(tmp_path):
+    """Test that unsearchable priority extensions still match by extension with content search on."""
+    target = make_tree(tmp_path / "t", {"report.pdf": b"%PDF", "notes.txt": b"nothing", "hit.md": b"omega"})
+    out = tmp_path / "out"
+    eks.extract(target, out, ["omega"], [".pdf", ".txt"], set(), None, content_search=True, content_processes=1)
+
+    assert {rel: r.get("matched_by") for rel, r in manifest_files(out).items()} == {"report.pdf": None, "hit.md": "content"}
+
+
+@pytest.mark.parametrize("changed", [
+    {"incremental": True}, {"use_index": True}, {"compression": "xz"}, {"max_file_size": 10},
+])
+def test_resume_refuses_other_settings(tmp_path, monkeypatch, capsys, changed):
+    """Test that resuming with settings other than the journaled run's is refused."""
+    target = make_tree(tmp_path / "t", {f"omega{i}.txt": b"x" * i for i in range(10)})
+    out = tmp_path / "out"
+    iter_files = interrupt_after(monkeypatch, 4)
+    run_extract(target, out, use_staging=True)
+    monkeypatch.setattr(eks, "iter_files", iter_files)
+
+    options = {"max_file_size": None, **changed}
+    with pytest.raises(SystemExit):
+        eks.extract(target, out, ["omega"], [], set(), options.pop("max_file_size"), resume=True, **options)
+    assert "[!] Cannot resume: journal was written with a different" in capsys.readouterr().out
+    assert (out / eks.JOURNAL_NAME).exists()
+
+
+def test_streamed_interrupt_explains_resume(tmp_path, monkeypatch, capsys):
+    """Test that interrupting a streamed run says it cannot be resumed."""
+    target = make_tree(tmp_path / "t", {f"omega{i}.txt": b"x" for i in range(5)})
+    interrupt_after(monkeypatch, 2)
+    run_extract(target, tmp_path / "out")
+
+    assert "Run again with --staging" in capsys.readouterr().out
+    assert not (tmp_path / "out" / eks.JOURNAL_NAME).exists()